@@ -3,7 +3,7 @@ of foreign exchange tickers. Aims to find relevant relationships between arbitra
 exchange tickers."""
 
 from src.tools.constants import PriceAttribute
-from src.tools.correlation_analysis import correlation_analysis_lists_cardinal_product
+from src.tools.correlation_analysis import correlation_analysis_lists_cardinal_product_columns
 
 if __name__ == "__main__":
 
@@ -53,15 +53,17 @@ if __name__ == "__main__":
         (PriceAttribute.LOW, PriceAttribute.CLOSE, 0.8),
     ]
 
+    # Fetch the historical data once, and analyse all the pairs of attributes together
+    correlations_columns = correlation_analysis_lists_cardinal_product_columns(
+        list_ticker1=commodity_list,
+        list_ticker2=forex_list,
+        columns=[(column_commodity, column_forex) for column_commodity, column_forex, _ in columns],
+    )
+
     for column_commodity, column_forex, correlation_threshold in columns:
         print(f"\n{column_commodity.value} -> {column_forex.value}\n")
 
-        correlations = correlation_analysis_lists_cardinal_product(
-            list_ticker1=commodity_list,
-            list_ticker2=forex_list,
-            column_ticker1=column_commodity,
-            column_ticker2=column_forex,
-        )
+        correlations = correlations_columns[(column_commodity, column_forex)]
 
         # Print correlation coefficients sorted from most correlated to least, if correlation > correlation_threshold
         for combination, correlation in {
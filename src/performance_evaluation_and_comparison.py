@@ -3,27 +3,273 @@ ticker(s), and a choice of Machine Learning model. The method uses Monte-Carlo C
 performance of hourly predictions for both approaches. Then, for both the 'individual' and the 'sector' approach,
 hypothesis testing is conducted on the results aggregated from these samples."""
 
+import os
 import time
 from datetime import timedelta
 from functools import reduce
 from operator import add
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
-from numpy import mean, std
+from joblib import Parallel, delayed
+from numpy import integer, mean, ndarray, std, subtract
+from numpy.random import Generator, default_rng
+from pandas import DataFrame
+from sklearn.base import clone
 from sklearn.dummy import DummyRegressor
 from sklearn.metrics import mean_absolute_error
 
-from src.tools.constants import PriceAttribute
-from src.tools.hypothesis_testing import lilliefors_test, one_sample_t_test, two_sample_t_test
-from src.tools.labeled_data_builder.monte_carlo_cross_validation import generate_train_test_sample
-from src.tools.labeled_data_builder.time_series_forecasting import create_labeled_data
-from src.tools.statistical_evaluation import ClassificationEvaluation
-from src.tools.yfinance_data_provider import YfinanceDataProvider
+from src.tools.bootstrap import bootstrap_confidence_interval, sequential_stopping_check
+from src.tools.constants import PriceAttribute, YfinanceInterval, YfinancePeriod
+from src.tools.data_provider import get_data_provider
+from src.tools.evaluation_results import EvaluationResult, ResultsStore, config_hash
+from src.tools.hypothesis_testing import (
+    lilliefors_test,
+    one_sample_t_test_batch,
+    permutation_test,
+    two_sample_t_test,
+    two_sample_t_test_batch,
+)
+from src.tools.labeled_data_builder.labeled_dataset import LabeledDataset
+from src.tools.labeled_data_builder.monte_carlo_cross_validation import generate_train_test_masks
+from src.tools.labeled_data_builder.time_series_forecasting import create_labeled_dataset
+from src.tools.statistical_evaluation import BatchClassificationEvaluation
+
+APPROACHES = ["individual", "sector"]
+
+
+def _model_description(model) -> Dict[str, Any]:
+    """Describe a scikit-learn model by its class and parameters, for the configuration of an evaluation.
+
+    Args:
+        model: Instance of a scikit-learn model.
+
+    Returns:
+        description (Dict[str, Any]): The class of the model and the representation of each of its parameters.
+
+    """
+    return {
+        "class": f"{type(model).__module__}.{type(model).__name__}",
+        "params": {name: repr(value) for name, value in sorted(model.get_params().items())},
+    }
+
+
+def _data_description(data_provider, data: DataFrame) -> Dict[str, Any]:
+    """Describe the data of an evaluation by its provider and its time range, for the configuration of an evaluation:
+    the same parameters evaluated on other data (e.g. downloaded later, or replayed from another snapshot) are another
+    configuration.
+
+    Args:
+        data_provider: The data provider the data was retrieved from, a class or an instance.
+        data (DataFrame): The retrieved data.
+
+    Returns:
+        description (Dict[str, Any]): The provider, and the number of rows and the first and last timestamps of the
+            data.
+
+    """
+    provider_class = data_provider if isinstance(data_provider, type) else type(data_provider)
+    description = {"provider": f"{provider_class.__module__}.{provider_class.__name__}"}
+    if getattr(data_provider, "snapshot_dir", None) is not None:
+        description["snapshot_dir"] = os.path.abspath(data_provider.snapshot_dir)
+    description["nb_rows"] = len(data)
+    description["first_timestamp"] = str(data.index[0]) if len(data) else None
+    description["last_timestamp"] = str(data.index[-1]) if len(data) else None
+    return description
+
+
+def _test_outcome(rejected_null_hypothesis: bool, p_value: float) -> Dict[str, Any]:
+    return {"rejected_null_hypothesis": bool(rejected_null_hypothesis), "p_value": float(p_value)}
+
+
+def _print_samples(result: EvaluationResult) -> None:
+    """Print the metric of each sample of an evaluation, and the duration of the evaluation of the samples.
+
+    Args:
+        result (EvaluationResult): The result of the evaluation.
+
+    """
+    sequential_stopping = result.tests.get("sequential_stopping")
+    if sequential_stopping is not None and sequential_stopping["stopped_early"]:
+        print(
+            f"\nEarly stopping after {result.nb_samples} samples: "
+            f"{tuple(sequential_stopping['confidence_interval'])}"
+        )
+    for i in range(result.nb_samples):
+        print(f"\n{i}")
+        for name, values in result.samples.items():
+            print(f"{name}: {values[i]}")
+    print(f"\nDuration: {timedelta(seconds=result.timings['evaluation'])}")
+
+
+def _print_comparison(result: EvaluationResult, label: str) -> None:
+    """Print the outcome of the tests comparing the 'individual' and the 'sector' approaches.
+
+    Args:
+        result (EvaluationResult): The result of the evaluation.
+        label (str): The name of the metric in the printed text.
+
+    """
+    comparison = result.tests["individual_vs_sector"]
+    print(
+        f"\nTwo-sample T-test between Individual and Sector approaches: "
+        f"{tuple(comparison['two_sample_t_test'].values())}"
+    )
+    print(
+        f"Paired permutation test between Individual and Sector approaches: "
+        f"{tuple(comparison['permutation_test'].values())}"
+    )
+    print(
+        f"95% bootstrap confidence interval (mean {label} difference, Individual - Sector): "
+        f"{tuple(comparison['bootstrap_confidence_interval'])}"
+    )
+
+
+def _print_classification_result(result: EvaluationResult) -> None:
+    """Print the result of a Classification evaluation.
+
+    Args:
+        result (EvaluationResult): The result of the evaluation.
+
+    """
+    _print_samples(result=result)
+    for approach in APPROACHES:
+        accuracies = result.samples[approach]
+        tests = result.tests[approach]
+        print(f"\n{approach.capitalize()} approach")
+        print(f"Mean accuracy: {reduce(add, accuracies) / len(accuracies)}")
+        print(f"Standard deviation (accuracy): {std(accuracies)}")
+        print(f"95% bootstrap confidence interval (mean accuracy): {tuple(tests['bootstrap_confidence_interval'])}")
+        print(f"Lilliefors test: {tuple(tests['lilliefors_test'].values())}")
+        print(f"One-sample T-test against random guessing: {tuple(tests['one_sample_t_test'].values())}")
+    _print_comparison(result=result, label="accuracy")
+
+
+def _print_regression_result(result: EvaluationResult) -> None:
+    """Print the result of a Regression evaluation.
+
+    Args:
+        result (EvaluationResult): The result of the evaluation.
+
+    """
+    _print_samples(result=result)
+    print(f"\nBaseline mean MAE: {mean(result.samples['baseline'])}")
+    for approach in APPROACHES:
+        errors = result.samples[approach]
+        tests = result.tests[approach]
+        print(f"\n{approach.capitalize()} approach")
+        print(f"Mean MAE: {reduce(add, errors) / len(errors)}")
+        print(f"Standard deviation (MAE): {std(errors)}")
+        print(f"95% bootstrap confidence interval (mean MAE): {tuple(tests['bootstrap_confidence_interval'])}")
+        print(f"Lilliefors test: {tuple(tests['lilliefors_test'].values())}")
+        print(f"Two-sample T-test against Baseline: {tuple(tests['two_sample_t_test_baseline'].values())}")
+    _print_comparison(result=result, label="MAE")
+
+
+def _comparison_tests(samples_1: List[float], samples_2: List[float], n_jobs: int, rng: Generator) -> Dict[str, Any]:
+    """Test the difference between the metric of the 'individual' and the 'sector' approaches, evaluated on the same
+    samples: two-sample T-test, paired permutation test (which does not assume normality) and bootstrap confidence
+    interval for the mean difference.
+
+    Args:
+        samples_1 (List[float]): The metric of each sample for the 'individual' approach.
+        samples_2 (List[float]): The metric of each sample for the 'sector' approach.
+        n_jobs (int): The number of worker processes computing the bootstrap confidence interval.
+        rng (Generator): The random generator of the evaluation.
+
+    Returns:
+        comparison (Dict[str, Any]): The outcome of each test.
+
+    """
+    return {
+        "two_sample_t_test": _test_outcome(*two_sample_t_test(sample_1=samples_1, sample_2=samples_2)),
+        "permutation_test": _test_outcome(
+            *permutation_test(sample_1=samples_1, sample_2=samples_2, paired=True, random_state=rng)
+        ),
+        "bootstrap_confidence_interval": list(
+            bootstrap_confidence_interval(sample=subtract(samples_1, samples_2), n_jobs=n_jobs, random_state=rng)
+        ),
+    }
+
+
+def _sample_blocks(nb_samples: int, check_every: Optional[int]) -> List[slice]:
+    """Split the Monte-Carlo samples into the blocks evaluated between two interim checks of sequential early stopping.
+
+    Args:
+        nb_samples (int): The maximum number of samples.
+        check_every (Optional[int]): The number of samples evaluated between two checks, None to evaluate all the
+            samples in a single block, without early stopping.
+
+    Returns:
+        blocks (List[slice]): The positions of the samples in each block.
+
+    """
+    if check_every is None:
+        return [slice(0, nb_samples)]
+    # The Lilliefors test run on the evaluated samples requires at least 4 observations
+    if not isinstance(check_every, int) or check_every < 4:
+        raise ValueError("Parameter 'check_every' must be an integer greater than or equal to 4.")
+    return [slice(start, start + check_every) for start in range(0, nb_samples, check_every)]
+
+
+def _classification_sample_predictions(
+    model, labeled_dataset: LabeledDataset, test_mask: ndarray
+) -> Dict[str, ndarray]:
+    """Fit a Classification model and predict the test subset of one Monte-Carlo sample, for both the 'individual'
+    and the 'sector' approach. Runs in a worker process when the samples are evaluated in parallel.
+
+    Args:
+        model: Instance of a scikit-learn Classification model, fitted in place (pass a clone).
+        labeled_dataset (LabeledDataset): The labeled data to sample from.
+        test_mask (ndarray): Boolean mask of the rows in the test subset of the sample, the others are used to train.
+
+    Returns:
+        predictions (Dict[str, ndarray]): The predictions of each approach for the test subset, in row order.
+
+    """
+    train_data, test_data = labeled_dataset.take(~test_mask), labeled_dataset.take(test_mask)
+    predictions = {}
+    for approach in APPROACHES:
+        model.fit(train_data.features(approach), train_data.label_classification)
+        predictions[approach] = model.predict(test_data.features(approach))
+    return predictions
+
+
+def _regression_sample_error(model, labeled_dataset: LabeledDataset, test_mask: ndarray, approach: str) -> float:
+    """Fit and evaluate a Regression model on one Monte-Carlo sample, for one approach. Runs in a worker process when
+    the samples are evaluated in parallel.
+
+    Args:
+        model: Instance of a scikit-learn Regression model, fitted in place (pass a clone).
+        labeled_dataset (LabeledDataset): The labeled data to sample from.
+        test_mask (ndarray): Boolean mask of the rows in the test subset of the sample, the others are used to train.
+        approach (str): The approach to use the features of, 'individual' or 'sector'.
+
+    Returns:
+        error (float): The Mean-Absolute-Error of the model on the test subset.
+
+    """
+    train_data, test_data = labeled_dataset.take(~test_mask), labeled_dataset.take(test_mask)
+    model.fit(train_data.features(approach), train_data.label_regression)
+    predictions = model.predict(test_data.features(approach))
+    return mean_absolute_error(y_true=test_data.label_regression, y_pred=predictions)
 
 
 def evaluate_and_compare_classification(
-    forex_ticker: str, comdty_tickers: List[str], model, use_close_high_low: bool = False, nb_samples: int = 100
-) -> None:
+    forex_ticker: str,
+    comdty_tickers: List[str],
+    model,
+    use_close_high_low: bool = False,
+    nb_samples: int = 100,
+    random_state: Union[None, int, Generator] = None,
+    n_jobs: int = 1,
+    interval: YfinanceInterval = YfinanceInterval.ONE_HOUR,
+    period: YfinancePeriod = YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
+    session_aware: bool = False,
+    check_every: Optional[int] = None,
+    target_width: Optional[float] = None,
+    verbose: bool = True,
+    results_store: Optional[ResultsStore] = None,
+) -> EvaluationResult:
     """Compare the performance of individual and sector approach for a pair of forex ticker and commodities
     ticker(s), and a choice of Classification model. The method uses Monte-Carlo Cross-Validation to estimate the
     accuracy of predicting (discrete) hourly returns for both approaches. Then, for both the 'individual' and the
@@ -43,62 +289,145 @@ def evaluate_and_compare_classification(
         use_close_high_low (bool): Whether to use hourly changes from the 'High' and 'Low' columns into the features, in
             addition to the 'Close' data.
         nb_samples (int): The number of samples to generate from the labeled data, using Monte-Carlo Cross-Validation.
+        random_state (Union[None, int, Generator]): Seed or random generator for the under-sampling and the samples,
+            for reproducible results.
+        n_jobs (int): The number of worker processes evaluating the samples in parallel (-1 to use all CPUs). Each
+            sample is evaluated on its own clone of the model, and the labeled arrays are memory-mapped, not copied.
+        interval (YfinanceInterval): The interval of the time series, the model predicts the change of the next one.
+        period (YfinancePeriod): The period of the time series (Yahoo Finance limits it for intraday intervals).
+        session_aware (bool): Whether features may span the gap between two consecutive trading dates.
+        check_every (Optional[int]): Sequential early stopping: the samples are evaluated in blocks of check_every
+            (at least 4), and sampling stops before nb_samples once the difference between the approaches is
+            conclusive (see sequential_stopping_check()). None to always evaluate nb_samples samples. The final tests
+            are run at the nominal 95% confidence on the samples evaluated until the stop, which was itself decided
+            from these samples: after an early stop, their p-values are optimistic, only the Bonferroni-adjusted
+            interval of the looks ('sequential_stopping' test) keeps its confidence level.
+        target_width (Optional[float]): With early stopping, also stop once the confidence interval for the mean
+            difference between the approaches is narrower than this width.
+        verbose (bool): Whether to print the metric of each sample and the outcome of the tests.
+        results_store (Optional[ResultsStore]): Store to append the result to. If random_state is an integer seed
+            and a run with the same configuration on the same data (provider and time range, checked once the data is
+            retrieved) is already stored, its result is returned instead of running again.
+
+    Returns:
+        result (EvaluationResult): The configuration, the metric of each sample, the timings and the tests outcomes.
 
     """
 
     features_length = 5
+    config = {
+        "task": "classification",
+        "forex_ticker": forex_ticker,
+        "comdty_tickers": list(comdty_tickers),
+        "model": _model_description(model=model),
+        "use_close_high_low": use_close_high_low,
+        "nb_samples": nb_samples,
+        "random_state": int(random_state) if isinstance(random_state, (int, integer)) else None,
+        "interval": getattr(interval, "value", interval),
+        "period": getattr(period, "value", period),
+        "session_aware": session_aware,
+        "check_every": check_every,
+        "target_width": target_width,
+        "features_length": features_length,
+    }
     attributes = (
         [PriceAttribute.CLOSE, PriceAttribute.HIGH, PriceAttribute.LOW]
         if use_close_high_low
         else [PriceAttribute.CLOSE]
     )
-    data = YfinanceDataProvider.get_hourly_changes(attributes=attributes, tickers=comdty_tickers + [forex_ticker])
-    labeled_data = create_labeled_data(
+    timings = {}
+    start_time = time.time()
+    rng = default_rng(random_state)
+    data_provider = get_data_provider()
+    data = data_provider.get_changes(
+        attributes=attributes, tickers=comdty_tickers + [forex_ticker], period=period, interval=interval
+    )
+    timings["data"] = time.time() - start_time
+
+    config["data"] = _data_description(data_provider=data_provider, data=data)
+    # Only seeded runs on the same data are reproducible, they can be loaded from the store instead of running again
+    if results_store is not None and config["random_state"] is not None:
+        stored_result = results_store.load(config_hash=config_hash(config))
+        if stored_result is not None:
+            if verbose:
+                print(f"Results loaded from the store (configuration {stored_result.config_hash}).")
+                _print_classification_result(result=stored_result)
+            return stored_result
+
+    start_time = time.time()
+    labeled_dataset = create_labeled_dataset(
         attribute_label=PriceAttribute.CLOSE,
         ticker_label=forex_ticker,
         tickers_features=comdty_tickers + [forex_ticker],
         data=data,
         features_length=features_length,
+        random_state=rng,
+        interval=interval,
+        session_aware=session_aware,
+    )
+    test_masks = generate_train_test_masks(
+        nb_rows=len(labeled_dataset), nb_samples=nb_samples, train_percentage=0.8, random_state=rng
     )
+    timings["labeling"] = time.time() - start_time
 
     start_time = time.time()
     accuracies = {"individual": [], "sector": []}
-    for i in range(nb_samples):
-        print(f"\n{i}")
-        train_data, test_data = generate_train_test_sample(data=labeled_data, train_percentage=0.8)
-        for approach in ["individual", "sector"]:
-            model.fit(list(train_data[f"features_{approach}"].values), list(train_data["label_classification"].values))
-            predictions = model.predict(list(test_data[f"features_{approach}"].values))
-            classification_evaluation = ClassificationEvaluation(
-                y_true=list(test_data["label_classification"].values), y_predicted=list(predictions)
+    tests = {}
+    blocks = _sample_blocks(nb_samples=nb_samples, check_every=check_every)
+    with Parallel(n_jobs=n_jobs) as parallel:
+        for block in blocks:
+            block_masks = test_masks[block]
+            samples_predictions = parallel(
+                delayed(_classification_sample_predictions)(clone(model), labeled_dataset, test_mask)
+                for test_mask in block_masks
             )
-            accuracies[approach].append(classification_evaluation.accuracy)
-            print(f"{approach}: {classification_evaluation.accuracy}")
-    end_time = time.time()
-    print(f"\nDuration: {timedelta(seconds=end_time - start_time)}")
-
-    print("\nIndividual approach")
-    print(f"Mean accuracy: {reduce(add, accuracies['individual']) / len(accuracies['individual'])}")
-    print(f"Standard deviation (accuracy): {std(accuracies['individual'])}")
-    print(f"Lilliefors test: {lilliefors_test(data=accuracies['individual'])}")
-    print(
-        f"One-sample T-test against random guessing: "
-        f"{one_sample_t_test(sample=accuracies['individual'], population_mean=0.5, confidence_level=0.95)}"
-    )
+            # All test subsets have the same size: the true labels of the block form one (block_size, test_size) matrix
+            y_true = labeled_dataset.label_classification[block_masks.nonzero()[1]].reshape(len(block_masks), -1)
+            for approach in APPROACHES:
+                batch_evaluation = BatchClassificationEvaluation(
+                    y_true=y_true, y_predicted=[predictions[approach] for predictions in samples_predictions]
+                )
+                accuracies[approach].extend(batch_evaluation.accuracy.tolist())
+            if block.stop < nb_samples:
+                stop, confidence_interval = sequential_stopping_check(
+                    differences=subtract(accuracies["individual"], accuracies["sector"]),
+                    nb_looks=len(blocks),
+                    confidence_level=0.95,
+                    target_width=target_width,
+                    random_state=rng,
+                )
+                tests["sequential_stopping"] = {"stopped_early": stop, "confidence_interval": list(confidence_interval)}
+                if stop:
+                    break
+    timings["evaluation"] = time.time() - start_time
 
-    print("\nSector approach")
-    print(f"Mean accuracy: {reduce(add, accuracies['sector']) / len(accuracies['sector'])}")
-    print(f"Standard deviation (accuracy): {std(accuracies['sector'])}")
-    print(f"Lilliefors test: {lilliefors_test(data=accuracies['sector'])}")
-    print(
-        f"One-sample T-test against random guessing: "
-        f"{one_sample_t_test(sample=accuracies['sector'], population_mean=0.5, confidence_level=0.95)}"
+    start_time = time.time()
+    # Both approaches are tested against random guessing in a single batched call
+    rejected_null_hypothesis, p_values = one_sample_t_test_batch(
+        samples=[accuracies[approach] for approach in APPROACHES], population_mean=0.5, confidence_level=0.95
     )
+    for i, approach in enumerate(APPROACHES):
+        normal_distribution, p_value = lilliefors_test(data=accuracies[approach])
+        tests[approach] = {
+            "bootstrap_confidence_interval": list(
+                bootstrap_confidence_interval(sample=accuracies[approach], n_jobs=n_jobs, random_state=rng)
+            ),
+            "lilliefors_test": {"normal_distribution": bool(normal_distribution), "p_value": float(p_value)},
+            "one_sample_t_test": _test_outcome(rejected_null_hypothesis[i], p_values[i]),
+        }
+    tests["individual_vs_sector"] = _comparison_tests(
+        samples_1=accuracies["individual"], samples_2=accuracies["sector"], n_jobs=n_jobs, rng=rng
+    )
+    timings["tests"] = time.time() - start_time
 
-    two_sample_t_test_results = two_sample_t_test(
-        sample_1=accuracies["individual"], sample_2=accuracies["sector"], confidence_level=0.95
+    result = EvaluationResult(
+        task="classification", config=config, metric="accuracy", samples=accuracies, timings=timings, tests=tests
     )
-    print(f"\nTwo-sample T-test between Individual and Sector approaches: {two_sample_t_test_results}")
+    if results_store is not None:
+        results_store.append(result=result)
+    if verbose:
+        _print_classification_result(result=result)
+    return result
 
 
 def evaluate_and_compare_regression(
@@ -108,7 +437,16 @@ def evaluate_and_compare_regression(
     model,
     use_close_high_low: bool = False,
     nb_samples: int = 100,
-) -> None:
+    random_state: Union[None, int, Generator] = None,
+    n_jobs: int = 1,
+    interval: YfinanceInterval = YfinanceInterval.ONE_HOUR,
+    period: YfinancePeriod = YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
+    session_aware: bool = False,
+    check_every: Optional[int] = None,
+    target_width: Optional[float] = None,
+    verbose: bool = True,
+    results_store: Optional[ResultsStore] = None,
+) -> EvaluationResult:
     """Compare the performance of individual and sector approach for a pair of forex ticker and commodities
     ticker(s), and a choice of Regression model, for a selected price attribute ('Close', 'High', 'Low'). The method
     uses Monte-Carlo Cross-Validation to estimate the Mean-Absolute-Error of predicting (continous) hourly changes of
@@ -127,59 +465,146 @@ def evaluate_and_compare_regression(
         use_close_high_low (bool): Whether to use hourly changes from all 'Close', 'High' and 'Low' columns into the
             features, instead of the only predicted attribute.
         nb_samples (int): The number of samples to generate from the labeled data, using Monte-Carlo Cross-Validation.
+        random_state (Union[None, int, Generator]): Seed or random generator for the under-sampling and the samples,
+            for reproducible results.
+        n_jobs (int): The number of worker processes running the fits in parallel (-1 to use all CPUs). The
+            'individual', 'sector' and baseline fits of each sample are independent tasks, each on its own clone of
+            the model, and the labeled arrays are memory-mapped, not copied.
+        interval (YfinanceInterval): The interval of the time series, the model predicts the change of the next one.
+        period (YfinancePeriod): The period of the time series (Yahoo Finance limits it for intraday intervals).
+        session_aware (bool): Whether features may span the gap between two consecutive trading dates.
+        check_every (Optional[int]): Sequential early stopping: the samples are evaluated in blocks of check_every
+            (at least 4), and sampling stops before nb_samples once the difference between the approaches is
+            conclusive (see sequential_stopping_check()). None to always evaluate nb_samples samples. The final tests
+            are run at the nominal 95% confidence on the samples evaluated until the stop, which was itself decided
+            from these samples: after an early stop, their p-values are optimistic, only the Bonferroni-adjusted
+            interval of the looks ('sequential_stopping' test) keeps its confidence level.
+        target_width (Optional[float]): With early stopping, also stop once the confidence interval for the mean
+            difference between the approaches is narrower than this width.
+        verbose (bool): Whether to print the metric of each sample and the outcome of the tests.
+        results_store (Optional[ResultsStore]): Store to append the result to. If random_state is an integer seed
+            and a run with the same configuration on the same data (provider and time range, checked once the data is
+            retrieved) is already stored, its result is returned instead of running again.
+
+    Returns:
+        result (EvaluationResult): The configuration, the metric of each sample, the timings and the tests outcomes.
 
     """
 
     features_length = 5
+    config = {
+        "task": "regression",
+        "attribute": attribute.value,
+        "forex_ticker": forex_ticker,
+        "comdty_tickers": list(comdty_tickers),
+        "model": _model_description(model=model),
+        "use_close_high_low": use_close_high_low,
+        "nb_samples": nb_samples,
+        "random_state": int(random_state) if isinstance(random_state, (int, integer)) else None,
+        "interval": getattr(interval, "value", interval),
+        "period": getattr(period, "value", period),
+        "session_aware": session_aware,
+        "check_every": check_every,
+        "target_width": target_width,
+        "features_length": features_length,
+    }
     attributes = [PriceAttribute.CLOSE, PriceAttribute.HIGH, PriceAttribute.LOW] if use_close_high_low else [attribute]
-    data = YfinanceDataProvider.get_hourly_changes(attributes=attributes, tickers=comdty_tickers + [forex_ticker])
-    labeled_data = create_labeled_data(
+    timings = {}
+    start_time = time.time()
+    rng = default_rng(random_state)
+    data_provider = get_data_provider()
+    data = data_provider.get_changes(
+        attributes=attributes, tickers=comdty_tickers + [forex_ticker], period=period, interval=interval
+    )
+    timings["data"] = time.time() - start_time
+
+    config["data"] = _data_description(data_provider=data_provider, data=data)
+    # Only seeded runs on the same data are reproducible, they can be loaded from the store instead of running again
+    if results_store is not None and config["random_state"] is not None:
+        stored_result = results_store.load(config_hash=config_hash(config))
+        if stored_result is not None:
+            if verbose:
+                print(f"Results loaded from the store (configuration {stored_result.config_hash}).")
+                _print_regression_result(result=stored_result)
+            return stored_result
+
+    start_time = time.time()
+    labeled_dataset = create_labeled_dataset(
         attribute_label=attribute,
         ticker_label=forex_ticker,
         tickers_features=comdty_tickers + [forex_ticker],
         data=data,
         features_length=features_length,
+        random_state=rng,
+        interval=interval,
+        session_aware=session_aware,
     )
+    test_masks = generate_train_test_masks(
+        nb_rows=len(labeled_dataset), nb_samples=nb_samples, train_percentage=0.8, random_state=rng
+    )
+    timings["labeling"] = time.time() - start_time
 
     start_time = time.time()
     baseline_model = DummyRegressor(strategy="mean")
-    errors = {"individual": [], "sector": [], "baseline": []}
-    for i in range(nb_samples):
-        print(f"\n{i}")
-        train_data, test_data = generate_train_test_sample(data=labeled_data, train_percentage=0.8)
-        for approach in ["individual", "sector"]:
-            model.fit(list(train_data[f"features_{approach}"].values), list(train_data["label_regression"].values))
-            predictions = model.predict(list(test_data[f"features_{approach}"].values))
-            errors[approach].append(mean_absolute_error(y_true=list(test_data["label_regression"]), y_pred=predictions))
-            print(f"{approach}: {errors[approach][-1]}")
-        baseline_model.fit(list(train_data["features_individual"].values), list(train_data["label_regression"].values))
-        predictions = baseline_model.predict(list(test_data["features_individual"].values))
-        errors["baseline"].append(mean_absolute_error(y_true=list(test_data["label_regression"]), y_pred=predictions))
-        print(f"baseline: {errors['baseline'][-1]}")
-    end_time = time.time()
-    print(f"\nDuration: {timedelta(seconds=end_time - start_time)}")
-
-    print(f"\nBaseline mean MAE: {mean(errors['baseline'])}")
-
-    print("\nIndividual approach")
-    print(f"Mean MAE: {reduce(add, errors['individual']) / len(errors['individual'])}")
-    print(f"Standard deviation (MAE): {std(errors['individual'])}")
-    print(f"Lilliefors test: {lilliefors_test(data=errors['individual'])}")
-    two_sample_t_test_individual_baseline = two_sample_t_test(
-        sample_1=errors["individual"], sample_2=errors["baseline"], confidence_level=0.95
-    )
-    print(f"Two-sample T-test against Baseline: {two_sample_t_test_individual_baseline}")
-
-    print("\nSector approach")
-    print(f"Mean MAE: {reduce(add, errors['sector']) / len(errors['sector'])}")
-    print(f"Standard deviation (MAE): {std(errors['sector'])}")
-    print(f"Lilliefors test: {lilliefors_test(data=errors['sector'])}")
-    two_sample_t_test_sector_baseline = two_sample_t_test(
-        sample_1=errors["sector"], sample_2=errors["baseline"], confidence_level=0.95
-    )
-    print(f"Two-sample T-test against Baseline: {two_sample_t_test_sector_baseline}")
-
-    two_sample_t_test_results = two_sample_t_test(
-        sample_1=errors["individual"], sample_2=errors["sector"], confidence_level=0.95
-    )
-    print(f"\nTwo-sample T-test between Individual and Sector approaches: {two_sample_t_test_results}")
+    # The baseline ignores the features, it is fitted with the 'individual' ones
+    tasks = {
+        "individual": (model, "individual"),
+        "sector": (model, "sector"),
+        "baseline": (baseline_model, "individual"),
+    }
+    errors = {name: [] for name in tasks}
+    tests = {}
+    blocks = _sample_blocks(nb_samples=nb_samples, check_every=check_every)
+    with Parallel(n_jobs=n_jobs) as parallel:
+        for block in blocks:
+            block_masks = test_masks[block]
+            samples_errors = parallel(
+                delayed(_regression_sample_error)(clone(task_model), labeled_dataset, test_mask, task_approach)
+                for test_mask in block_masks
+                for task_model, task_approach in tasks.values()
+            )
+            for i in range(len(block_masks)):
+                for j, name in enumerate(tasks):
+                    errors[name].append(samples_errors[i * len(tasks) + j])
+            if block.stop < nb_samples:
+                stop, confidence_interval = sequential_stopping_check(
+                    differences=subtract(errors["individual"], errors["sector"]),
+                    nb_looks=len(blocks),
+                    confidence_level=0.95,
+                    target_width=target_width,
+                    random_state=rng,
+                )
+                tests["sequential_stopping"] = {"stopped_early": stop, "confidence_interval": list(confidence_interval)}
+                if stop:
+                    break
+    timings["evaluation"] = time.time() - start_time
+
+    start_time = time.time()
+    # Both approaches are tested against the baseline in a single batched call
+    rejected_null_hypothesis, p_values = two_sample_t_test_batch(
+        samples_1=[errors[approach] for approach in APPROACHES],
+        samples_2=[errors["baseline"]] * len(APPROACHES),
+        confidence_level=0.95,
+    )
+    for i, approach in enumerate(APPROACHES):
+        normal_distribution, p_value = lilliefors_test(data=errors[approach])
+        tests[approach] = {
+            "bootstrap_confidence_interval": list(
+                bootstrap_confidence_interval(sample=errors[approach], n_jobs=n_jobs, random_state=rng)
+            ),
+            "lilliefors_test": {"normal_distribution": bool(normal_distribution), "p_value": float(p_value)},
+            "two_sample_t_test_baseline": _test_outcome(rejected_null_hypothesis[i], p_values[i]),
+        }
+    tests["individual_vs_sector"] = _comparison_tests(
+        samples_1=errors["individual"], samples_2=errors["sector"], n_jobs=n_jobs, rng=rng
+    )
+    timings["tests"] = time.time() - start_time
+
+    result = EvaluationResult(
+        task="regression", config=config, metric="mae", samples=errors, timings=timings, tests=tests
+    )
+    if results_store is not None:
+        results_store.append(result=result)
+    if verbose:
+        _print_regression_result(result=result)
+    return result
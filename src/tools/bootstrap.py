@@ -0,0 +1,155 @@
+"""Methods to estimate confidence intervals on observed data using the bootstrap."""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.stats import norm
+
+BOOTSTRAP_METHODS = ["percentile", "bca"]
+
+
+def _bootstrap_means(sample: np.ndarray, nb_resamples: int, seed: int) -> np.ndarray:
+    """Draw bootstrap resamples of a sample, as a single (nb_resamples, sample_size) index matrix, and compute the mean
+    of each resample in one vectorized operation.
+
+    Args:
+        sample (np.ndarray): The observed sample to resample, with replacement.
+        nb_resamples (int): The number of resamples to draw.
+        seed (int): The seed of the random generator drawing the resamples.
+
+    Returns:
+        means (np.ndarray): The mean of each resample.
+
+    """
+    rng = np.random.default_rng(seed)
+    resamples = rng.integers(0, len(sample), size=(nb_resamples, len(sample)))
+    return sample[resamples].mean(axis=1)
+
+
+def bootstrap_confidence_interval(
+    sample: List[float],
+    confidence_level: float = 0.95,
+    nb_resamples: int = 10000,
+    method: str = "bca",
+    batch_size: int = 1000,
+    n_jobs: int = 1,
+    random_state: Union[None, int, np.random.Generator] = None,
+) -> Tuple[float, float]:
+    """Estimate a two-sided confidence interval for the mean of a sample using the bootstrap, without assuming that the
+    sample comes from a Gaussian (normal) distribution. The means of nb_resamples resamples drawn with replacement
+    estimate the distribution of the mean. With the 'percentile' method, the bounds are the quantiles of this
+    distribution. With the 'bca' (bias-corrected and accelerated) method, the quantiles are adjusted for the bias of the
+    bootstrap distribution and for its skewness (acceleration, estimated by jackknife), which gives a more accurate
+    coverage for small samples.
+
+    Resamples are drawn in batches of batch_size, each with its own seed derived from random_state, so that the
+    interval only depends on random_state and not on the number of workers evaluating the batches.
+
+    Args:
+        sample (List[float]): The observed sample (e.g. the accuracy of each Monte-Carlo sample).
+        confidence_level (float): The confidence level of the interval.
+        nb_resamples (int): The number of bootstrap resamples to draw.
+        method (str): The method used to compute the interval, 'percentile' or 'bca'.
+        batch_size (int): The number of resamples drawn and evaluated at once.
+        n_jobs (int): The number of worker processes evaluating the batches (-1 to use all CPUs).
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator, for reproducible results.
+
+    Returns:
+        lower_bound (float): The lower bound of the confidence interval for the mean.
+        upper_bound (float): The upper bound of the confidence interval for the mean.
+
+    """
+
+    if not 0 < confidence_level < 1:
+        raise ValueError("Confidence level for bootstrap must be between 0 and 1 (exclusive).")
+
+    if len(sample) == 0:
+        raise ValueError("Sample passed to bootstrap must not be empty.")
+
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(f"Parameter 'method' must be one of {BOOTSTRAP_METHODS}.")
+
+    if not isinstance(nb_resamples, int) or nb_resamples < 1:
+        raise ValueError("Parameter 'nb_resamples' must be a strictly positive integer (>= 1).")
+
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("Parameter 'batch_size' must be a strictly positive integer (>= 1).")
+
+    sample = np.asarray(sample, dtype=float)
+    observed = sample.mean()
+    if (sample == sample[0]).all():  # No variability, every resample has the same mean
+        return float(observed), float(observed)
+
+    rng = np.random.default_rng(random_state)
+    batch_sizes = [min(batch_size, nb_resamples - start) for start in range(0, nb_resamples, batch_size)]
+    seeds = rng.integers(0, 2**63 - 1, size=len(batch_sizes))
+    means = np.concatenate(
+        Parallel(n_jobs=n_jobs)(delayed(_bootstrap_means)(sample, size, seed) for size, seed in zip(batch_sizes, seeds))
+    )
+
+    alpha = (1 - confidence_level) / 2
+    quantiles = np.array([alpha, 1 - alpha])
+    if method == "bca":
+        # Bias correction: median bias of the bootstrap distribution, ties counted for half
+        proportion = (np.count_nonzero(means < observed) + np.count_nonzero(means <= observed)) / (2 * len(means))
+        bias = norm.ppf(proportion)
+        # Acceleration: skewness of the jackknife means (mean of the sample without each observation)
+        jackknife_means = (sample.sum() - sample) / (len(sample) - 1)
+        deviations = jackknife_means.mean() - jackknife_means
+        acceleration = (deviations**3).sum() / (6 * (deviations**2).sum() ** 1.5)
+        z_values = bias + norm.ppf(quantiles)
+        quantiles = norm.cdf(bias + z_values / (1 - acceleration * z_values))
+
+    lower_bound, upper_bound = np.quantile(means, quantiles)
+    return float(lower_bound), float(upper_bound)
+
+
+def sequential_stopping_check(
+    differences: List[float],
+    nb_looks: int,
+    confidence_level: float = 0.95,
+    target_width: Optional[float] = None,
+    nb_resamples: int = 10000,
+    random_state: Union[None, int, np.random.Generator] = None,
+) -> Tuple[bool, Tuple[float, float]]:
+    """Decide at an interim look whether more samples are needed to compare two approaches, from the paired differences
+    of their metric observed so far (e.g. accuracy of 'individual' minus accuracy of 'sector' on each Monte-Carlo
+    sample). The bootstrap confidence interval for the mean difference is computed at a Bonferroni-adjusted confidence
+    level, alpha being divided by the maximum number of looks, so that repeatedly checking does not inflate the false
+    positive rate. Sampling can stop once the interval excludes zero (the difference is significant), or once it is
+    narrower than target_width (the difference is estimated precisely enough, e.g. clearly null).
+
+    Args:
+        differences (List[float]): The paired differences observed so far.
+        nb_looks (int): The maximum number of looks (interim checks) over the whole sampling.
+        confidence_level (float): The overall confidence level, before the Bonferroni adjustment.
+        target_width (Optional[float]): The interval width below which the estimate is precise enough, None to only
+            stop on significance.
+        nb_resamples (int): The number of bootstrap resamples to draw.
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator, for reproducible results.
+
+    Returns:
+        stop (bool): True if no more samples are needed.
+        confidence_interval (Tuple[float, float]): The Bonferroni-adjusted confidence interval for the mean difference.
+
+    """
+
+    if not isinstance(nb_looks, int) or nb_looks < 1:
+        raise ValueError("Parameter 'nb_looks' must be a strictly positive integer (>= 1).")
+
+    if target_width is not None and not target_width > 0:
+        raise ValueError("Parameter 'target_width' must be strictly positive.")
+
+    if len(differences) < 2:  # A single observation says nothing about the variability of the difference
+        return False, (float("-inf"), float("inf"))
+
+    lower_bound, upper_bound = bootstrap_confidence_interval(
+        sample=differences,
+        confidence_level=1 - (1 - confidence_level) / nb_looks,
+        nb_resamples=nb_resamples,
+        random_state=random_state,
+    )
+    significant = lower_bound > 0 or upper_bound < 0
+    precise = target_width is not None and upper_bound - lower_bound <= target_width
+    return significant or precise, (lower_bound, upper_bound)
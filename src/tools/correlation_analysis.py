@@ -2,13 +2,14 @@
 
 import math
 from itertools import product
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import fft, stats
 
 from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval, YfinancePeriod
-from src.tools.yfinance_data_provider import YfinanceDataProvider
+from src.tools.data_provider import get_data_provider
 
 
 def correlation_analysis_single_combination(
@@ -41,7 +42,7 @@ def correlation_analysis_single_combination(
     if ticker1 == ticker2:
         raise ValueError("Parameters 'ticker1' and 'ticker2' must represent different assets.")
     if data is None:
-        data = YfinanceDataProvider.get_data(
+        data = get_data_provider().get_data(
             tickers=[ticker1, ticker2],
             period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
             interval=YfinanceInterval.ONE_HOUR,
@@ -57,8 +58,219 @@ def correlation_analysis_single_combination(
     return tuple(stats.pearsonr(clean_data_ticker1, clean_data_ticker2) + ((len(clean_data_ticker1)),))
 
 
+def _center_columns(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Center each column on the mean of its non-NaN values, NaN values being replaced by zeros. Centering does not
+    change the correlation coefficients, but avoids catastrophic cancellation in the sums of products computed from
+    the centered values.
+
+    Args:
+        values (np.ndarray): The values, one series per column, NaN for missing values.
+
+    Returns:
+        centered (np.ndarray): The centered values, zero where values is NaN.
+        mask (np.ndarray): True where values is not NaN.
+
+    """
+    mask = ~np.isnan(values)
+    centered = np.where(mask, values, 0.0)
+    centered = np.where(mask, centered - centered.sum(axis=0) / np.maximum(mask.sum(axis=0), 1), 0.0)
+    return centered, mask
+
+
+def correlation_matrix(values_1: np.ndarray, values_2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pearson correlation coefficients, p-values and numbers of observations between every column of values_1 and
+    every column of values_2, ignoring for each pair the rows where either value is NaN (pairwise-complete
+    observations). All pairs are computed at once with masked sums (matrix products), so that the results match
+    scipy.stats.pearsonr() on the non-NaN rows of each pair, without looping over the pairs.
+
+    Args:
+        values_1 (np.ndarray): 2-D array of shape (nb_rows, nb_columns_1), one time series per column.
+        values_2 (np.ndarray): 2-D array of shape (nb_rows, nb_columns_2), one time series per column.
+
+    Returns:
+        pearson_corr_coefs (np.ndarray): The Pearson correlation coefficients, of shape (nb_columns_1, nb_columns_2).
+        p_values (np.ndarray): The two-sided p-values of the coefficients, of shape (nb_columns_1, nb_columns_2).
+        data_lengths (np.ndarray): The number of pairwise-complete observations, of shape (nb_columns_1,
+            nb_columns_2). Coefficients and p-values are NaN for pairs with less than 2 observations, or where either
+            column is constant.
+
+    """
+    if values_1.ndim != 2 or values_2.ndim != 2 or len(values_1) != len(values_2):
+        raise ValueError("Parameters 'values_1' and 'values_2' must be 2-D arrays with the same number of rows.")
+
+    centered_1, mask_1 = _center_columns(values=values_1)
+    centered_2, mask_2 = _center_columns(values=values_2)
+    mask_1 = mask_1.astype(np.float64)
+    mask_2 = mask_2.astype(np.float64)
+
+    data_lengths = mask_1.T @ mask_2
+    sums_1 = centered_1.T @ mask_2
+    sums_2 = mask_1.T @ centered_2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariances = centered_1.T @ centered_2 - sums_1 * sums_2 / data_lengths
+        sums_squares_1 = (centered_1**2).T @ mask_2
+        sums_squares_2 = mask_1.T @ centered_2**2
+        variances_1 = sums_squares_1 - sums_1**2 / data_lengths
+        variances_2 = sums_squares_2 - sums_2**2 / data_lengths
+        pearson_corr_coefs = np.clip(covariances / np.sqrt(variances_1 * variances_2), -1.0, 1.0)
+        # Constant columns have no correlation, do not let the rounding errors of the centering produce one
+        constant = (variances_1 <= 1e-12 * sums_squares_1) | (variances_2 <= 1e-12 * sums_squares_2)
+        pearson_corr_coefs[(data_lengths < 2) | constant] = np.nan
+
+        # Under the null hypothesis, r * sqrt((n - 2) / (1 - r^2)) follows a Student t distribution with n - 2 dof
+        degrees_of_freedom = data_lengths - 2
+        t_statistics = np.abs(pearson_corr_coefs) * np.sqrt(degrees_of_freedom / (1 - pearson_corr_coefs**2))
+        p_values = np.where(
+            np.abs(pearson_corr_coefs) == 1, 0.0, 2 * stats.t.sf(t_statistics, np.maximum(degrees_of_freedom, 1))
+        )
+    # With 2 observations, the coefficient is always -1 or 1 and carries no information
+    p_values[data_lengths == 2] = 1.0
+    p_values[np.isnan(pearson_corr_coefs)] = np.nan
+
+    return pearson_corr_coefs, p_values, data_lengths.astype(np.int64)
+
+
+def _rolling_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums over a sliding window along the first axis, the window ending at each row (the first rows use the rows
+    available so far). Each sum is the difference of two running (cumulative) sums, so the cost per row is constant
+    whatever the size of the window.
+
+    Args:
+        values (np.ndarray): The values to sum, the first axis being the time axis.
+        window (int): The number of rows in the window.
+
+    Returns:
+        rolling_sums (np.ndarray): The sums over the window ending at each row, same shape as values.
+
+    """
+    rolling_sums = np.cumsum(values, axis=0)
+    rolling_sums[window:] -= rolling_sums[:-window].copy()
+    return rolling_sums
+
+
+def rolling_correlation_matrix(
+    values_1: np.ndarray, values_2: np.ndarray, window: int, min_periods: Union[None, int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pearson correlation coefficients over a sliding window, between every column of values_1 and every column of
+    values_2. Rows where either value of a pair is NaN are skipped for this pair. The counts and the sums (x, y, xy,
+    x^2, y^2) of every pair are maintained as running sums, so that sliding the window by one row costs O(1) per pair
+    instead of recomputing the coefficient from scratch.
+
+    Args:
+        values_1 (np.ndarray): 2-D array of shape (nb_rows, nb_columns_1), one time series per column.
+        values_2 (np.ndarray): 2-D array of shape (nb_rows, nb_columns_2), one time series per column.
+        window (int): The number of rows in the window, the window ending at each row.
+        min_periods (Union[None, int]): The minimum number of pairwise-complete observations in the window to compute
+            a coefficient (at least 2), defaults to the size of the window.
+
+    Returns:
+        pearson_corr_coefs (np.ndarray): The Pearson correlation coefficient of each pair over the window ending at
+            each row, of shape (nb_rows, nb_columns_1, nb_columns_2), NaN if there are not enough observations.
+        data_lengths (np.ndarray): The number of pairwise-complete observations in each window, same shape.
+
+    """
+    if values_1.ndim != 2 or values_2.ndim != 2 or len(values_1) != len(values_2):
+        raise ValueError("Parameters 'values_1' and 'values_2' must be 2-D arrays with the same number of rows.")
+    if window < 2:
+        raise ValueError("Parameter 'window' must be an integer greater than or equal to 2.")
+    if min_periods is None:
+        min_periods = window
+    if not 2 <= min_periods <= window:
+        raise ValueError("Parameter 'min_periods' must be an integer between 2 and 'window' inclusive.")
+
+    centered_1, mask_1 = _center_columns(values=values_1)
+    centered_2, mask_2 = _center_columns(values=values_2)
+    # Broadcast to (nb_rows, nb_columns_1, nb_columns_2): x and y are only counted in the rows where both are non-NaN
+    mask_1 = mask_1[:, :, None].astype(np.float64)
+    mask_2 = mask_2[:, None, :].astype(np.float64)
+    centered_1 = centered_1[:, :, None]
+    centered_2 = centered_2[:, None, :]
+
+    data_lengths = _rolling_sums(mask_1 * mask_2, window=window)
+    sums_1 = _rolling_sums(centered_1 * mask_2, window=window)
+    sums_2 = _rolling_sums(mask_1 * centered_2, window=window)
+    sums_squares_1 = _rolling_sums(centered_1**2 * mask_2, window=window)
+    sums_squares_2 = _rolling_sums(mask_1 * centered_2**2, window=window)
+    sums_products = _rolling_sums(centered_1 * centered_2, window=window)
+    # Counts are exact integers, round away the floating point error of the running differences
+    data_lengths = np.rint(data_lengths)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariances = sums_products - sums_1 * sums_2 / data_lengths
+        variances_1 = sums_squares_1 - sums_1**2 / data_lengths
+        variances_2 = sums_squares_2 - sums_2**2 / data_lengths
+        pearson_corr_coefs = np.clip(covariances / np.sqrt(variances_1 * variances_2), -1.0, 1.0)
+    # Constant windows have no correlation, do not let the rounding errors of the running sums produce one
+    constant = (variances_1 <= 1e-12 * sums_squares_1) | (variances_2 <= 1e-12 * sums_squares_2)
+    pearson_corr_coefs[(data_lengths < min_periods) | constant] = np.nan
+
+    return pearson_corr_coefs, data_lengths.astype(np.int64)
+
+
+def cross_correlation_matrix(
+    values_1: np.ndarray, values_2: np.ndarray, max_lag: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pearson correlation coefficients between every column of values_1 and every column of values_2 shifted by each
+    lag from -max_lag to max_lag rows, ignoring for each pair and lag the rows where either value is NaN. For a lag k,
+    values_1 at row t is paired with values_2 at row t + k, so a positive lag means that values_1 leads values_2. The
+    counts and sums needed for every pair and every lag are computed at once as cross-correlations, using the FFT.
+
+    Args:
+        values_1 (np.ndarray): 2-D array of shape (nb_rows, nb_columns_1), one time series per column.
+        values_2 (np.ndarray): 2-D array of shape (nb_rows, nb_columns_2), one time series per column.
+        max_lag (int): The maximum lag (in rows) to scan, in both directions.
+
+    Returns:
+        lags (np.ndarray): The scanned lags, from -max_lag to max_lag.
+        pearson_corr_coefs (np.ndarray): The Pearson correlation coefficient of each pair at each lag, of shape
+            (nb_lags, nb_columns_1, nb_columns_2), NaN if there are less than 3 observations or if either series is
+            constant over them.
+        data_lengths (np.ndarray): The number of pairwise-complete observations of each pair at each lag, same shape.
+
+    """
+    if values_1.ndim != 2 or values_2.ndim != 2 or len(values_1) != len(values_2):
+        raise ValueError("Parameters 'values_1' and 'values_2' must be 2-D arrays with the same number of rows.")
+    if not 0 <= max_lag < len(values_1):
+        raise ValueError("Parameter 'max_lag' must be a positive integer less than the number of rows.")
+
+    centered_1, mask_1 = _center_columns(values=values_1)
+    centered_2, mask_2 = _center_columns(values=values_2)
+
+    # Zero padding to at least nb_rows + max_lag avoids the circular wrap-around of the FFT for the scanned lags
+    fft_length = fft.next_fast_len(len(values_1) + max_lag, real=True)
+    lags = np.arange(-max_lag, max_lag + 1)
+
+    def cross_correlate(series_1: np.ndarray, series_2: np.ndarray) -> np.ndarray:
+        # sum over t of series_1[t, i] * series_2[t + lag, j], for every lag, i and j
+        spectrum_1 = np.conj(fft.rfft(series_1, n=fft_length, axis=0))[:, :, None]
+        spectrum_2 = fft.rfft(series_2, n=fft_length, axis=0)[:, None, :]
+        return fft.irfft(spectrum_1 * spectrum_2, n=fft_length, axis=0)[lags]
+
+    mask_1 = mask_1.astype(np.float64)
+    mask_2 = mask_2.astype(np.float64)
+    data_lengths = np.rint(cross_correlate(mask_1, mask_2))
+    sums_1 = cross_correlate(centered_1, mask_2)
+    sums_2 = cross_correlate(mask_1, centered_2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariances = cross_correlate(centered_1, centered_2) - sums_1 * sums_2 / data_lengths
+        sums_squares_1 = cross_correlate(centered_1**2, mask_2)
+        sums_squares_2 = cross_correlate(mask_1, centered_2**2)
+        variances_1 = sums_squares_1 - sums_1**2 / data_lengths
+        variances_2 = sums_squares_2 - sums_2**2 / data_lengths
+        pearson_corr_coefs = np.clip(covariances / np.sqrt(variances_1 * variances_2), -1.0, 1.0)
+    # Constant columns have no correlation, do not let the rounding errors of the centering produce one
+    constant = (variances_1 <= 1e-12 * sums_squares_1) | (variances_2 <= 1e-12 * sums_squares_2)
+    pearson_corr_coefs[(data_lengths < 3) | constant] = np.nan
+
+    return lags, pearson_corr_coefs, data_lengths.astype(np.int64)
+
+
 def correlation_analysis_lists_cardinal_product(
-    list_ticker1: List[str], list_ticker2: List[str], column_ticker1: PriceAttribute, column_ticker2: PriceAttribute
+    list_ticker1: List[str],
+    list_ticker2: List[str],
+    column_ticker1: PriceAttribute,
+    column_ticker2: PriceAttribute,
+    data: Union[None, pd.DataFrame] = None,
 ) -> dict:
     """Analyse the correlation of all combinations (cardinal product) between two lists of tickers, for specific
     attributes. Returns a dictionary containing correlation insights for all ticker combinations.
@@ -68,24 +280,200 @@ def correlation_analysis_lists_cardinal_product(
         list_ticker2 (List[str]): Second list of tickers, to analyse their correlation with the first list of tickers.
         column_ticker1 (PriceAttribute): The attribute of the ticker from the first list to use to analyse correlation.
         column_ticker2 (PriceAttribute): The attribute of the ticker from the second list to use to analyse correlation.
+        data (Union[None, pd.DataFrame]): The DataFrame containing the historical data for the tickers ; if not
+            provided, download 730 days of past hourly historical data for the tickers.
 
     Returns:
         correlation_insights (dict): Dictionary containing correlation insights for all ticker combinations.
     """
-    data = YfinanceDataProvider.get_data(
-        tickers=list_ticker1 + list_ticker2,
-        period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
-        interval=YfinanceInterval.ONE_HOUR,
-        group_by=YfinanceGroupBy.COLUMN,
+    return correlation_analysis_lists_cardinal_product_columns(
+        list_ticker1=list_ticker1,
+        list_ticker2=list_ticker2,
+        columns=[(column_ticker1, column_ticker2)],
+        data=data,
+    )[(column_ticker1, column_ticker2)]
+
+
+def correlation_analysis_lists_cardinal_product_columns(
+    list_ticker1: List[str],
+    list_ticker2: List[str],
+    columns: List[Tuple[PriceAttribute, PriceAttribute]],
+    data: Union[None, pd.DataFrame] = None,
+) -> Dict[Tuple[PriceAttribute, PriceAttribute], dict]:
+    """Analyse the correlation of all combinations (cardinal product) between two lists of tickers, for several pairs
+    of attributes at once. The historical data is fetched once for all the pairs of attributes, and all the
+    correlations are computed in a single correlation_matrix() pass.
+
+    Args:
+        list_ticker1 (List[str]): First list of tickers, to analyse their correlation with the second list of tickers.
+        list_ticker2 (List[str]): Second list of tickers, to analyse their correlation with the first list of tickers.
+        columns (List[Tuple[PriceAttribute, PriceAttribute]]): The pairs of attributes to analyse, the first one for
+            the tickers from the first list, the second one for the tickers from the second list.
+        data (Union[None, pd.DataFrame]): The DataFrame containing the historical data for the tickers ; if not
+            provided, download 730 days of past hourly historical data for the tickers.
+
+    Returns:
+        correlation_insights (Dict[Tuple[PriceAttribute, PriceAttribute], dict]): For each pair of attributes, the
+            dictionary containing correlation insights for all ticker combinations.
+    """
+    if data is None:
+        data = get_data_provider().get_data(
+            tickers=list_ticker1 + list_ticker2,
+            period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
+            interval=YfinanceInterval.ONE_HOUR,
+            group_by=YfinanceGroupBy.COLUMN,
+        )
+    if not list_ticker1 or not list_ticker2:
+        return {column_pair: {} for column_pair in columns}
+    if not all(list_ticker1) or not all(list_ticker2):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must be non-empty.")
+    if set(list_ticker1) & set(list_ticker2):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must represent different assets.")
+
+    # Each distinct attribute contributes one block of columns (one per ticker) to the correlation matrix
+    attributes_ticker1 = list(dict.fromkeys(column_ticker1 for column_ticker1, _ in columns))
+    attributes_ticker2 = list(dict.fromkeys(column_ticker2 for _, column_ticker2 in columns))
+    if not all(set(list_ticker1) <= set(data[attribute.value].columns) for attribute in attributes_ticker1) or not all(
+        set(list_ticker2) <= set(data[attribute.value].columns) for attribute in attributes_ticker2
+    ):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must represent valid tickers in the 'data'.")
+
+    pearson_corr_coefs, p_values, data_lengths = correlation_matrix(
+        values_1=np.hstack([data[attribute.value][list_ticker1].values for attribute in attributes_ticker1]).astype(
+            np.float64
+        ),
+        values_2=np.hstack([data[attribute.value][list_ticker2].values for attribute in attributes_ticker2]).astype(
+            np.float64
+        ),
     )
-    combinations = list(product(list_ticker1, list_ticker2))
     correlations = {}
-    for commodity_ticker, forex_ticker in combinations:
-        correlations[(commodity_ticker, forex_ticker)] = correlation_analysis_single_combination(
-            ticker1=commodity_ticker,
-            ticker2=forex_ticker,
-            column_ticker1=column_ticker1,
-            column_ticker2=column_ticker2,
-            data=data,
-        )
+    for column_ticker1, column_ticker2 in columns:
+        offset_1 = attributes_ticker1.index(column_ticker1) * len(list_ticker1)
+        offset_2 = attributes_ticker2.index(column_ticker2) * len(list_ticker2)
+        correlations[(column_ticker1, column_ticker2)] = {
+            (ticker1, ticker2): (
+                float(pearson_corr_coefs[offset_1 + i, offset_2 + j]),
+                float(p_values[offset_1 + i, offset_2 + j]),
+                int(data_lengths[offset_1 + i, offset_2 + j]),
+            )
+            for (i, ticker1), (j, ticker2) in product(enumerate(list_ticker1), enumerate(list_ticker2))
+        }
     return correlations
+
+
+def rolling_correlation_analysis_lists_cardinal_product(
+    list_ticker1: List[str],
+    list_ticker2: List[str],
+    column_ticker1: PriceAttribute,
+    column_ticker2: PriceAttribute,
+    window: int,
+    min_periods: Union[None, int] = None,
+    data: Union[None, pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Analyse the correlation over a sliding window of all combinations (cardinal product) between two lists of
+    tickers, for specific attributes. Returns the time series of the Pearson correlation coefficient of every ticker
+    combination, e.g. to monitor changes of regime in the relationship between two assets.
+
+    Args:
+        list_ticker1 (List[str]): First list of tickers, to analyse their correlation with the second list of tickers.
+        list_ticker2 (List[str]): Second list of tickers, to analyse their correlation with the first list of tickers.
+        column_ticker1 (PriceAttribute): The attribute of the ticker from the first list to use to analyse correlation.
+        column_ticker2 (PriceAttribute): The attribute of the ticker from the second list to use to analyse correlation.
+        window (int): The number of rows (data points) in the sliding window.
+        min_periods (Union[None, int]): The minimum number of non-NaN observations of both tickers in the window to
+            compute a coefficient (at least 2), defaults to the size of the window.
+        data (Union[None, pd.DataFrame]): The DataFrame containing the historical data for the tickers ; if not
+            provided, download 730 days of past hourly historical data for the tickers.
+
+    Returns:
+        rolling_correlations (pd.DataFrame): The Pearson correlation coefficient over the window ending at each
+            timestamp (index), one column per ticker combination (MultiIndex columns ticker1, ticker2).
+    """
+    if data is None:
+        data = get_data_provider().get_data(
+            tickers=list_ticker1 + list_ticker2,
+            period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
+            interval=YfinanceInterval.ONE_HOUR,
+            group_by=YfinanceGroupBy.COLUMN,
+        )
+    if not all(list_ticker1) or not all(list_ticker2):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must be non-empty.")
+    if set(list_ticker1) & set(list_ticker2):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must represent different assets.")
+    if not set(list_ticker1) <= set(data[column_ticker1.value].columns) or not set(list_ticker2) <= set(
+        data[column_ticker2.value].columns
+    ):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must represent valid tickers in the 'data'.")
+
+    pearson_corr_coefs, _ = rolling_correlation_matrix(
+        values_1=data[column_ticker1.value][list_ticker1].values.astype(np.float64),
+        values_2=data[column_ticker2.value][list_ticker2].values.astype(np.float64),
+        window=window,
+        min_periods=min_periods,
+    )
+    return pd.DataFrame(
+        data=pearson_corr_coefs.reshape(len(data), len(list_ticker1) * len(list_ticker2)),
+        index=data.index,
+        columns=pd.MultiIndex.from_product([list_ticker1, list_ticker2], names=["ticker1", "ticker2"]),
+    )
+
+
+def lead_lag_analysis_lists_cardinal_product(
+    list_ticker1: List[str],
+    list_ticker2: List[str],
+    column_ticker1: PriceAttribute = PriceAttribute.CLOSE,
+    column_ticker2: PriceAttribute = PriceAttribute.CLOSE,
+    max_lag: int = 24,
+    data: Union[None, pd.DataFrame] = None,
+) -> dict:
+    """Analyse the lead-lag relationship of all combinations (cardinal product) between two lists of tickers, using the
+    cross-correlation of their hourly changes over a range of lags. For each combination, returns the lag with the
+    strongest correlation (in absolute value). A positive lag means that the ticker from the first list leads (changes
+    before) the ticker from the second list, e.g. a commodity whose moves predict the moves of a forex pair, with the
+    lag suggesting a number of previous hours to use as features.
+
+    Args:
+        list_ticker1 (List[str]): First list of tickers, to analyse their lead-lag relationship with the second list.
+        list_ticker2 (List[str]): Second list of tickers, to analyse their lead-lag relationship with the first list.
+        column_ticker1 (PriceAttribute): The attribute of the ticker from the first list to calculate changes for.
+        column_ticker2 (PriceAttribute): The attribute of the ticker from the second list to calculate changes for.
+        max_lag (int): The maximum lag (in hours) to scan, in both directions.
+        data (Union[None, pd.DataFrame]): The DataFrame containing the hourly changes of the tickers, with (ticker,
+            attribute) columns as returned by get_hourly_changes() ; if not provided, download 730 days of past
+            hourly historical data for the tickers.
+
+    Returns:
+        lead_lag_insights (dict): For each ticker combination, the lag with the strongest correlation, the Pearson
+            correlation coefficient at this lag, and the number of observations it is computed on.
+    """
+    if data is None:
+        data = get_data_provider().get_hourly_changes(
+            attributes=list(dict.fromkeys([column_ticker1, column_ticker2])), tickers=list_ticker1 + list_ticker2
+        )
+    if not list_ticker1 or not list_ticker2:
+        return {}
+    if not all(list_ticker1) or not all(list_ticker2):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must be non-empty.")
+    if set(list_ticker1) & set(list_ticker2):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must represent different assets.")
+    columns_ticker1 = [(ticker, column_ticker1.value) for ticker in list_ticker1]
+    columns_ticker2 = [(ticker, column_ticker2.value) for ticker in list_ticker2]
+    if not set(columns_ticker1 + columns_ticker2) <= set(data.columns):
+        raise ValueError("Parameters 'ticker1' and 'ticker2' must represent valid tickers in the 'data'.")
+
+    lags, pearson_corr_coefs, data_lengths = cross_correlation_matrix(
+        values_1=data[columns_ticker1].values.astype(np.float64),
+        values_2=data[columns_ticker2].values.astype(np.float64),
+        max_lag=max_lag,
+    )
+    # Pairs without enough observations at any lag are reported at lag 0, with a NaN coefficient
+    best_lags = np.argmax(np.nan_to_num(np.abs(pearson_corr_coefs), nan=-1.0), axis=0)
+    lead_lags = {}
+    for (i, ticker1), (j, ticker2) in product(enumerate(list_ticker1), enumerate(list_ticker2)):
+        best_lag = best_lags[i, j] if not np.isnan(pearson_corr_coefs[:, i, j]).all() else max_lag
+        lead_lags[(ticker1, ticker2)] = (
+            int(lags[best_lag]),
+            float(pearson_corr_coefs[best_lag, i, j]),
+            int(data_lengths[best_lag, i, j]),
+        )
+    return lead_lags
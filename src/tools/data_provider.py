@@ -0,0 +1,37 @@
+"""Global selection of the data provider used to retrieve financial data (Yahoo Finance by default, or an offline
+replay of local snapshots)."""
+
+from typing import Type, Union
+
+from src.tools.replay_data_provider import ReplayDataProvider
+from src.tools.yfinance_data_provider import YfinanceDataProvider
+
+DataProvider = Union[Type[YfinanceDataProvider], ReplayDataProvider]
+
+_data_provider: DataProvider = YfinanceDataProvider
+
+
+def get_data_provider() -> DataProvider:
+    """Get the data provider currently selected to retrieve financial data.
+
+    Returns:
+        data_provider (DataProvider): The selected data provider, supporting methods get_data() and
+            get_hourly_changes().
+
+    """
+
+    return _data_provider
+
+
+def set_data_provider(data_provider: DataProvider) -> None:
+    """Select the data provider used to retrieve financial data in the correlation analysis and performance evaluation
+    methods.
+
+    Args:
+        data_provider (DataProvider): The data provider to use, e.g. YfinanceDataProvider or an instance of
+            ReplayDataProvider.
+
+    """
+
+    global _data_provider
+    _data_provider = data_provider
@@ -0,0 +1,136 @@
+"""Classes to download historical prices from Yahoo Finance concurrently, one request per ticker."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
+
+import pandas as pd
+import yfinance as yf
+
+
+class RateLimiter:
+    """Class rate limiter.
+
+    Thread-safe limiter spacing out the start of consecutive requests, to send at most max_requests_per_second requests.
+    """
+
+    def __init__(self, max_requests_per_second: float) -> None:
+        """Constructor for class RateLimiter.
+
+        Args:
+            max_requests_per_second (float): The maximum number of requests started per second.
+        """
+        if max_requests_per_second <= 0:
+            raise ValueError("Parameter 'max_requests_per_second' must be strictly positive.")
+        self.min_interval = 1 / max_requests_per_second
+        self._next_request_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block the calling thread until it is allowed to start a new request."""
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time)
+            self._next_request_time = request_time + self.min_interval
+        if request_time > now:
+            time.sleep(request_time - now)
+
+
+class DownloadScheduler:
+    """Class download scheduler.
+
+    Downloads historical prices for each ticker in a separate request, in parallel on a bounded thread pool, so that a
+    slow or failing ticker does not stall or corrupt the whole batch. Each ticker request is retried with exponential
+    backoff when it fails or returns no data. Requests go through yfinance.Ticker.history() rather than
+    yfinance.download(), which stores its results in module-level state shared between concurrent calls.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        max_requests_per_second: Union[None, float] = None,
+        timeout: float = 30,
+    ) -> None:
+        """Constructor for class DownloadScheduler.
+
+        Args:
+            max_workers (int): The maximum number of tickers downloaded at the same time.
+            max_retries (int): The maximum number of retries for each ticker, after the first attempt.
+            backoff_seconds (float): The delay before the first retry, doubled for each following retry.
+            max_requests_per_second (Union[None, float]): The maximum number of requests started per second ; not
+                limited if not provided.
+            timeout (float): The timeout of each request, in seconds.
+        """
+        if max_workers < 1:
+            raise ValueError("Parameter 'max_workers' must be a strictly positive integer (>= 1).")
+        if max_retries < 0:
+            raise ValueError("Parameter 'max_retries' must be a positive integer (>= 0).")
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.rate_limiter = RateLimiter(max_requests_per_second) if max_requests_per_second is not None else None
+        self.timeout = timeout
+        self.failed_tickers: Dict[str, Union[None, Exception]] = {}
+
+    def _download_ticker(self, ticker: str, interval: str, time_range: dict) -> pd.DataFrame:
+        """Download historical prices for a single ticker, retrying with exponential backoff.
+
+        Args:
+            ticker (str): The ticker for the asset to retrieve historical prices for.
+            interval (str): The size of the interval between each data point.
+            time_range (dict): Either the 'period' or the 'start' of the time series, as yfinance parameter.
+
+        Returns:
+            data (pd.DataFrame): The historical prices time series, empty if all attempts failed.
+
+        """
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                time.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+            if self.rate_limiter is not None:
+                self.rate_limiter.wait()
+            try:
+                data = yf.Ticker(ticker).history(
+                    interval=interval, auto_adjust=False, actions=False, timeout=self.timeout, **time_range
+                )
+            except Exception as e:
+                error = e
+                continue
+            if not data.empty:
+                return data
+        self.failed_tickers[ticker] = error
+        return pd.DataFrame()
+
+    def download(
+        self,
+        tickers: List[str],
+        interval: str,
+        period: Union[None, str] = None,
+        start: Union[None, pd.Timestamp] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Download historical prices for the tickers in parallel. The time series covers either the given period, or
+        all bars from the given start timestamp until now. Tickers for which all attempts failed are given an empty
+        DataFrame, and recorded in the failed_tickers instance variable with the last exception raised (if any).
+
+        Args:
+            tickers (List[str]): The tickers for the assets to retrieve historical prices for.
+            interval (str): The size of the interval between each data point.
+            period (Union[None, str]): The period of the time series ; used if start is not provided.
+            start (Union[None, pd.Timestamp]): The timestamp of the first bar to retrieve.
+
+        Returns:
+            tickers_data (Dict[str, pd.DataFrame]): The historical prices time series of each ticker.
+
+        """
+        time_range = {"period": period} if start is None else {"start": start}
+        for ticker in tickers:
+            self.failed_tickers.pop(ticker, None)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(tickers), 1))) as executor:
+            futures = {
+                ticker: executor.submit(self._download_ticker, ticker, interval, time_range) for ticker in tickers
+            }
+            return {ticker: future.result() for ticker, future in futures.items()}
@@ -0,0 +1,263 @@
+"""Classes to hold the results of a performance evaluation, and to persist them on disk as Parquet datasets."""
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Union
+
+import pandas as pd
+
+CONFIG_HASH_COLUMN = "config_hash"
+RUNS_DIR_NAME = "runs"
+SAMPLES_DIR_NAME = "samples"
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Get a short stable hash of an evaluation configuration, identical for identical configurations regardless of the
+    order of their keys.
+
+    Args:
+        config (Dict[str, Any]): The configuration, containing JSON-serializable values.
+
+    Returns:
+        config_hash (str): The hexadecimal hash of the configuration.
+
+    """
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class EvaluationResult:
+    """Class Evaluation Result.
+
+    The outcome of one run of a performance evaluation: the configuration it was run with, the metric of each
+    Monte-Carlo sample for each approach (e.g. 'individual', 'sector' and 'baseline'), the duration of each phase of
+    the run, and the outcome of each hypothesis test, by test name.
+    """
+
+    def __init__(
+        self,
+        task: str,
+        config: Dict[str, Any],
+        metric: str,
+        samples: Dict[str, List[float]],
+        timings: Dict[str, float],
+        tests: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Constructor for class EvaluationResult. Check that all approaches were evaluated on the same samples.
+
+        Args:
+            task (str): The kind of evaluation, 'classification' or 'regression'.
+            config (Dict[str, Any]): The configuration of the run, containing JSON-serializable values.
+            metric (str): The name of the metric measured on each sample (e.g. 'accuracy').
+            samples (Dict[str, List[float]]): The metric of each sample, by approach.
+            timings (Dict[str, float]): The duration of each phase of the run, in seconds.
+            tests (Dict[str, Dict[str, Any]]): The outcome of each hypothesis test, by test name.
+        """
+        if len({len(values) for values in samples.values()}) > 1:
+            raise ValueError("All approaches in parameter 'samples' must have the same number of samples.")
+        self.task = task
+        self.config = config
+        self.metric = metric
+        self.samples = {approach: [float(value) for value in values] for approach, values in samples.items()}
+        self.timings = timings
+        self.tests = tests
+
+    @property
+    def config_hash(self) -> str:
+        return config_hash(self.config)
+
+    @property
+    def nb_samples(self) -> int:
+        return len(next(iter(self.samples.values()), []))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the metric of each sample to a long-format DataFrame, with one row per (sample, approach) pair.
+
+        Returns:
+            samples_data (pd.DataFrame): The samples, contains columns 'sample', 'approach' and 'value'.
+
+        """
+        return pd.DataFrame(
+            data={
+                "sample": [sample for values in self.samples.values() for sample in range(len(values))],
+                "approach": [approach for approach, values in self.samples.items() for _ in values],
+                "value": [value for values in self.samples.values() for value in values],
+            }
+        )
+
+
+class ResultsStore:
+    """Class Results Store.
+
+    Appends evaluation results to two Parquet datasets, with one directory per configuration hash and one file per run:
+    '<store_dir>/runs/<config_hash>/' with one row per run (configuration, timings and tests, as JSON) and
+    '<store_dir>/samples/<config_hash>/' with one row per (sample, approach) pair of each run. Runs with the same
+    configuration hash can be queried, or reused instead of running the same experiment again.
+    """
+
+    def __init__(self, store_dir: str) -> None:
+        """Constructor for class ResultsStore.
+
+        Args:
+            store_dir (str): The root directory of the store on disk, created if it does not exist.
+        """
+        self.store_dir = store_dir
+        os.makedirs(os.path.join(store_dir, RUNS_DIR_NAME), exist_ok=True)
+        os.makedirs(os.path.join(store_dir, SAMPLES_DIR_NAME), exist_ok=True)
+
+    def _partition_dir(self, dataset: str, config_hash: str) -> str:
+        """Get the directory of the partition of a dataset for a configuration hash.
+
+        Args:
+            dataset (str): The name of the dataset, 'runs' or 'samples'.
+            config_hash (str): The hash of the configuration.
+
+        Returns:
+            partition_dir (str): The path to the directory of the partition.
+
+        """
+        return os.path.join(self.store_dir, dataset, config_hash)
+
+    @staticmethod
+    def _write(data: pd.DataFrame, partition_dir: str, run_id: str) -> None:
+        """Write the rows of a run in its own file of a partition, atomically so that readers never see partial files.
+
+        Args:
+            data (pd.DataFrame): The rows to write.
+            partition_dir (str): The directory of the partition.
+            run_id (str): The identifier of the run, used as file name.
+
+        """
+        os.makedirs(partition_dir, exist_ok=True)
+        # Hidden while being written: files starting with '.' are ignored when reading the dataset
+        tmp_path = os.path.join(partition_dir, f".{run_id}.parquet.tmp")
+        data.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, os.path.join(partition_dir, f"{run_id}.parquet"))
+
+    def _read(self, dataset: str, config_hash: Union[None, str] = None) -> Union[None, pd.DataFrame]:
+        """Read a dataset of the store, or only the partition of a configuration hash.
+
+        Args:
+            dataset (str): The name of the dataset, 'runs' or 'samples'.
+            config_hash (Union[None, str]): The hash of the configuration to read ; all configurations if not provided.
+
+        Returns:
+            data (Union[None, pd.DataFrame]): The rows of the dataset, None if there are no rows.
+
+        """
+        if config_hash is None:
+            data_dir = os.path.join(self.store_dir, dataset)
+        else:
+            data_dir = self._partition_dir(dataset=dataset, config_hash=config_hash)
+        if not os.path.isdir(data_dir) or not os.listdir(data_dir):
+            return None
+        return pd.read_parquet(data_dir)
+
+    def append(self, result: EvaluationResult) -> str:
+        """Append the result of a run to the store.
+
+        Args:
+            result (EvaluationResult): The result to store.
+
+        Returns:
+            run_id (str): The identifier of the run in the store.
+
+        """
+        run_id = uuid.uuid4().hex
+        hash_value = result.config_hash
+        run_data = pd.DataFrame(
+            data={
+                "run_id": [run_id],
+                "created_at": [pd.Timestamp(datetime.now(tz=timezone.utc))],
+                "task": [result.task],
+                "metric": [result.metric],
+                "nb_samples": [result.nb_samples],
+                "config": [json.dumps(result.config, sort_keys=True)],
+                "timings": [json.dumps(result.timings)],
+                "tests": [json.dumps(result.tests)],
+                CONFIG_HASH_COLUMN: [hash_value],
+            }
+        )
+        samples_data = result.to_dataframe()
+        samples_data.insert(0, "run_id", run_id)
+        samples_data[CONFIG_HASH_COLUMN] = hash_value
+        # Samples are written first: a run is only visible once all its samples are stored
+        self._write(samples_data, self._partition_dir(dataset=SAMPLES_DIR_NAME, config_hash=hash_value), run_id)
+        self._write(run_data, self._partition_dir(dataset=RUNS_DIR_NAME, config_hash=hash_value), run_id)
+        return run_id
+
+    def contains(self, config_hash: str) -> bool:
+        """Check if at least one run with a configuration hash is stored.
+
+        Args:
+            config_hash (str): The hash of the configuration.
+
+        Returns:
+            contained (bool): True if a run with this configuration hash is stored, False otherwise.
+
+        """
+        partition_dir = self._partition_dir(dataset=RUNS_DIR_NAME, config_hash=config_hash)
+        return os.path.isdir(partition_dir) and any(name.endswith(".parquet") for name in os.listdir(partition_dir))
+
+    def load_runs(self, config_hash: Union[None, str] = None) -> pd.DataFrame:
+        """Load the stored runs, one row per run, sorted by creation time.
+
+        Args:
+            config_hash (Union[None, str]): The hash of the configuration of the runs ; all runs if not provided.
+
+        Returns:
+            runs_data (pd.DataFrame): The runs, the configuration, timings and tests of each run being JSON strings.
+
+        """
+        runs_data = self._read(dataset=RUNS_DIR_NAME, config_hash=config_hash)
+        if runs_data is None:
+            return pd.DataFrame(
+                columns=["run_id", "created_at", "task", "metric", "nb_samples", "config", "timings", "tests"]
+                + [CONFIG_HASH_COLUMN]
+            )
+        return runs_data.sort_values("created_at", kind="stable").reset_index(drop=True)
+
+    def load_samples(self, config_hash: Union[None, str] = None) -> pd.DataFrame:
+        """Load the metric of each sample of the stored runs, one row per (run, sample, approach).
+
+        Args:
+            config_hash (Union[None, str]): The hash of the configuration of the runs ; all runs if not provided.
+
+        Returns:
+            samples_data (pd.DataFrame): The samples, contains columns 'run_id', 'sample', 'approach', 'value' and
+                'config_hash'.
+
+        """
+        samples_data = self._read(dataset=SAMPLES_DIR_NAME, config_hash=config_hash)
+        if samples_data is None:
+            return pd.DataFrame(columns=["run_id", "sample", "approach", "value", CONFIG_HASH_COLUMN])
+        return samples_data
+
+    def load(self, config_hash: str) -> Union[None, EvaluationResult]:
+        """Load the latest stored run with a configuration hash.
+
+        Args:
+            config_hash (str): The hash of the configuration.
+
+        Returns:
+            result (Union[None, EvaluationResult]): The result of the latest run, None if no run is stored.
+
+        """
+        if not self.contains(config_hash=config_hash):
+            return None
+        run = self.load_runs(config_hash=config_hash).iloc[-1]
+        samples_data = self.load_samples(config_hash=config_hash)
+        samples_data = samples_data[samples_data["run_id"] == run["run_id"]].sort_values("sample", kind="stable")
+        samples = {}
+        for approach, value in zip(samples_data["approach"], samples_data["value"]):
+            samples.setdefault(approach, []).append(value)
+        return EvaluationResult(
+            task=run["task"],
+            config=json.loads(run["config"]),
+            metric=run["metric"],
+            samples=samples,
+            timings=json.loads(run["timings"]),
+            tests=json.loads(run["tests"]),
+        )
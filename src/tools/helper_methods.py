@@ -1,12 +1,12 @@
 """Common helper methods for other classes."""
 
-import math
 from datetime import timedelta
-from typing import List, Union
+from typing import Dict, List, Union
 
+import numpy as np
 import pandas as pd
 
-from src.tools.constants import PriceAttribute
+from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval, YfinancePeriod
 
 
 def extract_changes_from_dataframe(attribute: PriceAttribute, data: pd.DataFrame) -> pd.Series:
@@ -29,23 +29,298 @@ def extract_changes_from_dataframe(attribute: PriceAttribute, data: pd.DataFrame
     if attribute == PriceAttribute.OPEN or attribute == PriceAttribute.VOLUME:
         raise ValueError("Cannot extract changes for price attributes 'Open' or 'Volume'.")
 
-    def row_change_value(row: pd.Series) -> Union[bool, float]:
-        if math.isnan(row["Open"]) or math.isnan(row[attribute.value]):
-            return math.nan
-        return (row[attribute.value] / row["Open"]) - 1
+    # Column-wise operation on the whole arrays, NaN values in 'Open' or in the attribute propagate to the change.
+    return data[attribute.value].astype(float) / data["Open"].astype(float) - 1
 
-    return data.apply(lambda row: row_change_value(row), axis=1)
 
+def extract_changes_from_multiindex_dataframe(
+    attributes: List[PriceAttribute],
+    data: pd.DataFrame,
+    tickers: Union[None, List[str]] = None,
+    dtype: Union[type, str] = np.float64,
+) -> pd.DataFrame:
+    """Create a pandas DataFrame representing changes (as a percentage) for each row, for all the selected price
+    attributes of all tickers in the given pandas DataFrame grouped by ticker, in a single array operation.
 
-def consecutive_timestamps(timestamps: List[pd.Timestamp]) -> bool:
-    """Check if the given timestamps are consecutive (consecutive timestamps separated by 1 hour).
+    Args:
+        attributes (List[PriceAttribute]): The price attributes (columns) to extract changes for.
+        data (pd.DataFrame): The pandas DataFrame with (ticker, attribute) columns, containing an 'Open' column for
+            each ticker.
+        tickers (Union[None, List[str]]): The tickers to extract changes for, in order ; all tickers in the DataFrame
+            if not provided.
+        dtype (Union[type, str]): The floating point type of the changes.
+
+    Returns:
+        changes_data (pd.DataFrame): The changes (continuous values) extracted from the DataFrame, with
+            (ticker, attribute) columns.
+
+    """
+
+    if PriceAttribute.OPEN in attributes or PriceAttribute.VOLUME in attributes:
+        raise ValueError("Cannot extract changes for price attributes 'Open' or 'Volume'.")
+
+    if tickers is None:
+        tickers = list(dict.fromkeys(data.columns.get_level_values(0)))
+    attribute_names = [attribute.value for attribute in attributes]
+    columns = pd.MultiIndex.from_product([tickers, attribute_names])
+
+    attribute_values = data.loc[:, columns].to_numpy(dtype=float)
+    open_values = data.loc[:, pd.MultiIndex.from_product([tickers, ["Open"]])].to_numpy(dtype=float)
+    changes_values = attribute_values / np.repeat(open_values, len(attribute_names), axis=1) - 1
+    return pd.DataFrame(data=changes_values.astype(dtype, copy=False), index=data.index, columns=columns)
+
+
+def build_changes_data(
+    attributes: List[PriceAttribute], tickers: List[str], data: pd.DataFrame, dtype: Union[type, str] = np.float64
+) -> pd.DataFrame:
+    """Calculate changes (as a percentage) for the selected price attributes of each ticker, from historical prices
+    data grouped by ticker. All change columns are computed in a single array operation, and the (ticker, attribute)
+    DataFrame is assembled in a single allocation.
+
+    Args:
+        attributes (List[PriceAttribute]): The price attribute(s) (column(s)) to calculate changes for.
+        tickers (List[str]): The ticker(s) to calculate changes for.
+        data (pd.DataFrame): The historical prices time series, grouped by ticker if it contains multiple tickers.
+        dtype (Union[type, str]): The floating point type of the changes (e.g. np.float32 to halve memory usage).
+
+    Returns:
+        changes_data (pd.DataFrame): The calculated changes time series, with (ticker, attribute) columns.
+
+    """
+
+    if data.empty:
+        columns = pd.MultiIndex.from_product([tickers, [attribute.value for attribute in attributes]])
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name="Date"), dtype=dtype)
+
+    if len(tickers) == 1 and not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({tickers[0]: data}, axis=1)
+    return extract_changes_from_multiindex_dataframe(attributes=attributes, data=data, tickers=tickers, dtype=dtype)
+
+
+def interval_step(interval: Union[YfinanceInterval, str]) -> Union[timedelta, pd.DateOffset]:
+    """Get the time step between two consecutive data points of a yfinance interval.
+
+    Args:
+        interval (Union[YfinanceInterval, str]): The size of the interval between each data point (e.g. '5m', '1h').
+
+    Returns:
+        step (Union[timedelta, pd.DateOffset]): The step between two consecutive data points, a calendar offset for
+            intervals measured in months (which have no fixed duration).
+
+    """
+
+    if isinstance(interval, YfinanceInterval):
+        interval = interval.value
+    units = {"m": "minutes", "h": "hours", "d": "days", "wk": "weeks", "mo": "months"}
+    for suffix, unit in units.items():
+        if interval.endswith(suffix) and interval[: -len(suffix)].isdigit():
+            if unit == "months":
+                return pd.DateOffset(months=int(interval[: -len(suffix)]))
+            return timedelta(**{unit: int(interval[: -len(suffix)])})
+    raise ValueError(f"Invalid interval '{interval}'.")
+
+
+def consecutive_timestamps(
+    timestamps: List[pd.Timestamp],
+    interval: Union[YfinanceInterval, str] = YfinanceInterval.ONE_HOUR,
+    session_aware: bool = False,
+) -> bool:
+    """Check if the given timestamps are consecutive (consecutive timestamps separated by 1 interval).
 
     Args:
         timestamps (List[pd.Timestamp]): The list of timestamps to check.
+        interval (Union[YfinanceInterval, str]): The size of the interval between consecutive timestamps.
+        session_aware (bool): Whether to also accept gaps between two consecutive trading dates, see
+            contiguous_run_starts().
 
     Returns:
         timestamps_are_consecutive (bool): True if all the timestamps are consecutive, False otherwise.
 
     """
 
-    return len({timestamps[i] - (timedelta(hours=1) * i) for i in range(len(timestamps))}) <= 1
+    if len(timestamps) <= 1:
+        return True
+    run_starts = contiguous_run_starts(
+        timestamps=pd.DatetimeIndex(timestamps), interval=interval, session_aware=session_aware
+    )
+    return run_starts[-1] == 0
+
+
+def contiguous_run_starts(
+    timestamps: pd.DatetimeIndex,
+    interval: Union[YfinanceInterval, str] = YfinanceInterval.ONE_HOUR,
+    session_aware: bool = False,
+    session_timezone: Union[None, str] = None,
+    max_session_gap: timedelta = timedelta(days=1),
+) -> np.ndarray:
+    """Build a run-length index of the contiguous segments of a DatetimeIndex: for each row, the position of the first
+    row of the segment of consecutive timestamps (separated by exactly one interval) it belongs to. Computed once over
+    the int64 nanosecond timestamps, it answers whether any window of rows is consecutive in constant time (see
+    consecutive_windows()), and can be reused for all the tickers and window lengths of the same DataFrame.
+
+    With session_aware, for intervals up to 1 day, the gap between the last data point of a trading date and the first
+    data point of the next trading date (the next business day, skipping weekends) does not break a segment, e.g.
+    overnight and weekend gaps of intraday data, or weekends for daily data, as long as the gap, not counting the
+    weekend days, is at most max_session_gap. Gaps within a trading date still do. Trading dates are the
+    calendar dates of the timestamps in session_timezone, or in their own timezone if not provided: UTC for data
+    combining several tickers, whose UTC dates may not match the trading dates of the exchange. The gaps are only
+    compared to calendar dates, not to the trading hours of the exchange: a gap spanning the date boundary is accepted
+    even if it also skips the last bars of a trading date or the first bars of the next one.
+
+    Args:
+        timestamps (pd.DatetimeIndex): The timestamps, sorted in increasing order.
+        interval (Union[YfinanceInterval, str]): The size of the interval between consecutive timestamps.
+        session_aware (bool): Whether to accept gaps between two consecutive trading dates.
+        session_timezone (Union[None, str]): The timezone of the exchange to take the trading dates in (e.g.
+            'America/New_York'), for timezone-aware timestamps.
+        max_session_gap (timedelta): The longest accepted gap between two consecutive trading dates, not counting the
+            weekend days.
+
+    Returns:
+        run_starts (np.ndarray): The position of the start of the contiguous segment of each row.
+
+    """
+
+    step = interval_step(interval=interval)
+    if len(timestamps) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if isinstance(step, pd.DateOffset):
+        consecutive = np.asarray(timestamps[1:] == timestamps[:-1] + step)
+    else:
+        timestamps_ns = np.asarray(timestamps.values, dtype="datetime64[ns]").view(np.int64)
+        consecutive = np.diff(timestamps_ns) == pd.Timedelta(step).value
+        if session_aware and step <= timedelta(days=1):
+            local_timestamps = timestamps
+            if timestamps.tz is not None:
+                if session_timezone is not None:
+                    local_timestamps = local_timestamps.tz_convert(session_timezone)
+                local_timestamps = local_timestamps.tz_localize(None)
+            dates = np.asarray(local_timestamps.values, dtype="datetime64[D]")
+            business_days = np.busday_count(dates[:-1], dates[1:])
+            # Weekend days from the first to the second trading date included, e.g. Saturday and Sunday for Friday to
+            # Sunday evening (futures) or Friday to Monday
+            weekend_days = (dates[1:] - dates[:-1]).astype(np.int64) + 1 - np.busday_count(dates[:-1], dates[1:] + 1)
+            session_gaps = np.diff(timestamps_ns) - weekend_days * pd.Timedelta(days=1).value
+            next_trading_date = (
+                (dates[1:] != dates[:-1]) & (business_days <= 1) & (session_gaps <= pd.Timedelta(max_session_gap).value)
+            )
+            consecutive |= next_trading_date
+
+    segment_starts = np.ones(len(timestamps), dtype=bool)
+    segment_starts[1:] = ~consecutive
+    return np.maximum.accumulate(np.where(segment_starts, np.arange(len(timestamps)), 0))
+
+
+def consecutive_windows(run_starts: np.ndarray, window_length: int) -> np.ndarray:
+    """Check, for every window of window_length rows, if all its timestamps are consecutive. A window is consecutive if
+    its last row belongs to a segment that starts at or before its first row, a constant-time lookup in the run-length
+    index.
+
+    Args:
+        run_starts (np.ndarray): The run-length index of the timestamps, as returned by contiguous_run_starts().
+        window_length (int): The number of rows in each window.
+
+    Returns:
+        windows_are_consecutive (np.ndarray): For each window (indexed by its first row), True if all its timestamps
+            are consecutive, False otherwise.
+
+    """
+
+    if window_length < 1:
+        raise ValueError("Parameter 'window_length' must be a strictly positive integer (>= 1).")
+    nb_windows = max(len(run_starts) - window_length + 1, 0)
+    return run_starts[window_length - 1 : window_length - 1 + nb_windows] <= np.arange(nb_windows)
+
+
+def combine_tickers_data(
+    tickers_data: Dict[str, pd.DataFrame],
+    tickers: Union[str, List[str]],
+    group_by: Union[YfinanceGroupBy, str] = YfinanceGroupBy.COLUMN,
+) -> pd.DataFrame:
+    """Combine the historical prices time series of individual tickers into a single pandas DataFrame, formatted as
+    returned by yfinance.download() for the same tickers and group_by parameters. Tickers without data have all-NaN
+    columns.
+
+    Args:
+        tickers_data (Dict[str, pd.DataFrame]): The historical prices time series of each ticker.
+        tickers (Union[str, List[str]]): The ticker(s) in the order requested.
+        group_by (Union[YfinanceGroupBy, str]): Group values in df by 'column' or 'ticker' for multiple tickers.
+
+    Returns:
+        data (pd.DataFrame): The combined historical prices time series.
+
+    """
+
+    if isinstance(group_by, YfinanceGroupBy):
+        group_by = group_by.value
+    if isinstance(tickers, str):
+        tickers = [tickers]
+
+    if len(tickers) == 1:
+        return tickers_data[tickers[0]]
+
+    # Tickers without data (e.g. failed downloads) are kept as all-NaN columns, as yfinance.download() does
+    reference_data = next((data for data in tickers_data.values() if not data.columns.empty), None)
+    frames = {}
+    for ticker in tickers:
+        ticker_data = tickers_data[ticker]
+        if ticker_data.columns.empty and reference_data is not None:
+            ticker_data = reference_data.iloc[:0]
+        if isinstance(ticker_data.index, pd.DatetimeIndex) and ticker_data.index.tz is not None:
+            ticker_data = ticker_data.tz_convert("UTC")
+        frames[ticker] = ticker_data
+    data = pd.concat(frames, axis=1).sort_index()
+    if group_by == YfinanceGroupBy.COLUMN.value:
+        data = data.swaplevel(axis=1).sort_index(axis=1)
+    return data
+
+
+def period_start(period: Union[YfinancePeriod, str], end: pd.Timestamp) -> Union[None, pd.Timestamp]:
+    """Get the timestamp at which a yfinance period starts, for a time series ending at the given timestamp.
+
+    Args:
+        period (Union[YfinancePeriod, str]): The period of the time series (e.g. '729d', '1wk', '1mo', '5y', 'max').
+        end (pd.Timestamp): The end of the time series.
+
+    Returns:
+        start (Union[None, pd.Timestamp]): The start of the period, None if the period is unbounded ('max').
+
+    """
+
+    if isinstance(period, YfinancePeriod):
+        period = period.value
+    if period == YfinancePeriod.MAX.value:
+        return None
+    units = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+    for suffix, unit in units.items():
+        if period.endswith(suffix) and period[: -len(suffix)].isdigit():
+            return end - pd.DateOffset(**{unit: int(period[: -len(suffix)])})
+    raise ValueError(f"Invalid period '{period}'.")
+
+
+def merge_new_bars(data: pd.DataFrame, new_data: pd.DataFrame, period: Union[YfinancePeriod, str]) -> pd.DataFrame:
+    """Merge newly downloaded bars into a historical prices time series. Overlapping bars are deduplicated by keeping
+    the newly downloaded values (which account for late revisions of the last bar), and bars older than the period
+    before the last timestamp are dropped.
+
+    Args:
+        data (pd.DataFrame): The existing historical prices time series.
+        new_data (pd.DataFrame): The newly downloaded bars for the same ticker.
+        period (Union[YfinancePeriod, str]): The period that the merged time series should cover.
+
+    Returns:
+        merged_data (pd.DataFrame): The merged historical prices time series.
+
+    """
+
+    if new_data.empty:
+        return data
+    if data.index.tz is not None and new_data.index.tz is not None:
+        new_data = new_data.tz_convert(data.index.tz)
+    merged_data = pd.concat([data, new_data.reindex(columns=data.columns)])
+    merged_data = merged_data[~merged_data.index.duplicated(keep="last")].sort_index()
+    start = period_start(period=period, end=merged_data.index[-1])
+    if start is not None:
+        merged_data = merged_data[merged_data.index >= start]
+    return merged_data
@@ -1,10 +1,10 @@
 """Methods to conduct statistical hypothesis testing on observed data."""
 
 from math import sqrt
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
-from scipy.stats import norm
+from scipy.stats import beta, norm
 from statsmodels.stats.diagnostic import lilliefors
 
 
@@ -101,3 +101,169 @@ def two_sample_t_test(
     )
     p_value = 1 - norm.cdf(t_value)
     return p_value < 1 - confidence_level, p_value
+
+
+def one_sample_t_test_batch(
+    samples: np.ndarray, population_mean: Union[float, np.ndarray], confidence_level: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Conduct the right-tailed one-sample T-test of one_sample_t_test() on each row of a 2-D array at once (e.g. one
+    row per tickers configuration), with the same formula and the same handling of samples with zero variance.
+
+    Args:
+        samples (np.ndarray): The observed samples to test, of shape (nb_tests, sample_size).
+        population_mean (Union[float, np.ndarray]): The theoretical mean of the population, or one mean per sample.
+        confidence_level (float): The confidence level of the T-tests.
+
+    Returns:
+        rejected_null_hypothesis (np.ndarray): True for each sample where the null hypothesis is rejected.
+        p_values (np.ndarray): The p-value calculated through the one-sample T-test of each sample.
+
+    """
+
+    if not 0.5 < confidence_level < 1:
+        raise ValueError("Confidence level for T-test must be between 0.5 and 1 (exclusive).")
+
+    samples = np.asarray(samples, dtype=float)
+    if samples.ndim != 2 or samples.shape[1] == 0:
+        raise ValueError("Samples passed to one-sample T-test must be a 2-D array of non-empty rows.")
+
+    constant = (samples == samples[:, :1]).all(axis=1)  # Standard deviation is zero, we reject the null hypothesis
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_values = (samples.mean(axis=1) - population_mean) / (samples.std(axis=1) / sqrt(samples.shape[1]))
+    p_values = np.where(constant, 0.0, 1 - norm.cdf(t_values))
+    return p_values < 1 - confidence_level, p_values
+
+
+def two_sample_t_test_batch(
+    samples_1: np.ndarray, samples_2: np.ndarray, confidence_level: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Conduct the right-tailed two-sample T-test of two_sample_t_test() between each pair of rows of two 2-D arrays at
+    once, with the same formula and the same handling of samples with zero variance.
+
+    Args:
+        samples_1 (np.ndarray): The first observed samples to test, of shape (nb_tests, sample_1_size).
+        samples_2 (np.ndarray): The second observed samples to test, of shape (nb_tests, sample_2_size).
+        confidence_level (float): The confidence level of the T-tests.
+
+    Returns:
+        rejected_null_hypothesis (np.ndarray): True for each pair of samples where the null hypothesis is rejected.
+        p_values (np.ndarray): The p-value calculated through the two-sample T-test of each pair of samples.
+
+    """
+
+    if not 0.5 < confidence_level < 1:
+        raise ValueError("Confidence level for T-test must be between 0.5 and 1 (exclusive).")
+
+    samples_1 = np.asarray(samples_1, dtype=float)
+    samples_2 = np.asarray(samples_2, dtype=float)
+    if (
+        samples_1.ndim != 2
+        or samples_2.ndim != 2
+        or len(samples_1) != len(samples_2)
+        or samples_1.shape[1] == 0
+        or samples_2.shape[1] == 0
+    ):
+        raise ValueError(
+            "Samples passed to two-sample T-test must be 2-D arrays of non-empty rows, with the same number of rows."
+        )
+
+    constant_1 = (samples_1 == samples_1[:, :1]).all(axis=1)
+    constant_2 = (samples_2 == samples_2[:, :1]).all(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_values = np.abs(samples_1.mean(axis=1) - samples_2.mean(axis=1)) / np.sqrt(
+            (samples_1.std(axis=1) / samples_1.shape[1]) + (samples_2.std(axis=1) / samples_2.shape[1])
+        )
+    p_values = 1 - norm.cdf(t_values)
+    both_constant = constant_1 & constant_2
+    p_values[both_constant] = np.where(samples_1[both_constant, 0] == samples_2[both_constant, 0], 0.5, 0.0)
+    return p_values < 1 - confidence_level, p_values
+
+
+def permutation_test(
+    sample_1: List[float],
+    sample_2: List[float],
+    confidence_level: float = 0.95,
+    nb_permutations: int = 10000,
+    paired: bool = False,
+    batch_size: int = 1000,
+    early_stopping: bool = True,
+    random_state: Union[None, int, np.random.Generator] = None,
+) -> Tuple[bool, float]:
+    """Conduct a two-sided permutation test to determine if the difference between the mean of two samples is
+    statistically significant, without assuming that the samples come from Gaussian (normal) distributions. The null
+    hypothesis is that both samples come from the same distribution, so that the observations are exchangeable between
+    them: the absolute difference of means is computed for random reassignments of the pooled observations, and the
+    p-value is the proportion of reassignments at least as extreme as the observed samples. In paired mode (e.g. both
+    approaches evaluated on the same Monte-Carlo samples), the signs of the pairwise differences are flipped instead.
+
+    The permutations are drawn in batches, each batch as a single index matrix (or sign matrix) evaluated in one
+    vectorized operation. With early stopping, no more batches are drawn once a 99.9% Clopper-Pearson interval for the
+    p-value lies entirely on one side of (1 - confidence_level), i.e. once the decision cannot reasonably change.
+
+    Args:
+        sample_1 (List[float]): The first observed sample to test.
+        sample_2 (List[float]): The second observed sample to test.
+        confidence_level (float): The confidence level of the permutation test.
+        nb_permutations (int): The maximum number of permutations to draw.
+        paired (bool): Whether the observations of both samples are paired, samples must then have the same length.
+        batch_size (int): The number of permutations drawn and evaluated at once.
+        early_stopping (bool): Whether to stop drawing permutations once the decision is settled.
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator, for reproducible results.
+
+    Returns:
+        rejected_null_hypothesis (bool): True if the null hypothesis is rejected (p_value < (1 - confidence_level)).
+        p_value (float): The p-value calculated through this permutation test.
+
+    """
+
+    if not 0.5 < confidence_level < 1:
+        raise ValueError("Confidence level for permutation test must be between 0.5 and 1 (exclusive).")
+
+    if len(sample_1) == 0 or len(sample_2) == 0:
+        raise ValueError("Samples passed to permutation test must not be empty.")
+
+    if paired and len(sample_1) != len(sample_2):
+        raise ValueError("Samples passed to paired permutation test must have the same length.")
+
+    if not isinstance(nb_permutations, int) or nb_permutations < 1:
+        raise ValueError("Parameter 'nb_permutations' must be a strictly positive integer (>= 1).")
+
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("Parameter 'batch_size' must be a strictly positive integer (>= 1).")
+
+    rng = np.random.default_rng(random_state)
+    sample_1 = np.asarray(sample_1, dtype=float)
+    sample_2 = np.asarray(sample_2, dtype=float)
+    alpha = 1 - confidence_level
+
+    if paired:
+        differences = sample_1 - sample_2
+        observed = abs(differences.mean())
+    else:
+        pooled = np.concatenate([sample_1, sample_2])
+        observed = abs(sample_1.mean() - sample_2.mean())
+    # Tolerance so that permutations reproducing the observed statistic count as extreme despite rounding errors
+    threshold = observed - 1e-12 * max(1.0, observed)
+
+    nb_extreme, nb_drawn = 0, 0
+    while nb_drawn < nb_permutations:
+        size = min(batch_size, nb_permutations - nb_drawn)
+        if paired:
+            signs = rng.choice(np.array([-1.0, 1.0]), size=(size, len(differences)))
+            statistics = np.abs(signs @ differences) / len(differences)
+        else:
+            # One row per permutation of the pooled observations: the first len(sample_1) go to the first sample
+            permutations = rng.random((size, len(pooled))).argsort(axis=1)
+            sums_1 = pooled[permutations[:, : len(sample_1)]].sum(axis=1)
+            statistics = np.abs(sums_1 / len(sample_1) - (pooled.sum() - sums_1) / len(sample_2))
+        nb_extreme += int(np.count_nonzero(statistics >= threshold))
+        nb_drawn += size
+
+        if early_stopping and nb_drawn < nb_permutations:
+            lower = beta.ppf(0.0005, nb_extreme, nb_drawn - nb_extreme + 1) if nb_extreme > 0 else 0.0
+            upper = beta.ppf(0.9995, nb_extreme + 1, nb_drawn - nb_extreme) if nb_extreme < nb_drawn else 1.0
+            if upper < alpha or lower > alpha:
+                break
+
+    p_value = (nb_extreme + 1) / (nb_drawn + 1)
+    return p_value < alpha, p_value
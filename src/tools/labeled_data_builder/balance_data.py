@@ -1,16 +1,47 @@
 """Method(s) to balance labeled data."""
 
-from collections import Counter
-from random import randint
+from typing import Union
 
+import numpy as np
 import pandas as pd
 
 
-def undersample(labeled_data: pd.DataFrame) -> pd.DataFrame:
+def undersample_index(labels: np.ndarray, random_state: Union[None, int, np.random.Generator] = None) -> np.ndarray:
+    """Get the positions of the samples to keep to balance binary classification labels using under-sampling. The
+    surplus samples of the majority class are drawn in a single vectorized draw, without replacement.
+
+    Args:
+        labels (np.ndarray): The classification label of each sample.
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator, for reproducible results.
+
+    Returns:
+        balanced_index (np.ndarray): The sorted positions of the samples kept in the balanced data.
+
+    """
+
+    classes, counts = np.unique(labels, return_counts=True)
+
+    if len(classes) > 2:
+        raise ValueError(
+            f"The given labeled_data does not represent a binary classification problem ({len(classes)} classes)."
+        )
+    elif len(classes) < 2 or counts[0] == counts[1]:
+        return np.arange(len(labels))
+
+    majority_positions = np.flatnonzero(labels == classes[np.argmax(counts)])
+    rng = np.random.default_rng(random_state)
+    dropped_positions = rng.choice(majority_positions, size=abs(counts[0] - counts[1]), replace=False)
+    kept = np.ones(len(labels), dtype=bool)
+    kept[dropped_positions] = False
+    return np.flatnonzero(kept)
+
+
+def undersample(labeled_data: pd.DataFrame, random_state: Union[None, int, np.random.Generator] = None) -> pd.DataFrame:
     """Balance a classification dataset using under-sampling. We assume binary classification.
 
     Args:
         labeled_data (pd.DataFrame): The original (unbalanced) labeled data.
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator, for reproducible results.
 
     Returns:
         balanced_data (pd.DataFrame): The modified balanced labeled data.
@@ -20,20 +51,7 @@ def undersample(labeled_data: pd.DataFrame) -> pd.DataFrame:
     if "label_classification" not in labeled_data.columns:
         raise ValueError("The given labeled_data does not contain a 'label_classification' column.")
 
-    class_distribution = Counter(labeled_data["label_classification"].values).most_common()
-
-    if len(class_distribution) > 2:
-        raise ValueError(
-            f"The given labeled_data does not represent a binary classification problem "
-            f"({len(class_distribution)} classes)."
-        )
-    elif len(class_distribution) < 2:
+    balanced_index = undersample_index(labels=labeled_data["label_classification"].values, random_state=random_state)
+    if len(balanced_index) == len(labeled_data):
         return labeled_data
-
-    while class_distribution[0][1] > class_distribution[1][1]:
-        i = randint(0, len(labeled_data) - 1)
-        if labeled_data.iloc[i]["label_classification"] == class_distribution[0][0]:
-            labeled_data = labeled_data.drop(labeled_data.index[i])
-            class_distribution = Counter(labeled_data["label_classification"].values).most_common()
-
-    return labeled_data
+    return labeled_data.iloc[balanced_index]
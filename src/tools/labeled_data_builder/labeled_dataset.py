@@ -0,0 +1,112 @@
+"""Class to hold labeled data for time series forecasting as dense NumPy arrays."""
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+APPROACHES = ["individual", "sector"]
+
+
+class LabeledDataset:
+    """Class Labeled Dataset.
+
+    Labeled data backed by contiguous arrays: features of shape (nb_samples, features_length, nb_features) for both the
+    'individual' and 'sector' approaches, and one label vector for classification and regression. Avoids storing one
+    Python list per sample, and exposes the features as 2-D arrays directly usable by scikit-learn models.
+    """
+
+    def __init__(
+        self,
+        timestamps: pd.DatetimeIndex,
+        features_individual: np.ndarray,
+        features_sector: np.ndarray,
+        label_classification: np.ndarray,
+        label_regression: np.ndarray,
+    ) -> None:
+        """Constructor for class LabeledDataset. Check that all arrays describe the same number of samples.
+
+        Args:
+            timestamps (pd.DatetimeIndex): The timestamp of the label of each sample.
+            features_individual (np.ndarray): The features for the individual approach, of shape
+                (nb_samples, features_length, nb_features_individual).
+            features_sector (np.ndarray): The features for the sector approach, of shape
+                (nb_samples, features_length, nb_features_sector).
+            label_classification (np.ndarray): The boolean label of each sample (positive change or not).
+            label_regression (np.ndarray): The continuous label of each sample (the change itself).
+        """
+        nb_samples = len(timestamps)
+        if (
+            features_individual.ndim != 3
+            or features_sector.ndim != 3
+            or not len(features_individual) == len(features_sector) == nb_samples
+            or not len(label_classification) == len(label_regression) == nb_samples
+        ):
+            raise ValueError(
+                "Features must be 3-D arrays, and all parameters must have the same number of samples (first axis)."
+            )
+        self.timestamps = timestamps
+        self.features_individual = np.ascontiguousarray(features_individual)
+        self.features_sector = np.ascontiguousarray(features_sector)
+        self.label_classification = np.asarray(label_classification, dtype=bool)
+        self.label_regression = np.asarray(label_regression, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def features(self, approach: str) -> np.ndarray:
+        """Get the features of an approach as a 2-D array of shape (nb_samples, features_length * nb_features), each row
+        being the flattened window of a sample. The array is a view, the features are not copied.
+
+        Args:
+            approach (str): The approach to get the features for, 'individual' or 'sector'.
+
+        Returns:
+            features (np.ndarray): The 2-D features array.
+
+        """
+        if approach not in APPROACHES:
+            raise ValueError(f"Parameter 'approach' must be one of {APPROACHES}.")
+        features = self.features_individual if approach == "individual" else self.features_sector
+        return features.reshape(features.shape[0], features.shape[1] * features.shape[2])
+
+    def take(self, index: Union[np.ndarray, list]) -> "LabeledDataset":
+        """Select samples by position, e.g. to build the train and test subsets of a sample.
+
+        Args:
+            index (Union[np.ndarray, list]): The positions of the samples to select, or a boolean mask.
+
+        Returns:
+            labeled_dataset (LabeledDataset): A new LabeledDataset containing the selected samples.
+
+        """
+        index = np.asarray(index)
+        if index.dtype != bool:
+            index = index.astype(np.intp)
+        return LabeledDataset(
+            timestamps=self.timestamps[index],
+            features_individual=self.features_individual[index],
+            features_sector=self.features_sector[index],
+            label_classification=self.label_classification[index],
+            label_regression=self.label_regression[index],
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the labeled data to a pandas DataFrame indexed by timestamp, with one list of features per cell.
+
+        Returns:
+            labeled_data (pd.DataFrame): The labeled data, contains a columns for features_individual, features_sector,
+                label_classification and label_regression.
+
+        """
+        labeled_data = pd.DataFrame(
+            data={
+                "timestamp": list(self.timestamps),
+                "features_individual": [list(features) for features in self.features("individual")],
+                "features_sector": [list(features) for features in self.features("sector")],
+                "label_classification": list(self.label_classification),
+                "label_regression": list(self.label_regression),
+            }
+        ).set_index("timestamp")
+        labeled_data.index = pd.DatetimeIndex(labeled_data.index)
+        return labeled_data
@@ -1,11 +1,78 @@
-"""Method to generate simulated samples from a dataset, using Monte-Carlo Cross-Validation."""
+"""Methods to generate simulated samples from a dataset, using Monte-Carlo Cross-Validation."""
 
 from random import sample
-from typing import Tuple
+from typing import List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
+def generate_train_test_index(nb_rows: int, train_percentage: float = 0.8) -> Tuple[List[int], List[int]]:
+    """Generate a new random partition of row positions between train and test data, using Monte-Carlo
+    Cross-Validation. All positions from 0 to nb_rows - 1 are used in the partition.
+
+    Args:
+        nb_rows (int): The number of rows in the original data to sample from.
+        train_percentage (float): Proportion of labeled data going into the train dataset, between 0 and 1 inclusive.
+
+    Returns:
+        train_index (List[int]): The positions of the rows in the train subset sample.
+        test_index (List[int]): The positions of the rows in the test subset sample.
+
+    """
+
+    if not 0 <= train_percentage <= 1:
+        raise ValueError("Parameter 'train_percentage' must be a number between 0 and 1 inclusive.")
+
+    test_size = int((1 - train_percentage) * nb_rows)
+    test_index = sample(range(nb_rows), test_size)
+    is_test = np.zeros(nb_rows, dtype=bool)
+    is_test[test_index] = True
+    train_index = np.flatnonzero(~is_test).tolist()
+
+    return train_index, test_index
+
+
+def generate_train_test_masks(
+    nb_rows: int,
+    nb_samples: int,
+    train_percentage: float = 0.8,
+    random_state: Union[None, int, np.random.Generator] = None,
+) -> np.ndarray:
+    """Generate all the random partitions of row positions between train and test data up front, using Monte-Carlo
+    Cross-Validation. Each sample is one row of a boolean matrix, in which True marks the rows of the test subset and
+    False the rows of the train subset, so that a sample is selected with mask (test) and ~mask (train).
+
+    Args:
+        nb_rows (int): The number of rows in the original data to sample from.
+        nb_samples (int): The number of samples (partitions) to generate.
+        train_percentage (float): Proportion of labeled data going into the train dataset, between 0 and 1 inclusive.
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator, for reproducible results.
+
+    Returns:
+        test_masks (np.ndarray): Boolean matrix of shape (nb_samples, nb_rows), True for the rows in the test subset.
+
+    """
+
+    if not 0 <= train_percentage <= 1:
+        raise ValueError("Parameter 'train_percentage' must be a number between 0 and 1 inclusive.")
+    if nb_samples < 0:
+        raise ValueError("Parameter 'nb_samples' must be a positive integer (>= 0).")
+
+    test_size = int((1 - train_percentage) * nb_rows)
+    test_masks = np.zeros((nb_samples, nb_rows), dtype=bool)
+    if test_size == 0:
+        return test_masks
+
+    # The test rows of each sample are the positions of its test_size smallest random keys, found in linear time
+    rng = np.random.default_rng(random_state)
+    keys = rng.random((nb_samples, nb_rows))
+    test_positions = np.argpartition(keys, min(test_size, nb_rows - 1), axis=1)[:, :test_size]
+    np.put_along_axis(test_masks, test_positions, True, axis=1)
+
+    return test_masks
+
+
 def generate_train_test_sample(data: pd.DataFrame, train_percentage: float = 0.8) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Generate a new simulated sample from the given data, using Monte-Carlo Cross-Validation. The generated sample
     differentiates a new random partition between train and test data, the entire original dataset is used in the
@@ -21,12 +88,8 @@ def generate_train_test_sample(data: pd.DataFrame, train_percentage: float = 0.8
 
     """
 
-    if not 0 <= train_percentage <= 1:
-        raise ValueError("Parameter 'train_percentage' must be a number between 0 and 1 inclusive.")
-
-    test_size = int((1 - train_percentage) * len(data))
-    test_index = sample(list(range(len(data))), test_size)
-    train_data = data.iloc[[i for i in range(len(data)) if i not in test_index]]
+    train_index, test_index = generate_train_test_index(nb_rows=len(data), train_percentage=train_percentage)
+    train_data = data.iloc[train_index]
     test_data = data.iloc[test_index]
 
     return train_data, test_data
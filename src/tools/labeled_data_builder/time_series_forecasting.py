@@ -1,22 +1,28 @@
-"""Method to build labeled data from a DataFrame for time series forecasting."""
+"""Methods to build labeled data from a DataFrame for time series forecasting."""
 
-import math
-from typing import List
+from typing import List, Union
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
-from src.tools.constants import PriceAttribute
-from src.tools.helper_methods import consecutive_timestamps
-from src.tools.labeled_data_builder.balance_data import undersample
+from src.tools.constants import PriceAttribute, YfinanceInterval
+from src.tools.helper_methods import consecutive_windows, contiguous_run_starts
+from src.tools.labeled_data_builder.balance_data import undersample_index
+from src.tools.labeled_data_builder.labeled_dataset import LabeledDataset
 
 
-def create_labeled_data(
+def create_labeled_dataset(
     attribute_label: PriceAttribute,
     ticker_label: str,
     tickers_features: List[str],
     data: pd.DataFrame,
     features_length: int,
-) -> pd.DataFrame:
+    random_state: Union[None, int, np.random.Generator] = None,
+    run_starts: Union[None, np.ndarray] = None,
+    interval: Union[YfinanceInterval, str] = YfinanceInterval.ONE_HOUR,
+    session_aware: bool = False,
+) -> LabeledDataset:
     """Create labeled data for time series forecasting, using given historical data for a ticker, using features_length
     previous values in the time series as features_individual and features_sector and the next value as label. We build
     features for both the individual and sector approach, so that both approaches use the same data points, to allow for
@@ -28,10 +34,16 @@ def create_labeled_data(
         tickers_features (List[str]): The codes for the assets we want to use as features_sector for the prediction.
         data (pd.DataFrame): The historical time series for the tickers.
         features_length (int): The number of previous rows to use as features_sector to predict the next one (label).
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator for the under-sampling.
+        run_starts (Union[None, np.ndarray]): The run-length index of the contiguous segments of data.index, as
+            returned by contiguous_run_starts() ; computed if not provided, pass it to reuse it across calls.
+        interval (Union[YfinanceInterval, str]): The interval between two consecutive rows of data.
+        session_aware (bool): Whether windows may span the gap between two consecutive trading dates, taken in the
+            timezone of data.index (see contiguous_run_starts(), and pass run_starts to use the exchange timezone).
 
     Returns:
-        labeled_data (pd.DataFrame): The created labeled data, contains a columns for features_individual,
-            features_sector, label and true_return.
+        labeled_dataset (LabeledDataset): The created labeled data, as dense arrays of features_individual,
+            features_sector, label_classification and label_regression.
 
     """
 
@@ -52,34 +64,84 @@ def create_labeled_data(
     if ticker_label not in tickers_features:
         tickers_features.append(ticker_label)
 
-    timestamp = []
-    features_individual = []
-    features_sector = []
-    label = []
-    true_return = []
-    for i in range(len(data) - features_length):
-        features_data_slice = data[tickers_features].iloc[i : i + features_length]
-        if (
-            not math.isnan(data[(ticker_label, attribute_label.value)].iloc[i + features_length])
-            and True not in [math.isnan(value) for value in features_data_slice.values.flatten()]
-            and consecutive_timestamps(data[tickers_features].iloc[i : i + features_length + 1].index)
-        ):
-            timestamp.append(data.index[i + features_length])
-            features_individual.append(list(features_data_slice[ticker_label].values.flatten()))
-            features_sector.append(list(features_data_slice.values.flatten()))
-            label.append(data[(ticker_label, attribute_label.value)].iloc[i + features_length] > 0)
-            true_return.append(data[(ticker_label, attribute_label.value)].iloc[i + features_length])
-    labeled_data = pd.DataFrame(
-        data={
-            "timestamp": timestamp,
-            "features_individual": features_individual,
-            "features_sector": features_sector,
-            "label_classification": label,
-            "label_regression": true_return,
-        }
-    ).set_index("timestamp")
-    labeled_data.index = pd.DatetimeIndex(labeled_data.index)
+    # All windows are built at once as zero-copy strided views over one contiguous array, shaped
+    # (nb_windows, features_length, nb_columns), and their validity is computed with vectorized reductions.
+    features_data = data[tickers_features]
+    features_values = np.ascontiguousarray(features_data.to_numpy(dtype=float))
+    label_values = data[(ticker_label, attribute_label.value)].to_numpy(dtype=float)[features_length:]
+    individual_columns = features_data.columns.get_level_values(0) == ticker_label
+    nb_windows = max(len(data) - features_length, 0)
+
+    if nb_windows > 0:
+        windows = sliding_window_view(features_values, features_length, axis=0)[:nb_windows].transpose(0, 2, 1)
+        # Number of rows containing a NaN in each window, as a difference of running counts.
+        nan_rows_count = np.concatenate([[0], np.cumsum(np.isnan(features_values).any(axis=1))])
+        nan_windows = nan_rows_count[features_length : features_length + nb_windows] != nan_rows_count[:nb_windows]
+        # A window and its label are valid if their features_length + 1 timestamps are consecutive (1 interval apart).
+        if run_starts is None:
+            run_starts = contiguous_run_starts(timestamps=data.index, interval=interval, session_aware=session_aware)
+        consecutive = consecutive_windows(run_starts=run_starts, window_length=features_length + 1)
+        valid_windows = ~np.isnan(label_values) & ~nan_windows & consecutive
+    else:
+        windows = np.empty((0, features_length, features_values.shape[1]))
+        valid_windows = np.zeros(0, dtype=bool)
+
+    selected_windows = windows[valid_windows]
+    labeled_dataset = LabeledDataset(
+        timestamps=pd.DatetimeIndex(data.index[features_length:][valid_windows], name="timestamp"),
+        features_individual=selected_windows[:, :, individual_columns],
+        features_sector=selected_windows,
+        label_classification=label_values[valid_windows] > 0,
+        label_regression=label_values[valid_windows],
+    )
 
     if attribute_label == PriceAttribute.CLOSE:
-        return undersample(labeled_data=labeled_data)
-    return labeled_data
+        return labeled_dataset.take(
+            undersample_index(labels=labeled_dataset.label_classification, random_state=random_state)
+        )
+    return labeled_dataset
+
+
+def create_labeled_data(
+    attribute_label: PriceAttribute,
+    ticker_label: str,
+    tickers_features: List[str],
+    data: pd.DataFrame,
+    features_length: int,
+    random_state: Union[None, int, np.random.Generator] = None,
+    run_starts: Union[None, np.ndarray] = None,
+    interval: Union[YfinanceInterval, str] = YfinanceInterval.ONE_HOUR,
+    session_aware: bool = False,
+) -> pd.DataFrame:
+    """Create labeled data for time series forecasting, as a pandas DataFrame with one list of features per cell. See
+    create_labeled_dataset() for the dense array representation.
+
+    Args:
+        attribute_label (PriceAttribute): The price attribute we want to predict for (the label).
+        ticker_label (str): The code for the asset we want to predict for (the label).
+        tickers_features (List[str]): The codes for the assets we want to use as features_sector for the prediction.
+        data (pd.DataFrame): The historical time series for the tickers.
+        features_length (int): The number of previous rows to use as features_sector to predict the next one (label).
+        random_state (Union[None, int, np.random.Generator]): Seed or random generator for the under-sampling.
+        run_starts (Union[None, np.ndarray]): The run-length index of the contiguous segments of data.index, as
+            returned by contiguous_run_starts() ; computed if not provided.
+        interval (Union[YfinanceInterval, str]): The interval between two consecutive rows of data.
+        session_aware (bool): Whether windows may span the gap between two consecutive trading dates.
+
+    Returns:
+        labeled_data (pd.DataFrame): The created labeled data, contains a columns for features_individual,
+            features_sector, label and true_return.
+
+    """
+
+    return create_labeled_dataset(
+        attribute_label=attribute_label,
+        ticker_label=ticker_label,
+        tickers_features=tickers_features,
+        data=data,
+        features_length=features_length,
+        random_state=random_state,
+        run_starts=run_starts,
+        interval=interval,
+        session_aware=session_aware,
+    ).to_dataframe()
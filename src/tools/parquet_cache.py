@@ -0,0 +1,190 @@
+"""Class to cache historical prices data on disk, as partitioned Parquet datasets."""
+
+import json
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+from typing import Union
+
+import pandas as pd
+
+from src.tools.constants import YfinanceInterval, YfinancePeriod
+
+CACHE_INFO_FILE_NAME = "_cache_info.json"
+TIMESTAMP_COLUMN = "timestamp"
+PARTITION_COLUMN = "year"
+
+
+class ParquetCache:
+    """Class Parquet cache.
+
+    Stores the historical prices time series of each (ticker, interval) pair as a Parquet dataset partitioned by year,
+    in the directory '<cache_dir>/<interval>/<ticker>/'. A cache entry is served only if it was retrieved for the same
+    period and is not older than max_age (freshness policy).
+    """
+
+    def __init__(self, cache_dir: str, max_age: timedelta = timedelta(hours=1)) -> None:
+        """Constructor for class ParquetCache.
+
+        Args:
+            cache_dir (str): The root directory of the cache on disk, created if it does not exist.
+            max_age (timedelta): The maximum age of a cache entry to be considered fresh.
+        """
+        if max_age < timedelta(0):
+            raise ValueError("Parameter 'max_age' must be a positive duration.")
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_dir(self, ticker: str, interval: Union[YfinanceInterval, str]) -> str:
+        """Get the directory of the cache entry for a (ticker, interval) pair.
+
+        Args:
+            ticker (str): The ticker of the asset.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+
+        Returns:
+            entry_dir (str): The path to the directory of the cache entry.
+
+        """
+        if isinstance(interval, YfinanceInterval):
+            interval = interval.value
+        return os.path.join(self.cache_dir, interval, ticker)
+
+    def get_info(self, ticker: str, interval: Union[YfinanceInterval, str]) -> Union[None, dict]:
+        """Get the information stored alongside a cache entry (period, retrieval time, index name).
+
+        Args:
+            ticker (str): The ticker of the asset.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+
+        Returns:
+            info (Union[None, dict]): The information of the cache entry, None if the entry does not exist.
+
+        """
+        info_path = os.path.join(self._entry_dir(ticker=ticker, interval=interval), CACHE_INFO_FILE_NAME)
+        if not os.path.isfile(info_path):
+            return None
+        with open(info_path, "r") as file:
+            return json.load(file)
+
+    def is_fresh(self, ticker: str, period: Union[YfinancePeriod, str], interval: Union[YfinanceInterval, str]) -> bool:
+        """Check if the cache entry for a (ticker, interval) pair exists, was retrieved for the given period and is not
+        older than max_age.
+
+        Args:
+            ticker (str): The ticker of the asset.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+
+        Returns:
+            fresh (bool): True if the cache entry can be served, False otherwise.
+
+        """
+        if isinstance(period, YfinancePeriod):
+            period = period.value
+        info = self.get_info(ticker=ticker, interval=interval)
+        if info is None or info["period"] != period:
+            return False
+        fetched_at = datetime.fromisoformat(info["fetched_at"])
+        return datetime.now(tz=timezone.utc) - fetched_at <= self.max_age
+
+    def read(self, ticker: str, interval: Union[YfinanceInterval, str]) -> Union[None, pd.DataFrame]:
+        """Read the cached time series for a (ticker, interval) pair, regardless of its freshness.
+
+        Args:
+            ticker (str): The ticker of the asset.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+
+        Returns:
+            data (Union[None, pd.DataFrame]): The cached historical prices time series, None if not cached.
+
+        """
+        info = self.get_info(ticker=ticker, interval=interval)
+        if info is None:
+            return None
+        data = pd.read_parquet(self._entry_dir(ticker=ticker, interval=interval))
+        data = data.drop(columns=PARTITION_COLUMN).set_index(TIMESTAMP_COLUMN).sort_index()
+        data.index.name = info["index_name"]
+        return data[info["columns"]]
+
+    def load(
+        self, ticker: str, period: Union[YfinancePeriod, str], interval: Union[YfinanceInterval, str]
+    ) -> Union[None, pd.DataFrame]:
+        """Load the cached time series for a (ticker, interval) pair, if the cache entry is fresh for this period.
+
+        Args:
+            ticker (str): The ticker of the asset.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+
+        Returns:
+            data (Union[None, pd.DataFrame]): The cached historical prices time series, None if there is no fresh entry.
+
+        """
+        if not self.is_fresh(ticker=ticker, period=period, interval=interval):
+            return None
+        return self.read(ticker=ticker, interval=interval)
+
+    def store(
+        self,
+        ticker: str,
+        period: Union[YfinancePeriod, str],
+        interval: Union[YfinanceInterval, str],
+        data: pd.DataFrame,
+    ) -> None:
+        """Store the time series for a (ticker, interval) pair, replacing any existing cache entry.
+
+        Args:
+            ticker (str): The ticker of the asset.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+            data (pd.DataFrame): The historical prices time series for the ticker, indexed by timestamp.
+
+        """
+        if isinstance(period, YfinancePeriod):
+            period = period.value
+        if data.empty:
+            raise ValueError("Cannot cache an empty DataFrame.")
+
+        entry_dir = self._entry_dir(ticker=ticker, interval=interval)
+        tmp_dir = f"{entry_dir}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        frame = data.copy()
+        frame.index.name = TIMESTAMP_COLUMN
+        frame = frame.reset_index()
+        frame[PARTITION_COLUMN] = frame[TIMESTAMP_COLUMN].dt.year
+        frame.to_parquet(tmp_dir, partition_cols=[PARTITION_COLUMN], index=False)
+        info = {
+            "period": period,
+            "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
+            "index_name": data.index.name,
+            "columns": list(data.columns),
+        }
+        with open(os.path.join(tmp_dir, CACHE_INFO_FILE_NAME), "w") as file:
+            json.dump(info, file)
+
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+
+    def invalidate(self, ticker: Union[None, str] = None, interval: Union[None, YfinanceInterval, str] = None) -> None:
+        """Remove cache entries. If neither ticker nor interval are given, the whole cache is cleared.
+
+        Args:
+            ticker (Union[None, str]): The ticker of the entries to remove ; all tickers if not provided.
+            interval (Union[None, YfinanceInterval, str]): The interval of the entries to remove ; all intervals if not
+                provided.
+
+        """
+        if isinstance(interval, YfinanceInterval):
+            interval = interval.value
+        intervals = [interval] if interval is not None else os.listdir(self.cache_dir)
+        for interval_name in intervals:
+            interval_dir = os.path.join(self.cache_dir, interval_name)
+            if not os.path.isdir(interval_dir):
+                continue
+            if ticker is None:
+                shutil.rmtree(interval_dir)
+            else:
+                shutil.rmtree(os.path.join(interval_dir, ticker), ignore_errors=True)
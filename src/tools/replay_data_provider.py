@@ -0,0 +1,179 @@
+"""Class to replay financial data from a local snapshot directory, without network access."""
+
+import os
+import pickle
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval, YfinancePeriod
+from src.tools.helper_methods import build_changes_data, combine_tickers_data, period_start
+from src.tools.yfinance_data_provider import YfinanceDataProvider
+
+
+class ReplayDataProvider:
+    """Class replay data provider.
+
+    Same interface as YfinanceDataProvider, but historical prices are read from a snapshot directory containing one
+    pickled pandas DataFrame per (ticker, interval) pair, at '<snapshot_dir>/<interval>/<ticker>.pickle', as returned by
+    yfinance.download() for this single ticker. Periods are counted back from the last timestamp of each snapshot, so
+    that results are reproducible.
+    """
+
+    def __init__(self, snapshot_dir: str) -> None:
+        """Constructor for class ReplayDataProvider.
+
+        Args:
+            snapshot_dir (str): The directory containing the snapshots.
+        """
+        if not os.path.isdir(snapshot_dir):
+            raise ValueError(f"Snapshot directory '{snapshot_dir}' does not exist.")
+        self.snapshot_dir = snapshot_dir
+
+    @staticmethod
+    def _snapshot_path(snapshot_dir: str, ticker: str, interval: str) -> str:
+        """Get the path to the snapshot file of a (ticker, interval) pair.
+
+        Args:
+            snapshot_dir (str): The directory containing the snapshots.
+            ticker (str): The ticker of the asset.
+            interval (str): The size of the interval between each data point.
+
+        Returns:
+            snapshot_path (str): The path to the snapshot file.
+
+        """
+        return os.path.join(snapshot_dir, interval, f"{ticker}.pickle")
+
+    def get_data(
+        self,
+        tickers: Union[str, List[str]],
+        period: Union[YfinancePeriod, str],
+        interval: Union[YfinanceInterval, str],
+        group_by: Union[YfinanceGroupBy, str] = YfinanceGroupBy.COLUMN,
+    ) -> pd.DataFrame:
+        """Get historical prices data from the snapshot directory.
+
+        Args:
+            tickers (Union[str, List[str]]): The ticker for the asset(s) to retrieve historical prices for.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+            group_by (Union[YfinanceGroupBy, str]): Group values in df by 'column' or 'ticker' if getting data for
+                multiple tickers.
+
+        Returns:
+            data (pd.DataFrame): The historical prices time series, formatted as returned by yfinance.
+
+        """
+
+        if not tickers:
+            raise ValueError("Parameter 'tickers' cannot be empty.")
+
+        if isinstance(interval, YfinanceInterval):
+            interval = interval.value
+
+        tickers_data = {}
+        for ticker in [tickers] if isinstance(tickers, str) else tickers:
+            snapshot_path = self._snapshot_path(snapshot_dir=self.snapshot_dir, ticker=ticker, interval=interval)
+            if not os.path.isfile(snapshot_path):
+                raise ValueError(f"No snapshot for ticker '{ticker}' and interval '{interval}'.")
+            with open(snapshot_path, "rb") as file:
+                ticker_data = pickle.load(file)
+            start = period_start(period=period, end=ticker_data.index[-1]) if not ticker_data.empty else None
+            tickers_data[ticker] = ticker_data[ticker_data.index >= start] if start is not None else ticker_data
+
+        return combine_tickers_data(tickers_data=tickers_data, tickers=tickers, group_by=group_by)
+
+    def get_hourly_changes(
+        self,
+        attributes: List[PriceAttribute],
+        tickers: List[str],
+        period: Union[YfinancePeriod, str] = YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
+        dtype: Union[type, str] = np.float64,
+    ) -> pd.DataFrame:
+        """Get historical hourly prices for tickers, from the snapshot directory, and calculate hourly changes for the
+        selected price attribute.
+
+        Args:
+            attributes (List[PriceAttribute]): The price attribute(s) (column(s)) to retrieve hourly data for.
+            tickers (List[str]): The ticker for the asset(s) to retrieve hourly historical prices for.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            dtype (Union[type, str]): The floating point type of the changes (e.g. np.float32 to halve memory usage).
+
+        Returns:
+            changes_data (pd.DataFrame): The calculated hourly changes (percentage) time series.
+
+        """
+
+        return self.get_changes(
+            attributes=attributes, tickers=tickers, period=period, interval=YfinanceInterval.ONE_HOUR, dtype=dtype
+        )
+
+    def get_changes(
+        self,
+        attributes: List[PriceAttribute],
+        tickers: List[str],
+        period: Union[YfinancePeriod, str],
+        interval: Union[YfinanceInterval, str],
+        dtype: Union[type, str] = np.float64,
+    ) -> pd.DataFrame:
+        """Get historical prices for tickers at any interval, from the snapshot directory, and calculate the changes of
+        each data point for the selected price attribute.
+
+        Args:
+            attributes (List[PriceAttribute]): The price attribute(s) (column(s)) to retrieve data for.
+            tickers (List[str]): The ticker for the asset(s) to retrieve historical prices for.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+            dtype (Union[type, str]): The floating point type of the changes (e.g. np.float32 to halve memory usage).
+
+        Returns:
+            changes_data (pd.DataFrame): The calculated changes (percentage) time series.
+
+        """
+
+        if not attributes:
+            raise ValueError("Parameter 'attributes' cannot be empty.")
+
+        data = self.get_data(
+            tickers=tickers,
+            period=period,
+            interval=interval,
+            group_by=YfinanceGroupBy.TICKER,
+        )
+
+        return build_changes_data(attributes=attributes, tickers=tickers, data=data, dtype=dtype)
+
+    @staticmethod
+    def record_snapshot(
+        tickers: List[str],
+        period: Union[YfinancePeriod, str],
+        interval: Union[YfinanceInterval, str],
+        snapshot_dir: str,
+    ) -> None:
+        """Download historical prices data from Yahoo Finance and save it in the snapshot directory, one file per
+        ticker, so that it can be replayed later.
+
+        Args:
+            tickers (List[str]): The tickers for the assets to save historical prices for.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+            snapshot_dir (str): The directory to save the snapshots in.
+
+        """
+
+        if isinstance(interval, YfinanceInterval):
+            interval = interval.value
+
+        data = YfinanceDataProvider.get_data(
+            tickers=tickers, period=period, interval=interval, group_by=YfinanceGroupBy.TICKER
+        )
+        os.makedirs(os.path.join(snapshot_dir, interval), exist_ok=True)
+        for ticker in tickers:
+            ticker_data = data[ticker].dropna(how="all") if len(tickers) > 1 else data
+            snapshot_path = ReplayDataProvider._snapshot_path(
+                snapshot_dir=snapshot_dir, ticker=ticker, interval=interval
+            )
+            with open(snapshot_path, "wb") as file:
+                pickle.dump(ticker_data, file)
@@ -1,10 +1,62 @@
 """Statistical evaluation framework to assess the performance of prediction models."""
 
-from typing import List
+from typing import List, Tuple
 
+import numpy as np
 from sklearn import metrics
 
 
+def boolean_classification_scores(
+    y_true: np.ndarray, y_predicted: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the accuracy and the weighted average precision, recall and F1 score of boolean predictions, from the
+    2x2 confusion matrix counted with NumPy boolean operations. The scores are the same as the 'accuracy' and 'weighted
+    avg' scores of sklearn.metrics.classification_report(zero_division=0), without its validation and report building.
+    The counts are taken along the last axis, so that several sets of predictions can be scored at once.
+
+    Args:
+        y_true (np.ndarray): The true values for the predicted label (boolean).
+        y_predicted (np.ndarray): The predicted values for the label (boolean), same shape as y_true.
+
+    Returns:
+        accuracy (np.ndarray): The accuracy of the predictions.
+        precision (np.ndarray): The precision of each class, weighted by its number of true instances.
+        recall (np.ndarray): The recall of each class, weighted by its number of true instances.
+        f1_score (np.ndarray): The F1 score of each class, weighted by its number of true instances.
+
+    """
+    y_true = np.asarray(y_true, dtype=bool)
+    y_predicted = np.asarray(y_predicted, dtype=bool)
+    nb_predictions = y_true.shape[-1]
+    true_positives = np.count_nonzero(y_true & y_predicted, axis=-1)
+    support_true = np.count_nonzero(y_true, axis=-1)
+    predicted_true = np.count_nonzero(y_predicted, axis=-1)
+    true_negatives = nb_predictions - support_true - predicted_true + true_positives
+    support_false = nb_predictions - support_true
+    predicted_false = nb_predictions - predicted_true
+
+    def divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        # Scores with a zero denominator are set to 0, as with zero_division=0
+        return np.divide(numerator, denominator, out=np.zeros(np.shape(numerator)), where=denominator != 0)
+
+    def weighted_average(score_false: np.ndarray, score_true: np.ndarray) -> np.ndarray:
+        return (score_false * support_false + score_true * support_true) / nb_predictions
+
+    accuracy = (true_positives + true_negatives) / nb_predictions
+    precision_false = divide(true_negatives, predicted_false)
+    precision_true = divide(true_positives, predicted_true)
+    recall_false = divide(true_negatives, support_false)
+    recall_true = divide(true_positives, support_true)
+    # Same formula as sklearn (harmonic mean of precision and recall), for identical floating point results
+    f1_score_false = divide(2 * precision_false * recall_false, precision_false + recall_false)
+    f1_score_true = divide(2 * precision_true * recall_true, precision_true + recall_true)
+
+    precision = weighted_average(precision_false, precision_true)
+    recall = weighted_average(recall_false, recall_true)
+    f1_score = weighted_average(f1_score_false, f1_score_true)
+    return accuracy, precision, recall, f1_score
+
+
 class ClassificationEvaluation:
     """Class Classification Evaluation.
 
@@ -15,8 +67,9 @@ class ClassificationEvaluation:
     accuracy, precision, recall, f1_score = 0, 0, 0, 0
 
     def __init__(self, y_true: List[bool], y_predicted: List[bool]) -> None:
-        """Constructor for class ClassificationEvaluation. Check the length of the list parameters, compute the
-        classification report from sklearn.methods, and extract relevant scores as instance variables.
+        """Constructor for class ClassificationEvaluation. Check the length of the list parameters, and compute the
+        relevant scores as instance variables: directly from the confusion matrix for boolean predictions, otherwise
+        from the classification report from sklearn.metrics.
 
         Args:
             y_true (List[bool]): The true values for the predicted label.
@@ -25,10 +78,25 @@ class ClassificationEvaluation:
         self._validate_predictions_length(y_true=y_true, y_predicted=y_predicted)
         self.y_true = y_true
         self.y_predicted = y_predicted
-        self.classification_report = metrics.classification_report(
-            y_true=y_true, y_pred=y_predicted, output_dict=True, zero_division=0
-        )
-        self._extract_scores_from_classification_report()
+        self._classification_report = None
+        y_true_array = np.asarray(y_true)
+        y_predicted_array = np.asarray(y_predicted)
+        if y_true_array.dtype == bool and y_predicted_array.dtype == bool:
+            scores = boolean_classification_scores(y_true=y_true_array, y_predicted=y_predicted_array)
+            self.accuracy, self.precision, self.recall, self.f1_score = (float(score) for score in scores)
+        else:
+            self._extract_scores_from_classification_report()
+
+    @property
+    def classification_report(self) -> dict:
+        """The classification report from sklearn.metrics, as a dictionary. Only computed on first access, as the
+        scores of boolean predictions do not need it.
+        """
+        if self._classification_report is None:
+            self._classification_report = metrics.classification_report(
+                y_true=self.y_true, y_pred=self.y_predicted, output_dict=True, zero_division=0
+            )
+        return self._classification_report
 
     @staticmethod
     def _validate_predictions_length(y_true: List, y_predicted: List) -> None:
@@ -58,3 +126,44 @@ class ClassificationEvaluation:
             f"Recall: {self.recall}\n"
             f"F1 Score: {self.f1_score}"
         )
+
+
+class BatchClassificationEvaluation:
+    """Class Batch Classification Evaluation.
+
+    Assess the performance of many sets of boolean predictions at once (e.g. one per Monte-Carlo sample), from stacked
+    matrices of true values and predicted values, in a single vectorized computation. Scores are the same as those of
+    ClassificationEvaluation for each set of predictions, as arrays.
+    """
+
+    def __init__(self, y_true: np.ndarray, y_predicted: np.ndarray) -> None:
+        """Constructor for class BatchClassificationEvaluation. Check the shape of the matrix parameters, and compute
+        the scores of each set of predictions as instance variables.
+
+        Args:
+            y_true (np.ndarray): The true values for the predicted label, of shape (nb_sets, nb_predictions).
+            y_predicted (np.ndarray): The predicted values for the label, of shape (nb_sets, nb_predictions).
+        """
+        y_true = np.asarray(y_true, dtype=bool)
+        y_predicted = np.asarray(y_predicted, dtype=bool)
+        if y_true.ndim != 2 or y_true.shape != y_predicted.shape or y_true.size == 0:
+            raise ValueError("Parameters 'y_true' and 'y_predicted' must be non-empty 2-D arrays of same shape.")
+        self.y_true = y_true
+        self.y_predicted = y_predicted
+        self.accuracy, self.precision, self.recall, self.f1_score = boolean_classification_scores(
+            y_true=y_true, y_predicted=y_predicted
+        )
+
+    def __len__(self) -> int:
+        return len(self.y_true)
+
+    def __getitem__(self, index: int) -> ClassificationEvaluation:
+        return ClassificationEvaluation(y_true=list(self.y_true[index]), y_predicted=list(self.y_predicted[index]))
+
+    def __str__(self) -> str:
+        return (
+            f"Mean accuracy: {self.accuracy.mean()}\n"
+            f"Mean precision: {self.precision.mean()}\n"
+            f"Mean recall: {self.recall.mean()}\n"
+            f"Mean F1 Score: {self.f1_score.mean()}"
+        )
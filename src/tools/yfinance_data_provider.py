@@ -1,16 +1,30 @@
 """Class to get financial data from Yahoo Finance, using the yfinance Python API."""
 
-from typing import List, Union
+from typing import Dict, List, Union
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval, YfinancePeriod
-from src.tools.helper_methods import extract_changes_from_dataframe
+from src.tools.download_scheduler import DownloadScheduler
+from src.tools.helper_methods import build_changes_data, combine_tickers_data, merge_new_bars
+from src.tools.parquet_cache import ParquetCache
 
 
 class YfinanceDataProvider:
-    """Class yfinance data provider."""
+    """Class yfinance data provider.
+
+    If a ParquetCache is assigned to the 'cache' class attribute, historical prices are retrieved per ticker and fresh
+    cache entries are served from disk instead of being downloaded again from Yahoo Finance. Stale cache entries are
+    refreshed by only downloading the bars after their last stored timestamp.
+
+    If a DownloadScheduler is assigned to the 'download_scheduler' class attribute, tickers are downloaded in parallel,
+    one request per ticker with retries, and merged into a single DataFrame aligned on timestamps.
+    """
+
+    cache: Union[None, ParquetCache] = None
+    download_scheduler: Union[None, DownloadScheduler] = None
 
     @staticmethod
     def get_data(
@@ -43,6 +57,16 @@ class YfinanceDataProvider:
         if isinstance(group_by, YfinanceGroupBy):
             group_by = group_by.value
 
+        if YfinanceDataProvider.cache is not None:
+            return YfinanceDataProvider._get_cached_data(
+                tickers=tickers, period=period, interval=interval, group_by=group_by
+            )
+        if YfinanceDataProvider.download_scheduler is not None:
+            tickers_data = YfinanceDataProvider._download_tickers(
+                tickers=[tickers] if isinstance(tickers, str) else list(tickers), interval=interval, period=period
+            )
+            return combine_tickers_data(tickers_data=tickers_data, tickers=tickers, group_by=group_by)
+
         # Invalid request to yf.download() will return a pandas DataFrame with named columns but empty values (no rows).
         data = yf.download(
             tickers=tickers, period=period, interval=interval, group_by=group_by, ignore_tz=False, progress=False
@@ -50,11 +74,106 @@ class YfinanceDataProvider:
 
         return data
 
+    @staticmethod
+    def _get_cached_data(tickers: Union[str, List[str]], period: str, interval: str, group_by: str) -> pd.DataFrame:
+        """Get historical prices data from the cache, downloading (and caching) only the tickers without a fresh cache
+        entry.
+
+        Args:
+            tickers (Union[str, List[str]]): The ticker for the asset(s) to retrieve historical prices for.
+            period (str): The period of the time series.
+            interval (str): The size of the interval between each data point.
+            group_by (str): Group values in df by 'column' or 'ticker' if getting data for multiple tickers.
+
+        Returns:
+            data (pd.DataFrame): The historical prices time series, formatted as returned by yfinance.
+
+        """
+
+        cache = YfinanceDataProvider.cache
+        tickers_list = [tickers] if isinstance(tickers, str) else list(tickers)
+        tickers_data = {}
+        stale_tickers_data = {}
+        for ticker in tickers_list:
+            if cache.is_fresh(ticker=ticker, period=period, interval=interval):
+                tickers_data[ticker] = cache.read(ticker=ticker, interval=interval)
+            elif (cache.get_info(ticker=ticker, interval=interval) or {}).get("period") == period:
+                stale_tickers_data[ticker] = cache.read(ticker=ticker, interval=interval)
+
+        # Stale entries for the same period only need the bars from their last stored timestamp onwards. The last
+        # stored bar is downloaded again, as it may have been incomplete (or revised) when it was first retrieved.
+        if stale_tickers_data:
+            start = min(ticker_data.index[-1] for ticker_data in stale_tickers_data.values())
+            new_data = YfinanceDataProvider._download_tickers(
+                tickers=list(stale_tickers_data.keys()), interval=interval, start=start
+            )
+            for ticker, ticker_data in stale_tickers_data.items():
+                tickers_data[ticker] = merge_new_bars(data=ticker_data, new_data=new_data[ticker], period=period)
+                # A failed refresh (no bars downloaded) must not mark the stale entry as fresh again
+                if not new_data[ticker].empty:
+                    cache.store(ticker=ticker, period=period, interval=interval, data=tickers_data[ticker])
+
+        missing_tickers = [ticker for ticker in tickers_list if ticker not in tickers_data]
+        if missing_tickers:
+            downloaded_data = YfinanceDataProvider._download_tickers(
+                tickers=missing_tickers, interval=interval, period=period
+            )
+            for ticker, ticker_data in downloaded_data.items():
+                if not ticker_data.empty:
+                    cache.store(ticker=ticker, period=period, interval=interval, data=ticker_data)
+            tickers_data.update(downloaded_data)
+
+        return combine_tickers_data(tickers_data=tickers_data, tickers=tickers, group_by=group_by)
+
+    @staticmethod
+    def _download_tickers(
+        tickers: List[str],
+        interval: str,
+        period: Union[None, str] = None,
+        start: Union[None, pd.Timestamp] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Download historical prices data from Yahoo Finance, and split it into one time series per ticker. The time
+        series covers either the given period, or all bars from the given start timestamp until now.
+
+        Args:
+            tickers (List[str]): The tickers for the assets to retrieve historical prices for.
+            interval (str): The size of the interval between each data point.
+            period (Union[None, str]): The period of the time series ; used if start is not provided.
+            start (Union[None, pd.Timestamp]): The timestamp of the first bar to retrieve.
+
+        Returns:
+            tickers_data (Dict[str, pd.DataFrame]): The historical prices time series of each ticker.
+
+        """
+
+        if YfinanceDataProvider.download_scheduler is not None:
+            return YfinanceDataProvider.download_scheduler.download(
+                tickers=tickers, interval=interval, period=period, start=start
+            )
+
+        time_range = {"period": period} if start is None else {"start": start}
+        data = yf.download(
+            tickers=tickers,
+            interval=interval,
+            group_by=YfinanceGroupBy.TICKER.value,
+            ignore_tz=False,
+            progress=False,
+            **time_range,
+        )
+        if not isinstance(data.columns, pd.MultiIndex):
+            return {tickers[0]: data}
+        downloaded_tickers = set(data.columns.get_level_values(0))
+        return {
+            ticker: data[ticker].dropna(how="all") if ticker in downloaded_tickers else pd.DataFrame()
+            for ticker in tickers
+        }
+
     @staticmethod
     def get_hourly_changes(
         attributes: List[PriceAttribute],
         tickers: List[str],
         period: Union[YfinancePeriod, str] = YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS,
+        dtype: Union[type, str] = np.float64,
     ) -> pd.DataFrame:
         """Get historical hourly prices for tickers, from Yahoo Finance, and calculate hourly changes for the selected
         price attribute.
@@ -63,33 +182,48 @@ class YfinanceDataProvider:
             attributes (List[PriceAttribute]): The price attribute(s) (column(s)) to retrieve hourly data for.
             tickers (List[str]): The ticker for the asset(s) to retrieve hourly historical prices for.
             period (Union[YfinancePeriod, str]): The period of the time series.
+            dtype (Union[type, str]): The floating point type of the changes (e.g. np.float32 to halve memory usage).
 
         Returns:
             changes_data (pd.DataFrame): The calculated hourly changes (percentage) time series.
 
         """
 
+        return YfinanceDataProvider.get_changes(
+            attributes=attributes, tickers=tickers, period=period, interval=YfinanceInterval.ONE_HOUR, dtype=dtype
+        )
+
+    @staticmethod
+    def get_changes(
+        attributes: List[PriceAttribute],
+        tickers: List[str],
+        period: Union[YfinancePeriod, str],
+        interval: Union[YfinanceInterval, str],
+        dtype: Union[type, str] = np.float64,
+    ) -> pd.DataFrame:
+        """Get historical prices for tickers at any interval, from Yahoo Finance, and calculate the changes of each
+        data point for the selected price attribute.
+
+        Args:
+            attributes (List[PriceAttribute]): The price attribute(s) (column(s)) to retrieve data for.
+            tickers (List[str]): The ticker for the asset(s) to retrieve historical prices for.
+            period (Union[YfinancePeriod, str]): The period of the time series.
+            interval (Union[YfinanceInterval, str]): The size of the interval between each data point.
+            dtype (Union[type, str]): The floating point type of the changes (e.g. np.float32 to halve memory usage).
+
+        Returns:
+            changes_data (pd.DataFrame): The calculated changes (percentage) time series.
+
+        """
+
         if not attributes:
             raise ValueError("Parameter 'attributes' cannot be empty.")
 
         data = YfinanceDataProvider.get_data(
             tickers=tickers,
             period=period,
-            interval=YfinanceInterval.ONE_HOUR,
+            interval=interval,
             group_by=YfinanceGroupBy.TICKER,
         )
 
-        changes_data = pd.DataFrame()
-        for ticker in tickers:
-            ticker_data = data[ticker] if len(tickers) > 1 else data
-            for attribute in attributes:
-                ticker_changes_data = extract_changes_from_dataframe(attribute=attribute, data=ticker_data)
-                changes_data = pd.concat(
-                    [
-                        changes_data,
-                        pd.DataFrame(data={(ticker, attribute.value): ticker_changes_data}),
-                    ],
-                    ignore_index=False,
-                    axis=1,
-                )
-        return changes_data
+        return build_changes_data(attributes=attributes, tickers=tickers, data=data, dtype=dtype)
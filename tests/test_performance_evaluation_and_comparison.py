@@ -0,0 +1,238 @@
+"""Tests for methods in file performance_evaluation_and_comparison.py."""
+
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sklearn.dummy import DummyRegressor
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+from src.performance_evaluation_and_comparison import (
+    evaluate_and_compare_classification,
+    evaluate_and_compare_regression,
+)
+from src.tools.constants import PriceAttribute
+from src.tools.data_provider import set_data_provider
+from src.tools.evaluation_results import ResultsStore
+from src.tools.yfinance_data_provider import YfinanceDataProvider
+
+
+class SyntheticDataProvider:
+    """Data provider returning small random hourly changes, instead of downloading them."""
+
+    nb_rows = 400
+
+    @staticmethod
+    def get_changes(
+        attributes: List[PriceAttribute], tickers: List[str], period=None, interval=None, dtype=np.float64
+    ) -> pd.DataFrame:
+        index = pd.date_range("2023-01-02", periods=SyntheticDataProvider.nb_rows, freq="h", tz="UTC")
+        columns = pd.MultiIndex.from_product([tickers, [attribute.value for attribute in attributes]])
+        values = np.random.default_rng(0).normal(scale=0.01, size=(len(index), len(columns)))
+        return pd.DataFrame(data=values.astype(dtype), index=index, columns=columns)
+
+
+class TestPerformanceEvaluationAndComparison(TestCase):
+    """Test class for methods in file performance_evaluation_and_comparison.py."""
+
+    def setUp(self) -> None:
+        set_data_provider(SyntheticDataProvider)
+        self.forex_ticker = "EUR=X"
+        self.comdty_tickers = ["CL=F", "GC=F"]
+        self.temporary_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        set_data_provider(YfinanceDataProvider)
+        self.temporary_directory.cleanup()
+
+    # Tests for method evaluate_and_compare_classification()
+
+    def test_evaluate_and_compare_classification_independent_of_n_jobs(self):
+
+        # Act
+        result_1 = evaluate_and_compare_classification(
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=LogisticRegression(),
+            nb_samples=6,
+            random_state=42,
+            n_jobs=1,
+            verbose=False,
+        )
+        result_2 = evaluate_and_compare_classification(
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=LogisticRegression(),
+            nb_samples=6,
+            random_state=42,
+            n_jobs=2,
+            verbose=False,
+        )
+
+        # Assert
+        self.assertEqual(6, result_1.nb_samples)
+        self.assertEqual(result_1.config["data"], result_2.config["data"])
+        self.assertEqual(result_1.samples, result_2.samples)
+        self.assertEqual(result_1.tests, result_2.tests)
+
+    # Tests for method evaluate_and_compare_regression()
+
+    def test_evaluate_and_compare_regression_independent_of_n_jobs(self):
+
+        # Act
+        result_1 = evaluate_and_compare_regression(
+            attribute=PriceAttribute.CLOSE,
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=LinearRegression(),
+            nb_samples=6,
+            random_state=42,
+            n_jobs=1,
+            verbose=False,
+        )
+        result_2 = evaluate_and_compare_regression(
+            attribute=PriceAttribute.CLOSE,
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=LinearRegression(),
+            nb_samples=6,
+            random_state=42,
+            n_jobs=2,
+            verbose=False,
+        )
+
+        # Assert
+        self.assertEqual(6, result_1.nb_samples)
+        self.assertEqual(result_1.samples, result_2.samples)
+        self.assertEqual(result_1.tests, result_2.tests)
+
+    def test_evaluate_and_compare_regression_errors_paired_by_sample(self):
+
+        # Act
+        # The model ignores the features like the baseline: all approaches must have the same error on each sample
+        result = evaluate_and_compare_regression(
+            attribute=PriceAttribute.CLOSE,
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=DummyRegressor(strategy="mean"),
+            nb_samples=6,
+            random_state=42,
+            n_jobs=2,
+            verbose=False,
+        )
+
+        # Assert
+        self.assertEqual(6, len(set(result.samples["baseline"])))
+        self.assertEqual(result.samples["baseline"], result.samples["individual"])
+        self.assertEqual(result.samples["baseline"], result.samples["sector"])
+
+    def test_evaluate_and_compare_regression_check_every_less_than_four(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            evaluate_and_compare_regression(
+                attribute=PriceAttribute.CLOSE,
+                forex_ticker=self.forex_ticker,
+                comdty_tickers=self.comdty_tickers,
+                model=LinearRegression(),
+                nb_samples=12,
+                random_state=42,
+                check_every=3,
+                verbose=False,
+            )
+        self.assertEqual("Parameter 'check_every' must be an integer greater than or equal to 4.", str(e.exception))
+
+    def test_evaluate_and_compare_regression_sequential_early_stopping(self):
+
+        # Act
+        # Both approaches ignore the features: their difference is exactly zero, known precisely after the first block
+        result = evaluate_and_compare_regression(
+            attribute=PriceAttribute.CLOSE,
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=DummyRegressor(strategy="mean"),
+            nb_samples=12,
+            random_state=42,
+            check_every=4,
+            target_width=0.001,
+            verbose=False,
+        )
+
+        # Assert
+        self.assertEqual(4, result.nb_samples)
+        self.assertEqual(
+            {"stopped_early": True, "confidence_interval": [0.0, 0.0]}, result.tests["sequential_stopping"]
+        )
+        self.assertEqual({4}, {len(values) for values in result.samples.values()})
+
+    def test_evaluate_and_compare_regression_without_early_stopping(self):
+
+        # Act
+        result = evaluate_and_compare_regression(
+            attribute=PriceAttribute.CLOSE,
+            forex_ticker=self.forex_ticker,
+            comdty_tickers=self.comdty_tickers,
+            model=LinearRegression(),
+            nb_samples=8,
+            random_state=42,
+            check_every=4,
+            verbose=False,
+        )
+
+        # Assert
+        self.assertEqual(8, result.nb_samples)
+        self.assertFalse(result.tests["sequential_stopping"]["stopped_early"])
+
+    def test_evaluate_and_compare_regression_loaded_from_results_store(self):
+
+        # Arrange
+        results_store = ResultsStore(store_dir=self.temporary_directory.name)
+        parameters = {
+            "attribute": PriceAttribute.CLOSE,
+            "forex_ticker": self.forex_ticker,
+            "comdty_tickers": self.comdty_tickers,
+            "model": LinearRegression(),
+            "nb_samples": 6,
+            "random_state": 42,
+            "verbose": False,
+            "results_store": results_store,
+        }
+        result = evaluate_and_compare_regression(**parameters)
+
+        # Act
+        loaded_result = evaluate_and_compare_regression(**parameters)
+
+        # Assert
+        self.assertEqual(1, len(results_store.load_runs()))
+        self.assertEqual(result.config_hash, loaded_result.config_hash)
+        self.assertEqual(result.samples, loaded_result.samples)
+        self.assertEqual(result.timings, loaded_result.timings)
+        self.assertEqual(result.samples, results_store.load(config_hash=result.config_hash).samples)
+
+    def test_evaluate_and_compare_regression_results_store_other_data(self):
+
+        # Arrange
+        results_store = ResultsStore(store_dir=self.temporary_directory.name)
+        parameters = {
+            "attribute": PriceAttribute.CLOSE,
+            "forex_ticker": self.forex_ticker,
+            "comdty_tickers": self.comdty_tickers,
+            "model": LinearRegression(),
+            "nb_samples": 6,
+            "random_state": 42,
+            "verbose": False,
+            "results_store": results_store,
+        }
+        result = evaluate_and_compare_regression(**parameters)
+
+        # Act
+        with patch.object(SyntheticDataProvider, "nb_rows", 450):
+            other_result = evaluate_and_compare_regression(**parameters)
+
+        # Assert
+        self.assertEqual(2, len(results_store.load_runs()))
+        self.assertNotEqual(result.config_hash, other_result.config_hash)
+        self.assertEqual(450, other_result.config["data"]["nb_rows"])
@@ -3,9 +3,10 @@
 from collections import Counter
 from unittest import TestCase
 
+import numpy as np
 import pandas as pd
 
-from src.tools.labeled_data_builder.balance_data import undersample
+from src.tools.labeled_data_builder.balance_data import undersample, undersample_index
 
 
 class TestLabeledDataBuilderBalanceData(TestCase):
@@ -201,3 +202,47 @@ class TestLabeledDataBuilderBalanceData(TestCase):
 
         # Assert
         self.assertEqual({True: 1, False: 1}, dict(Counter(balanced_data["label_classification"].values)))
+
+    def test_undersample_random_state_reproducible(self):
+
+        # Arrange
+        labeled_data = pd.DataFrame(
+            data={
+                "Date": pd.date_range("2022-11-07", periods=20, freq="D"),
+                "label_classification": [True] * 15 + [False] * 5,
+            }
+        ).set_index("Date")
+
+        # Act
+        balanced_data_1 = undersample(labeled_data=labeled_data, random_state=42)
+        balanced_data_2 = undersample(labeled_data=labeled_data, random_state=42)
+
+        # Assert
+        self.assertTrue(balanced_data_1.equals(balanced_data_2))
+        self.assertTrue(balanced_data_1.index.is_monotonic_increasing)
+        self.assertEqual({True: 5, False: 5}, dict(Counter(balanced_data_1["label_classification"].values)))
+
+    # Tests for method undersample_index()
+
+    def test_undersample_index_keeps_minority_class(self):
+
+        # Arrange
+        labels = np.array([True, False, True, True, False, True, True])
+
+        # Act
+        balanced_index = undersample_index(labels=labels, random_state=np.random.default_rng(0))
+
+        # Assert
+        self.assertEqual(4, len(balanced_index))
+        self.assertIn(1, balanced_index)
+        self.assertIn(4, balanced_index)
+        self.assertEqual(sorted(balanced_index), list(balanced_index))
+        self.assertEqual(2, labels[balanced_index].sum())
+
+    def test_undersample_index_equal_distribution(self):
+
+        # Act
+        balanced_index = undersample_index(labels=np.array([True, False, False, True]))
+
+        # Assert
+        self.assertEqual([0, 1, 2, 3], list(balanced_index))
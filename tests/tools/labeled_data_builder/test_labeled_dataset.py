@@ -0,0 +1,125 @@
+"""Tests for methods in labeled_data_builder/labeled_dataset.py."""
+
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from src.tools.labeled_data_builder.labeled_dataset import LabeledDataset
+
+
+class TestLabeledDataBuilderLabeledDataset(TestCase):
+    """Test class for methods in class LabeledDataset."""
+
+    def setUp(self) -> None:
+        self.timestamps = pd.DatetimeIndex(
+            ["2022-11-07 12:00", "2022-11-07 13:00", "2022-11-07 14:00"], name="timestamp"
+        )
+        self.features_individual = np.array([[[-0.1], [0.08]], [[0.08], [-0.04]], [[-0.04], [0.22]]])
+        self.features_sector = np.array(
+            [[[0.1, -0.1], [-0.06, 0.08]], [[-0.06, 0.08], [-0.05, -0.04]], [[-0.05, -0.04], [0.05, 0.22]]]
+        )
+        self.label_regression = np.array([-0.04, 0.22, -0.12])
+        self.labeled_dataset = LabeledDataset(
+            timestamps=self.timestamps,
+            features_individual=self.features_individual,
+            features_sector=self.features_sector,
+            label_classification=self.label_regression > 0,
+            label_regression=self.label_regression,
+        )
+
+    # Tests for constructor
+
+    def test_constructor_different_number_of_samples(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            LabeledDataset(
+                timestamps=self.timestamps,
+                features_individual=self.features_individual[:2],
+                features_sector=self.features_sector,
+                label_classification=self.label_regression > 0,
+                label_regression=self.label_regression,
+            )
+        self.assertEqual(
+            "Features must be 3-D arrays, and all parameters must have the same number of samples (first axis).",
+            str(e.exception),
+        )
+
+    def test_constructor_features_not_3d(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            LabeledDataset(
+                timestamps=self.timestamps,
+                features_individual=self.features_individual.reshape(3, 2),
+                features_sector=self.features_sector,
+                label_classification=self.label_regression > 0,
+                label_regression=self.label_regression,
+            )
+
+    # Tests for method features()
+
+    def test_features_sector_is_2d_view(self):
+
+        # Act
+        features = self.labeled_dataset.features("sector")
+
+        # Assert
+        self.assertEqual((3, 4), features.shape)
+        self.assertEqual([0.1, -0.1, -0.06, 0.08], list(features[0]))
+        self.assertTrue(np.shares_memory(features, self.labeled_dataset.features_sector))
+
+    def test_features_invalid_approach(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            self.labeled_dataset.features("baseline")
+        self.assertEqual("Parameter 'approach' must be one of ['individual', 'sector'].", str(e.exception))
+
+    # Tests for method take()
+
+    def test_take_positions(self):
+
+        # Act
+        subset = self.labeled_dataset.take([2, 0])
+
+        # Assert
+        self.assertEqual(2, len(subset))
+        self.assertEqual(list(self.timestamps[[2, 0]]), list(subset.timestamps))
+        self.assertEqual([[-0.04, 0.22], [-0.1, 0.08]], subset.features("individual").tolist())
+        self.assertEqual([False, False], list(subset.label_classification))
+        self.assertEqual([-0.12, -0.04], list(subset.label_regression))
+
+    def test_take_empty(self):
+
+        # Act
+        subset = self.labeled_dataset.take([])
+
+        # Assert
+        self.assertEqual(0, len(subset))
+        self.assertEqual((0, 4), subset.features("sector").shape)
+
+    # Tests for method to_dataframe()
+
+    def test_to_dataframe(self):
+
+        # Act
+        labeled_data = self.labeled_dataset.to_dataframe()
+
+        # Assert
+        expected_labeled_data = pd.DataFrame(
+            data={
+                "timestamp": ["2022-11-07 12:00", "2022-11-07 13:00", "2022-11-07 14:00"],
+                "features_individual": [[-0.1, 0.08], [0.08, -0.04], [-0.04, 0.22]],
+                "features_sector": [
+                    [0.1, -0.1, -0.06, 0.08],
+                    [-0.06, 0.08, -0.05, -0.04],
+                    [-0.05, -0.04, 0.05, 0.22],
+                ],
+                "label_classification": [False, True, False],
+                "label_regression": [-0.04, 0.22, -0.12],
+            }
+        ).set_index("timestamp")
+        expected_labeled_data.index = pd.DatetimeIndex(expected_labeled_data.index)
+        self.assertTrue(expected_labeled_data.equals(labeled_data))
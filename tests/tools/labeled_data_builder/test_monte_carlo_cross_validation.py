@@ -2,9 +2,14 @@
 
 from unittest import TestCase
 
+import numpy as np
 import pandas as pd
 
-from src.tools.labeled_data_builder.monte_carlo_cross_validation import generate_train_test_sample
+from src.tools.labeled_data_builder.monte_carlo_cross_validation import (
+    generate_train_test_index,
+    generate_train_test_masks,
+    generate_train_test_sample,
+)
 
 
 class TestLabeledDataBuilderMonteCarloCrossValidation(TestCase):
@@ -119,3 +124,63 @@ class TestLabeledDataBuilderMonteCarloCrossValidation(TestCase):
         self.assertEqual(9, len(train_sample))
         self.assertEqual(2, len(test_sample))
         self.assertEqual(11, len(set(list(train_sample.index) + list(test_sample.index))))
+
+    # Tests for method generate_train_test_index()
+
+    def test_generate_train_test_index_train_percentage_greater_than_one(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            generate_train_test_index(nb_rows=10, train_percentage=1.1)
+        self.assertEqual("Parameter 'train_percentage' must be a number between 0 and 1 inclusive.", str(e.exception))
+
+    def test_generate_train_test_index_partition(self):
+
+        # Act
+        train_index, test_index = generate_train_test_index(nb_rows=11, train_percentage=0.8)
+
+        # Assert
+        self.assertEqual(9, len(train_index))
+        self.assertEqual(2, len(test_index))
+        self.assertEqual(set(range(11)), set(train_index) | set(test_index))
+
+    # Tests for method generate_train_test_masks()
+
+    def test_generate_train_test_masks_train_percentage_less_than_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            generate_train_test_masks(nb_rows=10, nb_samples=5, train_percentage=-0.1)
+        self.assertEqual("Parameter 'train_percentage' must be a number between 0 and 1 inclusive.", str(e.exception))
+
+    def test_generate_train_test_masks_shape_and_test_size(self):
+
+        # Act
+        test_masks = generate_train_test_masks(nb_rows=11, nb_samples=50, train_percentage=0.8, random_state=0)
+
+        # Assert
+        self.assertEqual((50, 11), test_masks.shape)
+        self.assertEqual(np.bool_, test_masks.dtype)
+        self.assertTrue((test_masks.sum(axis=1) == 2).all())
+        self.assertGreater(len({tuple(test_mask) for test_mask in test_masks}), 1)
+
+    def test_generate_train_test_masks_random_state_reproducible(self):
+
+        # Act
+        test_masks_1 = generate_train_test_masks(nb_rows=100, nb_samples=10, random_state=42)
+        test_masks_2 = generate_train_test_masks(nb_rows=100, nb_samples=10, random_state=42)
+
+        # Assert
+        np.testing.assert_array_equal(test_masks_1, test_masks_2)
+
+    def test_generate_train_test_masks_train_percentage_bounds(self):
+
+        # Act
+        test_masks_all_test = generate_train_test_masks(nb_rows=4, nb_samples=3, train_percentage=0)
+        test_masks_all_train = generate_train_test_masks(nb_rows=4, nb_samples=3, train_percentage=1)
+        test_masks_empty = generate_train_test_masks(nb_rows=0, nb_samples=3, train_percentage=0)
+
+        # Assert
+        self.assertTrue(test_masks_all_test.all())
+        self.assertFalse(test_masks_all_train.any())
+        self.assertEqual((3, 0), test_masks_empty.shape)
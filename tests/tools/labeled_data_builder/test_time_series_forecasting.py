@@ -3,10 +3,12 @@
 import math
 from unittest import TestCase
 
+import numpy as np
 import pandas as pd
 
 from src.tools.constants import PriceAttribute
-from src.tools.labeled_data_builder.time_series_forecasting import create_labeled_data
+from src.tools.helper_methods import contiguous_run_starts
+from src.tools.labeled_data_builder.time_series_forecasting import create_labeled_data, create_labeled_dataset
 
 
 class TestLabeledDataBuilderTimeSeriesForecasting(TestCase):
@@ -1110,3 +1112,138 @@ class TestLabeledDataBuilderTimeSeriesForecasting(TestCase):
         ).set_index("timestamp")
         expected_labeled_data.index = pd.DatetimeIndex(expected_labeled_data.index)
         self.assertTrue(expected_labeled_data.equals(labeled_data) or expected_labeled_data.equals(labeled_data))
+
+    # Tests for method create_labeled_dataset()
+
+    def test_create_labeled_dataset_dense_arrays(self):
+
+        # Arrange
+        data = pd.DataFrame(
+            data={
+                ("CL=F", "Close"): [0.1, math.nan, -0.05, 0.05, 0.2, -0.1],
+                ("EUR=X", "Close"): [-0.1, 0.08, -0.04, 0.22, -0.12, 0.05],
+            }
+        )
+        data.index = pd.DatetimeIndex(
+            pd.Series(
+                data=[
+                    "2022-11-07 10:00",
+                    "2022-11-07 11:00",
+                    "2022-11-07 12:00",
+                    "2022-11-07 13:00",
+                    "2022-11-07 14:00",
+                    "2022-11-07 15:00",
+                ],
+                name="Date",
+            )
+        )
+
+        # Act
+        labeled_dataset = create_labeled_dataset(
+            attribute_label=PriceAttribute.HIGH,
+            ticker_label="EUR=X",
+            tickers_features=["CL=F", "EUR=X"],
+            data=data.rename(columns={"Close": "High"}),
+            features_length=2,
+        )
+
+        # Assert
+        self.assertEqual((2, 2, 1), labeled_dataset.features_individual.shape)
+        self.assertEqual((2, 2, 2), labeled_dataset.features_sector.shape)
+        np.testing.assert_array_equal(
+            np.array([[-0.05, -0.04, 0.05, 0.22], [0.05, 0.22, 0.2, -0.12]]), labeled_dataset.features("sector")
+        )
+        np.testing.assert_array_equal(np.array([False, True]), labeled_dataset.label_classification)
+        np.testing.assert_array_equal(np.array([-0.12, 0.05]), labeled_dataset.label_regression)
+        self.assertEqual(
+            [pd.Timestamp("2022-11-07 14:00"), pd.Timestamp("2022-11-07 15:00")], list(labeled_dataset.timestamps)
+        )
+
+    def test_create_labeled_dataset_reuses_run_starts(self):
+
+        # Arrange
+        data = pd.DataFrame(
+            data={
+                ("CL=F", "High"): [0.1, 0.3, -0.05, 0.05, 0.2, -0.1],
+                ("EUR=X", "High"): [-0.1, 0.08, -0.04, 0.22, -0.12, 0.05],
+                ("GBP=X", "High"): [0.02, -0.07, 0.1, 0.01, -0.03, 0.04],
+            }
+        )
+        data.index = pd.DatetimeIndex(
+            [
+                "2022-11-07 10:00",
+                "2022-11-07 11:00",
+                "2022-11-07 12:00",
+                "2022-11-07 14:00",
+                "2022-11-07 15:00",
+                "2022-11-07 16:00",
+            ],
+            name="Date",
+        )
+        run_starts = contiguous_run_starts(timestamps=data.index)
+
+        for ticker_label in ["EUR=X", "GBP=X"]:
+
+            # Act
+            labeled_dataset = create_labeled_dataset(
+                attribute_label=PriceAttribute.HIGH,
+                ticker_label=ticker_label,
+                tickers_features=["CL=F", ticker_label],
+                data=data,
+                features_length=2,
+                run_starts=run_starts,
+            )
+
+            # Assert
+            self.assertEqual(
+                [pd.Timestamp("2022-11-07 12:00"), pd.Timestamp("2022-11-07 16:00")], list(labeled_dataset.timestamps)
+            )
+
+    def test_create_labeled_data_matches_explicit_loop(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            data=rng.normal(scale=0.01, size=(80, 4)),
+            columns=pd.MultiIndex.from_product([["CL=F", "EUR=X"], ["Close", "High"]]),
+            index=pd.date_range("2022-11-07 10:00", periods=80, freq="h", name="Date"),
+        )
+        data = data.drop(index=data.index[[30, 55]])  # Breaks in consecutiveness
+        data = data.mask(rng.random(data.shape) < 0.05)
+
+        for features_length in [1, 3, 5]:
+            expected_timestamps, expected_features_individual, expected_features_sector, expected_labels = (
+                [],
+                [],
+                [],
+                [],
+            )
+            for i in range(len(data) - features_length):
+                window = data[["CL=F", "EUR=X"]].iloc[i : i + features_length]
+                label = data[("EUR=X", "High")].iloc[i + features_length]
+                if (
+                    not math.isnan(label)
+                    and not np.isnan(window.values).any()
+                    and data.index[i + features_length] - data.index[i] == pd.Timedelta(hours=features_length)
+                ):
+                    expected_timestamps.append(data.index[i + features_length])
+                    expected_features_individual.append(list(window["EUR=X"].values.flatten()))
+                    expected_features_sector.append(list(window.values.flatten()))
+                    expected_labels.append(label)
+
+            # Act
+            labeled_data = create_labeled_data(
+                attribute_label=PriceAttribute.HIGH,
+                ticker_label="EUR=X",
+                tickers_features=["CL=F", "EUR=X"],
+                data=data,
+                features_length=features_length,
+            )
+
+            # Assert
+            self.assertGreater(len(expected_timestamps), 0)
+            self.assertEqual(expected_timestamps, list(labeled_data.index))
+            self.assertEqual(expected_features_individual, [list(x) for x in labeled_data["features_individual"]])
+            self.assertEqual(expected_features_sector, [list(x) for x in labeled_data["features_sector"]])
+            self.assertEqual(expected_labels, list(labeled_data["label_regression"]))
+            self.assertEqual([label > 0 for label in expected_labels], list(labeled_data["label_classification"]))
@@ -0,0 +1,176 @@
+"""Tests for methods in file bootstrap.py."""
+
+from unittest import TestCase
+
+import numpy as np
+from scipy import stats
+
+from src.tools.bootstrap import bootstrap_confidence_interval, sequential_stopping_check
+
+
+class TestBootstrap(TestCase):
+    """Test class for methods in file bootstrap.py."""
+
+    def setUp(self) -> None:
+        self.sample = list(np.random.default_rng(0).exponential(scale=1, size=30))
+
+    # Tests for method bootstrap_confidence_interval()
+
+    def test_bootstrap_confidence_interval_confidence_level_equals_one(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            bootstrap_confidence_interval(sample=self.sample, confidence_level=1)
+        self.assertEqual("Confidence level for bootstrap must be between 0 and 1 (exclusive).", str(e.exception))
+
+    def test_bootstrap_confidence_interval_sample_is_empty(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            bootstrap_confidence_interval(sample=[])
+        self.assertEqual("Sample passed to bootstrap must not be empty.", str(e.exception))
+
+    def test_bootstrap_confidence_interval_invalid_method(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            bootstrap_confidence_interval(sample=self.sample, method="basic")
+        self.assertEqual("Parameter 'method' must be one of ['percentile', 'bca'].", str(e.exception))
+
+    def test_bootstrap_confidence_interval_nb_resamples_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            bootstrap_confidence_interval(sample=self.sample, nb_resamples=0)
+        self.assertEqual("Parameter 'nb_resamples' must be a strictly positive integer (>= 1).", str(e.exception))
+
+    def test_bootstrap_confidence_interval_constant_sample(self):
+
+        # Act
+        confidence_interval = bootstrap_confidence_interval(sample=[0.5, 0.5, 0.5])
+
+        # Assert
+        self.assertEqual((0.5, 0.5), confidence_interval)
+
+    def test_bootstrap_confidence_interval_percentile_matches_scipy(self):
+
+        # Act
+        lower_bound, upper_bound = bootstrap_confidence_interval(
+            sample=self.sample, nb_resamples=20000, method="percentile", random_state=0
+        )
+
+        # Assert
+        expected = stats.bootstrap(
+            (np.array(self.sample),), np.mean, n_resamples=20000, method="percentile", random_state=0
+        ).confidence_interval
+        self.assertAlmostEqual(expected.low, lower_bound, delta=0.02)
+        self.assertAlmostEqual(expected.high, upper_bound, delta=0.02)
+
+    def test_bootstrap_confidence_interval_bca_matches_scipy(self):
+
+        # Act
+        lower_bound, upper_bound = bootstrap_confidence_interval(
+            sample=self.sample, nb_resamples=20000, method="bca", random_state=0
+        )
+
+        # Assert
+        expected = stats.bootstrap(
+            (np.array(self.sample),), np.mean, n_resamples=20000, method="BCa", random_state=0
+        ).confidence_interval
+        self.assertAlmostEqual(expected.low, lower_bound, delta=0.02)
+        self.assertAlmostEqual(expected.high, upper_bound, delta=0.02)
+
+    def test_bootstrap_confidence_interval_independent_of_n_jobs(self):
+
+        # Act
+        confidence_interval_1 = bootstrap_confidence_interval(
+            sample=self.sample, nb_resamples=2500, batch_size=1000, n_jobs=1, random_state=42
+        )
+        confidence_interval_2 = bootstrap_confidence_interval(
+            sample=self.sample, nb_resamples=2500, batch_size=1000, n_jobs=2, random_state=42
+        )
+
+        # Assert
+        self.assertEqual(confidence_interval_1, confidence_interval_2)
+
+    # Tests for method sequential_stopping_check()
+
+    def test_sequential_stopping_check_nb_looks_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            sequential_stopping_check(differences=self.sample, nb_looks=0)
+        self.assertEqual("Parameter 'nb_looks' must be a strictly positive integer (>= 1).", str(e.exception))
+
+    def test_sequential_stopping_check_target_width_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            sequential_stopping_check(differences=self.sample, nb_looks=5, target_width=0)
+        self.assertEqual("Parameter 'target_width' must be strictly positive.", str(e.exception))
+
+    def test_sequential_stopping_check_single_observation(self):
+
+        # Act
+        stop, confidence_interval = sequential_stopping_check(differences=[0.1], nb_looks=5)
+
+        # Assert
+        self.assertFalse(stop)
+        self.assertEqual((float("-inf"), float("inf")), confidence_interval)
+
+    def test_sequential_stopping_check_significant_difference(self):
+
+        # Arrange
+        differences = list(np.random.default_rng(0).normal(loc=0.05, scale=0.01, size=20))
+
+        # Act
+        stop, (lower_bound, upper_bound) = sequential_stopping_check(
+            differences=differences, nb_looks=5, random_state=0
+        )
+
+        # Assert
+        self.assertTrue(stop)
+        self.assertGreater(lower_bound, 0)
+
+    def test_sequential_stopping_check_inconclusive_difference(self):
+
+        # Arrange
+        differences = list(np.random.default_rng(0).normal(loc=0, scale=0.01, size=20))
+
+        # Act
+        stop, (lower_bound, upper_bound) = sequential_stopping_check(
+            differences=differences, nb_looks=5, random_state=0
+        )
+
+        # Assert
+        self.assertFalse(stop)
+        self.assertLess(lower_bound, 0)
+        self.assertGreater(upper_bound, 0)
+
+    def test_sequential_stopping_check_target_width_reached(self):
+
+        # Arrange
+        differences = list(np.random.default_rng(0).normal(loc=0, scale=0.01, size=20))
+
+        # Act
+        stop, (lower_bound, upper_bound) = sequential_stopping_check(
+            differences=differences, nb_looks=5, target_width=0.1, random_state=0
+        )
+
+        # Assert
+        self.assertTrue(stop)
+        self.assertLess(upper_bound - lower_bound, 0.1)
+
+    def test_sequential_stopping_check_bonferroni_adjustment_widens_interval(self):
+
+        # Act
+        _, (lower_bound_1, upper_bound_1) = sequential_stopping_check(
+            differences=self.sample, nb_looks=1, random_state=0
+        )
+        _, (lower_bound_10, upper_bound_10) = sequential_stopping_check(
+            differences=self.sample, nb_looks=10, random_state=0
+        )
+
+        # Assert
+        self.assertLess(lower_bound_10, lower_bound_1)
+        self.assertGreater(upper_bound_10, upper_bound_1)
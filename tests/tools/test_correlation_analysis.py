@@ -6,12 +6,20 @@ import pickle
 from unittest import TestCase
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 from scipy.stats import pearsonr
 
 from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval, YfinancePeriod
 from src.tools.correlation_analysis import (
     correlation_analysis_lists_cardinal_product,
+    correlation_analysis_lists_cardinal_product_columns,
     correlation_analysis_single_combination,
+    correlation_matrix,
+    cross_correlation_matrix,
+    lead_lag_analysis_lists_cardinal_product,
+    rolling_correlation_analysis_lists_cardinal_product,
+    rolling_correlation_matrix,
 )
 
 
@@ -599,3 +607,393 @@ class TestCorrelationAnalysis(TestCase):
             self.assertIsInstance(p_value, float)
             self.assertTrue(0 <= p_value <= 1)
             self.assertEqual(expected_data_length[i], data_length)
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_correlation_analysis_lists_cardinal_product_matches_single_combination(self, mock_get_data_method):
+
+        # Arrange
+        self.load_data_cardinal_product()
+        list_ticker1 = ["CL=F", "GC=F"]
+        list_ticker2 = ["EUR=X", "CADUSD=X", "GBP=X"]
+        mock_get_data_method.side_effect = self.mock_get_data_side_effect
+
+        # Act
+        correlations = correlation_analysis_lists_cardinal_product(
+            list_ticker1=list_ticker1,
+            list_ticker2=list_ticker2,
+            column_ticker1=PriceAttribute.CLOSE,
+            column_ticker2=PriceAttribute.CLOSE,
+        )
+
+        # Assert
+        for (ticker1, ticker2), (pearson_corr_coef, p_value, data_length) in correlations.items():
+            expected_correlation = correlation_analysis_single_combination(
+                ticker1=ticker1,
+                ticker2=ticker2,
+                column_ticker1=PriceAttribute.CLOSE,
+                column_ticker2=PriceAttribute.CLOSE,
+                data=self.data,
+            )
+            self.assertAlmostEqual(expected_correlation[0], pearson_corr_coef, places=10)
+            self.assertAlmostEqual(expected_correlation[1], p_value, places=10)
+            self.assertEqual(expected_correlation[2], data_length)
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_correlation_analysis_lists_cardinal_product_ticker_not_in_data_columns(self, mock_get_data_method):
+
+        # Arrange
+        self.load_data_cardinal_product()
+        mock_get_data_method.side_effect = self.mock_get_data_side_effect
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            correlation_analysis_lists_cardinal_product(
+                list_ticker1=["CL=F", "SI=F"],
+                list_ticker2=["EUR=X"],
+                column_ticker1=PriceAttribute.CLOSE,
+                column_ticker2=PriceAttribute.CLOSE,
+            )
+        self.assertEqual(
+            str(e.exception), "Parameters 'ticker1' and 'ticker2' must represent valid tickers in the 'data'."
+        )
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_correlation_analysis_lists_cardinal_product_data_provided(self, mock_get_data_method):
+
+        # Arrange
+        self.load_data_cardinal_product()
+
+        # Act
+        correlations = correlation_analysis_lists_cardinal_product(
+            list_ticker1=["CL=F"],
+            list_ticker2=["EUR=X"],
+            column_ticker1=PriceAttribute.CLOSE,
+            column_ticker2=PriceAttribute.CLOSE,
+            data=self.data,
+        )
+
+        # Assert
+        mock_get_data_method.assert_not_called()
+        self.assertEqual({("CL=F", "EUR=X")}, set(correlations.keys()))
+
+    # Tests for method correlation_analysis_lists_cardinal_product_columns()
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_correlation_analysis_lists_cardinal_product_columns_single_fetch(self, mock_get_data_method):
+
+        # Arrange
+        self.load_data_cardinal_product()
+        list_ticker1 = ["CL=F", "GC=F"]
+        list_ticker2 = ["EUR=X", "CADUSD=X", "GBP=X"]
+        columns = [
+            (PriceAttribute.CLOSE, PriceAttribute.CLOSE),
+            (PriceAttribute.HIGH, PriceAttribute.CLOSE),
+            (PriceAttribute.LOW, PriceAttribute.CLOSE),
+        ]
+        mock_get_data_method.side_effect = self.mock_get_data_side_effect
+
+        # Act
+        correlations_columns = correlation_analysis_lists_cardinal_product_columns(
+            list_ticker1=list_ticker1, list_ticker2=list_ticker2, columns=columns
+        )
+
+        # Assert
+        self.assertEqual(1, mock_get_data_method.call_count)
+        self.assertEqual(set(columns), set(correlations_columns.keys()))
+        for column_ticker1, column_ticker2 in columns:
+            expected_correlations = correlation_analysis_lists_cardinal_product(
+                list_ticker1=list_ticker1,
+                list_ticker2=list_ticker2,
+                column_ticker1=column_ticker1,
+                column_ticker2=column_ticker2,
+                data=self.data,
+            )
+            correlations = correlations_columns[(column_ticker1, column_ticker2)]
+            self.assertEqual(set(expected_correlations.keys()), set(correlations.keys()))
+            for combination, (pearson_corr_coef, p_value, data_length) in correlations.items():
+                self.assertAlmostEqual(expected_correlations[combination][0], pearson_corr_coef, places=10)
+                self.assertAlmostEqual(expected_correlations[combination][1], p_value, places=10)
+                self.assertEqual(expected_correlations[combination][2], data_length)
+
+    # Tests for method correlation_matrix()
+
+    def test_correlation_matrix_different_number_of_rows(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            correlation_matrix(values_1=np.zeros((5, 2)), values_2=np.zeros((4, 3)))
+        self.assertEqual(
+            "Parameters 'values_1' and 'values_2' must be 2-D arrays with the same number of rows.", str(e.exception)
+        )
+
+    def test_correlation_matrix_matches_pearsonr_with_nan(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        values_1 = rng.normal(loc=3e5, scale=1e5, size=(200, 3))
+        values_2 = rng.normal(size=(200, 2)) + values_1[:, :2] * 1e-5
+        values_1[rng.random(values_1.shape) < 0.1] = np.nan
+        values_2[rng.random(values_2.shape) < 0.1] = np.nan
+
+        # Act
+        pearson_corr_coefs, p_values, data_lengths = correlation_matrix(values_1=values_1, values_2=values_2)
+
+        # Assert
+        self.assertEqual((3, 2), pearson_corr_coefs.shape)
+        for i in range(3):
+            for j in range(2):
+                non_nan_rows = ~np.isnan(values_1[:, i]) & ~np.isnan(values_2[:, j])
+                expected_pearson_corr_coef, expected_p_value = pearsonr(
+                    values_1[non_nan_rows, i], values_2[non_nan_rows, j]
+                )
+                self.assertAlmostEqual(expected_pearson_corr_coef, pearson_corr_coefs[i, j], places=10)
+                self.assertAlmostEqual(expected_p_value, p_values[i, j], places=10)
+                self.assertEqual(non_nan_rows.sum(), data_lengths[i, j])
+
+    def test_correlation_matrix_not_enough_observations(self):
+
+        # Arrange
+        values_1 = np.array([[1.0, 1.0], [2.0, np.nan], [4.0, np.nan]])
+        values_2 = np.array([[2.0], [1.0], [np.nan]])
+
+        # Act
+        pearson_corr_coefs, p_values, data_lengths = correlation_matrix(values_1=values_1, values_2=values_2)
+
+        # Assert
+        self.assertEqual([[2], [1]], data_lengths.tolist())
+        self.assertEqual(-1.0, pearson_corr_coefs[0, 0])
+        self.assertEqual(1.0, p_values[0, 0])
+        self.assertTrue(np.isnan(pearson_corr_coefs[1, 0]))
+        self.assertTrue(np.isnan(p_values[1, 0]))
+
+    def test_correlation_matrix_constant_column_matches_pearsonr(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        values_1 = np.column_stack([np.full(50, 0.1), rng.normal(size=50)])
+        values_2 = rng.normal(size=(50, 1))
+
+        # Act
+        pearson_corr_coefs, p_values, data_lengths = correlation_matrix(values_1=values_1, values_2=values_2)
+
+        # Assert
+        with self.assertWarns(Warning):
+            expected_pearson_corr_coef, expected_p_value = pearsonr(values_1[:, 0], values_2[:, 0])
+        self.assertTrue(np.isnan(expected_pearson_corr_coef) and np.isnan(expected_p_value))
+        self.assertTrue(np.isnan(pearson_corr_coefs[0, 0]))
+        self.assertTrue(np.isnan(p_values[0, 0]))
+        self.assertEqual(50, data_lengths[0, 0])
+        self.assertAlmostEqual(pearsonr(values_1[:, 1], values_2[:, 0])[0], pearson_corr_coefs[1, 0], places=10)
+
+    # Tests for method rolling_correlation_matrix()
+
+    def test_rolling_correlation_matrix_window_less_than_two(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            rolling_correlation_matrix(values_1=np.zeros((5, 2)), values_2=np.zeros((5, 3)), window=1)
+        self.assertEqual("Parameter 'window' must be an integer greater than or equal to 2.", str(e.exception))
+
+    def test_rolling_correlation_matrix_min_periods_greater_than_window(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            rolling_correlation_matrix(values_1=np.zeros((5, 2)), values_2=np.zeros((5, 3)), window=3, min_periods=4)
+        self.assertEqual(
+            "Parameter 'min_periods' must be an integer between 2 and 'window' inclusive.", str(e.exception)
+        )
+
+    def test_rolling_correlation_matrix_matches_pearsonr_with_nan(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        values_1 = rng.normal(loc=1000, scale=50, size=(100, 2))
+        values_2 = rng.normal(size=(100, 2)) + values_1 * 0.01
+        values_1[rng.random(values_1.shape) < 0.1] = np.nan
+        values_2[rng.random(values_2.shape) < 0.1] = np.nan
+        window = 12
+
+        # Act
+        pearson_corr_coefs, data_lengths = rolling_correlation_matrix(
+            values_1=values_1, values_2=values_2, window=window, min_periods=8
+        )
+
+        # Assert
+        self.assertEqual((100, 2, 2), pearson_corr_coefs.shape)
+        for row in range(100):
+            for i in range(2):
+                for j in range(2):
+                    window_1 = values_1[max(row - window + 1, 0) : row + 1, i]
+                    window_2 = values_2[max(row - window + 1, 0) : row + 1, j]
+                    non_nan_rows = ~np.isnan(window_1) & ~np.isnan(window_2)
+                    self.assertEqual(non_nan_rows.sum(), data_lengths[row, i, j])
+                    if non_nan_rows.sum() < 8:
+                        self.assertTrue(np.isnan(pearson_corr_coefs[row, i, j]))
+                    else:
+                        expected_pearson_corr_coef, _ = pearsonr(window_1[non_nan_rows], window_2[non_nan_rows])
+                        self.assertAlmostEqual(expected_pearson_corr_coef, pearson_corr_coefs[row, i, j], places=10)
+
+    def test_rolling_correlation_matrix_constant_window(self):
+
+        # Arrange
+        values_1 = np.array([[1.0], [2.0], [3.0], [3.0], [3.0], [4.0]])
+        values_2 = np.array([[2.0], [4.0], [5.0], [1.0], [7.0], [3.0]])
+
+        # Act
+        pearson_corr_coefs, _ = rolling_correlation_matrix(values_1=values_1, values_2=values_2, window=3)
+
+        # Assert
+        self.assertTrue(np.isnan(pearson_corr_coefs[:2, 0, 0]).all())
+        self.assertAlmostEqual(pearsonr([1.0, 2.0, 3.0], [2.0, 4.0, 5.0])[0], pearson_corr_coefs[2, 0, 0], places=10)
+        self.assertTrue(np.isnan(pearson_corr_coefs[4, 0, 0]))
+
+    # Tests for method rolling_correlation_analysis_lists_cardinal_product()
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_rolling_correlation_analysis_lists_cardinal_product(self, mock_get_data_method):
+
+        # Arrange
+        self.load_data_cardinal_product()
+        list_ticker1 = ["CL=F", "GC=F"]
+        list_ticker2 = ["EUR=X", "CADUSD=X", "GBP=X"]
+        mock_get_data_method.side_effect = self.mock_get_data_side_effect
+
+        # Act
+        rolling_correlations = rolling_correlation_analysis_lists_cardinal_product(
+            list_ticker1=list_ticker1,
+            list_ticker2=list_ticker2,
+            column_ticker1=PriceAttribute.CLOSE,
+            column_ticker2=PriceAttribute.CLOSE,
+            window=24,
+            min_periods=20,
+        )
+
+        # Assert
+        self.assertTrue(self.data.index.equals(rolling_correlations.index))
+        self.assertEqual(
+            [(ticker1, ticker2) for ticker1 in list_ticker1 for ticker2 in list_ticker2],
+            list(rolling_correlations.columns),
+        )
+        last_window = self.data["Close"][["GC=F", "GBP=X"]].iloc[-24:].dropna()
+        self.assertAlmostEqual(
+            pearsonr(last_window["GC=F"], last_window["GBP=X"])[0], rolling_correlations[("GC=F", "GBP=X")].iloc[-1]
+        )
+
+    # Tests for method cross_correlation_matrix()
+
+    def test_cross_correlation_matrix_max_lag_too_large(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            cross_correlation_matrix(values_1=np.zeros((5, 2)), values_2=np.zeros((5, 3)), max_lag=5)
+        self.assertEqual(
+            "Parameter 'max_lag' must be a positive integer less than the number of rows.", str(e.exception)
+        )
+
+    def test_cross_correlation_matrix_matches_pearsonr_with_nan(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        values_1 = rng.normal(size=(150, 2))
+        values_2 = rng.normal(size=(150, 2))
+        values_1[rng.random(values_1.shape) < 0.1] = np.nan
+        values_2[rng.random(values_2.shape) < 0.1] = np.nan
+
+        # Act
+        lags, pearson_corr_coefs, data_lengths = cross_correlation_matrix(
+            values_1=values_1, values_2=values_2, max_lag=5
+        )
+
+        # Assert
+        self.assertEqual(list(range(-5, 6)), list(lags))
+        self.assertEqual((11, 2, 2), pearson_corr_coefs.shape)
+        for lag_index, lag in enumerate(lags):
+            for i in range(2):
+                for j in range(2):
+                    # values_1 at row t is paired with values_2 at row t + lag
+                    series_1 = values_1[max(0, -lag) : 150 - max(0, lag), i]
+                    series_2 = values_2[max(0, lag) : 150 - max(0, -lag), j]
+                    non_nan_rows = ~np.isnan(series_1) & ~np.isnan(series_2)
+                    expected_pearson_corr_coef, _ = pearsonr(series_1[non_nan_rows], series_2[non_nan_rows])
+                    self.assertAlmostEqual(expected_pearson_corr_coef, pearson_corr_coefs[lag_index, i, j], places=10)
+                    self.assertEqual(non_nan_rows.sum(), data_lengths[lag_index, i, j])
+
+    def test_cross_correlation_matrix_constant_column(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        values_1 = np.column_stack([np.full(200, 0.003), rng.normal(size=200)])
+        values_2 = rng.normal(size=(200, 1))
+        values_1[rng.random(values_1.shape) < 0.1] = np.nan
+
+        # Act
+        lags, pearson_corr_coefs, data_lengths = cross_correlation_matrix(
+            values_1=values_1, values_2=values_2, max_lag=5
+        )
+
+        # Assert
+        self.assertTrue(np.isnan(pearson_corr_coefs[:, 0, 0]).all())
+        self.assertFalse(np.isnan(pearson_corr_coefs[:, 1, 0]).any())
+
+    # Tests for method lead_lag_analysis_lists_cardinal_product()
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_hourly_changes")
+    def test_lead_lag_analysis_lists_cardinal_product_finds_lag(self, mock_get_hourly_changes_method):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        commodity_changes = rng.normal(scale=0.01, size=500)
+        forex_changes = np.concatenate([rng.normal(scale=0.01, size=3), commodity_changes[:-3]])
+        forex_changes += rng.normal(scale=0.005, size=500)
+        mock_get_hourly_changes_method.return_value = pd.DataFrame(
+            data=np.column_stack([commodity_changes, forex_changes, rng.normal(scale=0.01, size=500)]),
+            index=pd.date_range("2022-11-07", periods=500, freq="h"),
+            columns=pd.MultiIndex.from_tuples([("CL=F", "Close"), ("EUR=X", "Close"), ("GBP=X", "Close")]),
+        )
+
+        # Act
+        lead_lags = lead_lag_analysis_lists_cardinal_product(
+            list_ticker1=["CL=F"], list_ticker2=["EUR=X", "GBP=X"], max_lag=10
+        )
+
+        # Assert
+        mock_get_hourly_changes_method.assert_called_once_with(
+            attributes=[PriceAttribute.CLOSE], tickers=["CL=F", "EUR=X", "GBP=X"]
+        )
+        self.assertEqual({("CL=F", "EUR=X"), ("CL=F", "GBP=X")}, set(lead_lags.keys()))
+        lag, pearson_corr_coef, data_length = lead_lags[("CL=F", "EUR=X")]
+        self.assertEqual(3, lag)
+        self.assertGreater(pearson_corr_coef, 0.8)
+        self.assertEqual(497, data_length)
+        self.assertLess(abs(lead_lags[("CL=F", "GBP=X")][1]), 0.3)
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_hourly_changes")
+    def test_lead_lag_analysis_lists_cardinal_product_constant_ticker(self, mock_get_hourly_changes_method):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        constant_changes = np.full(500, 0.003)
+        constant_changes[rng.random(500) < 0.1] = np.nan
+        commodity_changes = rng.normal(scale=0.01, size=500)
+        forex_changes = np.concatenate([rng.normal(scale=0.01, size=3), commodity_changes[:-3]])
+        forex_changes += rng.normal(scale=0.005, size=500)
+        mock_get_hourly_changes_method.return_value = pd.DataFrame(
+            data=np.column_stack([constant_changes, commodity_changes, forex_changes]),
+            index=pd.date_range("2022-11-07", periods=500, freq="h"),
+            columns=pd.MultiIndex.from_tuples([("C1", "Close"), ("CL=F", "Close"), ("EUR=X", "Close")]),
+        )
+
+        # Act
+        lead_lags = lead_lag_analysis_lists_cardinal_product(
+            list_ticker1=["C1", "CL=F"], list_ticker2=["EUR=X"], max_lag=10
+        )
+
+        # Assert
+        lag, pearson_corr_coef, data_length = lead_lags[("C1", "EUR=X")]
+        self.assertEqual(0, lag)
+        self.assertTrue(np.isnan(pearson_corr_coef))
+        strongest_pair = max(
+            (pair for pair in lead_lags if not np.isnan(lead_lags[pair][1])), key=lambda pair: abs(lead_lags[pair][1])
+        )
+        self.assertEqual(("CL=F", "EUR=X"), strongest_pair)
+        self.assertEqual(3, lead_lags[("CL=F", "EUR=X")][0])
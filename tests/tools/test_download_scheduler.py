@@ -0,0 +1,211 @@
+"""Tests for methods in file download_scheduler.py."""
+
+import os
+import pickle
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from src.tools.constants import PriceAttribute, YfinanceGroupBy
+from src.tools.download_scheduler import DownloadScheduler, RateLimiter
+from src.tools.yfinance_data_provider import YfinanceDataProvider
+
+
+class TestDownloadScheduler(TestCase):
+    """Test class for methods in classes DownloadScheduler and RateLimiter."""
+
+    def setUp(self) -> None:
+        self.TEST_DATA_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/test_data"
+        with open(f"{self.TEST_DATA_DIR}/yf_download_hourly_multiple_tickers_output.pickle", "rb") as file:
+            self.data = pickle.load(file)
+        self.history_calls = []
+        self.failures = {}
+
+    def tearDown(self) -> None:
+        YfinanceDataProvider.download_scheduler = None
+
+    def mock_ticker_side_effect(self, ticker):
+        test = self
+
+        class MockTicker:
+            def history(self, **kwargs):
+                test.history_calls.append((ticker, kwargs))
+                if test.failures.get(ticker, 0) > 0:
+                    test.failures[ticker] -= 1
+                    raise ConnectionError(f"Failed to download {ticker}.")
+                if ticker not in test.data.columns.get_level_values(0):
+                    return pd.DataFrame()
+                return test.data[ticker]
+
+        return MockTicker()
+
+    # Tests for class RateLimiter
+
+    def test_rate_limiter_max_requests_per_second_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            RateLimiter(max_requests_per_second=0)
+        self.assertEqual("Parameter 'max_requests_per_second' must be strictly positive.", str(e.exception))
+
+    def test_rate_limiter_spaces_out_requests(self):
+
+        # Arrange
+        rate_limiter = RateLimiter(max_requests_per_second=50)
+
+        # Act
+        start_time = time.monotonic()
+        for _ in range(4):
+            rate_limiter.wait()
+        duration = time.monotonic() - start_time
+
+        # Assert
+        self.assertGreaterEqual(duration, 0.06)
+
+    # Tests for constructor
+
+    def test_constructor_max_workers_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            DownloadScheduler(max_workers=0)
+        self.assertEqual("Parameter 'max_workers' must be a strictly positive integer (>= 1).", str(e.exception))
+
+    def test_constructor_max_retries_negative(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            DownloadScheduler(max_retries=-1)
+        self.assertEqual("Parameter 'max_retries' must be a positive integer (>= 0).", str(e.exception))
+
+    # Tests for method download()
+
+    @patch("yfinance.Ticker")
+    def test_download_one_request_per_ticker(self, mock_ticker_class):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        scheduler = DownloadScheduler(max_workers=2)
+
+        # Act
+        tickers_data = scheduler.download(tickers=["EUR=X", "CL=F"], interval="1h", period="729d")
+
+        # Assert
+        self.assertEqual({"EUR=X", "CL=F"}, {ticker for ticker, _ in self.history_calls})
+        self.assertEqual(
+            {"interval": "1h", "period": "729d", "auto_adjust": False, "actions": False, "timeout": 30},
+            self.history_calls[0][1],
+        )
+        assert_frame_equal(left=self.data["EUR=X"], right=tickers_data["EUR=X"])
+        assert_frame_equal(left=self.data["CL=F"], right=tickers_data["CL=F"])
+        self.assertEqual({}, scheduler.failed_tickers)
+
+    @patch("yfinance.Ticker")
+    def test_download_start(self, mock_ticker_class):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        scheduler = DownloadScheduler()
+        start = pd.Timestamp("2023-02-01 10:00", tz="UTC")
+
+        # Act
+        scheduler.download(tickers=["EUR=X"], interval="1h", start=start)
+
+        # Assert
+        self.assertEqual(start, self.history_calls[0][1]["start"])
+        self.assertNotIn("period", self.history_calls[0][1])
+
+    @patch("time.sleep")
+    @patch("yfinance.Ticker")
+    def test_download_retries_with_exponential_backoff(self, mock_ticker_class, mock_sleep_method):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        self.failures = {"CL=F": 2}
+        scheduler = DownloadScheduler(max_retries=3, backoff_seconds=0.5)
+
+        # Act
+        tickers_data = scheduler.download(tickers=["CL=F"], interval="1h", period="729d")
+
+        # Assert
+        self.assertEqual(3, len(self.history_calls))
+        self.assertEqual([0.5, 1.0], [call.args[0] for call in mock_sleep_method.call_args_list])
+        assert_frame_equal(left=self.data["CL=F"], right=tickers_data["CL=F"])
+
+    @patch("time.sleep")
+    @patch("yfinance.Ticker")
+    def test_download_failed_ticker_does_not_affect_other_tickers(self, mock_ticker_class, mock_sleep_method):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        self.failures = {"CL=F": 10}
+        scheduler = DownloadScheduler(max_retries=2)
+
+        # Act
+        tickers_data = scheduler.download(tickers=["EUR=X", "CL=F"], interval="1h", period="729d")
+
+        # Assert
+        self.assertTrue(tickers_data["CL=F"].empty)
+        assert_frame_equal(left=self.data["EUR=X"], right=tickers_data["EUR=X"])
+        self.assertEqual(["CL=F"], list(scheduler.failed_tickers.keys()))
+        self.assertIsInstance(scheduler.failed_tickers["CL=F"], ConnectionError)
+
+    # Tests for YfinanceDataProvider.get_data() with a download scheduler
+
+    @patch("yfinance.download")
+    @patch("yfinance.Ticker")
+    def test_get_data_with_download_scheduler(self, mock_ticker_class, mock_download_method):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        YfinanceDataProvider.download_scheduler = DownloadScheduler(max_workers=4)
+
+        # Act
+        data = YfinanceDataProvider.get_data(
+            tickers=["EUR=X", "CL=F"], period="729d", interval="1h", group_by=YfinanceGroupBy.TICKER
+        )
+
+        # Assert
+        mock_download_method.assert_not_called()
+        assert_frame_equal(left=self.data, right=data, check_freq=False)
+
+    @patch("time.sleep")
+    @patch("yfinance.Ticker")
+    def test_get_data_with_download_scheduler_failed_ticker(self, mock_ticker_class, mock_sleep_method):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        self.failures = {"CL=F": 10}
+        YfinanceDataProvider.download_scheduler = DownloadScheduler(max_workers=2, max_retries=1)
+
+        # Act
+        data = YfinanceDataProvider.get_data(
+            tickers=["EUR=X", "CL=F"], period="729d", interval="1h", group_by=YfinanceGroupBy.TICKER
+        )
+
+        # Assert
+        self.assertEqual(["CL=F"], list(YfinanceDataProvider.download_scheduler.failed_tickers.keys()))
+        self.assertEqual(list(self.data["CL=F"].columns), list(data["CL=F"].columns))
+        self.assertTrue(data["CL=F"].isna().all().all())
+        assert_frame_equal(left=self.data["EUR=X"].dropna(how="all"), right=data["EUR=X"].dropna(how="all"))
+
+    @patch("time.sleep")
+    @patch("yfinance.Ticker")
+    def test_get_hourly_changes_with_download_scheduler_failed_ticker(self, mock_ticker_class, mock_sleep_method):
+
+        # Arrange
+        mock_ticker_class.side_effect = self.mock_ticker_side_effect
+        self.failures = {"CL=F": 10}
+        YfinanceDataProvider.download_scheduler = DownloadScheduler(max_workers=2, max_retries=1)
+
+        # Act
+        changes_data = YfinanceDataProvider.get_hourly_changes(
+            attributes=[PriceAttribute.CLOSE], tickers=["EUR=X", "CL=F"]
+        )
+
+        # Assert
+        self.assertTrue(changes_data[("CL=F", "Close")].isna().all())
+        self.assertGreater(changes_data[("EUR=X", "Close")].notna().sum(), 0)
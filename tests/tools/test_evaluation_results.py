@@ -0,0 +1,149 @@
+"""Tests for classes in file evaluation_results.py."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from src.tools.evaluation_results import EvaluationResult, ResultsStore, config_hash
+
+
+class TestEvaluationResults(TestCase):
+    """Test class for methods in classes EvaluationResult and ResultsStore."""
+
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.store_dir = self.temporary_directory.name
+        self.config = {"task": "classification", "forex_ticker": "EUR=X", "comdty_tickers": ["CL=F"], "random_state": 3}
+        self.result = EvaluationResult(
+            task="classification",
+            config=self.config,
+            metric="accuracy",
+            samples={"individual": [0.51, 0.53, 0.5], "sector": [0.52, 0.49, 0.5]},
+            timings={"data": 0.5, "evaluation": 2.0},
+            tests={"individual_vs_sector": {"permutation_test": {"rejected_null_hypothesis": False, "p_value": 0.6}}},
+        )
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    # Tests for method config_hash()
+
+    def test_config_hash_independent_of_keys_order(self):
+
+        # Act
+        hash_1 = config_hash({"a": 1, "b": [1, 2]})
+        hash_2 = config_hash({"b": [1, 2], "a": 1})
+
+        # Assert
+        self.assertEqual(hash_1, hash_2)
+        self.assertNotEqual(hash_1, config_hash({"a": 2, "b": [1, 2]}))
+
+    # Tests for class EvaluationResult
+
+    def test_constructor_different_number_of_samples(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            EvaluationResult(
+                task="regression",
+                config={},
+                metric="mae",
+                samples={"individual": [0.1, 0.2], "sector": [0.1]},
+                timings={},
+                tests={},
+            )
+        self.assertEqual(
+            "All approaches in parameter 'samples' must have the same number of samples.", str(e.exception)
+        )
+
+    def test_to_dataframe(self):
+
+        # Act
+        samples_data = self.result.to_dataframe()
+
+        # Assert
+        self.assertEqual(3, self.result.nb_samples)
+        self.assertEqual([0, 1, 2, 0, 1, 2], list(samples_data["sample"]))
+        self.assertEqual(["individual"] * 3 + ["sector"] * 3, list(samples_data["approach"]))
+        self.assertEqual([0.51, 0.53, 0.5, 0.52, 0.49, 0.5], list(samples_data["value"]))
+
+    # Tests for class ResultsStore
+
+    def test_load_empty_store(self):
+
+        # Arrange
+        store = ResultsStore(store_dir=self.store_dir)
+
+        # Act / Assert
+        self.assertIsNone(store.load(config_hash=self.result.config_hash))
+        self.assertFalse(store.contains(config_hash=self.result.config_hash))
+        self.assertTrue(store.load_runs().empty)
+        self.assertTrue(store.load_samples().empty)
+
+    def test_append_and_load(self):
+
+        # Arrange
+        store = ResultsStore(store_dir=self.store_dir)
+
+        # Act
+        run_id = store.append(result=self.result)
+        loaded_result = store.load(config_hash=self.result.config_hash)
+
+        # Assert
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.store_dir, "runs", self.result.config_hash, f"{run_id}.parquet"))
+        )
+        self.assertTrue(store.contains(config_hash=self.result.config_hash))
+        self.assertEqual(self.result.task, loaded_result.task)
+        self.assertEqual(self.result.config, loaded_result.config)
+        self.assertEqual(self.result.metric, loaded_result.metric)
+        self.assertEqual(self.result.samples, loaded_result.samples)
+        self.assertEqual(self.result.timings, loaded_result.timings)
+        self.assertEqual(self.result.tests, loaded_result.tests)
+
+    def test_load_latest_run(self):
+
+        # Arrange
+        store = ResultsStore(store_dir=self.store_dir)
+        latest_result = EvaluationResult(
+            task="classification",
+            config=self.config,
+            metric="accuracy",
+            samples={"individual": [0.6], "sector": [0.4]},
+            timings={},
+            tests={},
+        )
+        store.append(result=self.result)
+        store.append(result=latest_result)
+
+        # Act
+        loaded_result = store.load(config_hash=self.result.config_hash)
+
+        # Assert
+        self.assertEqual({"individual": [0.6], "sector": [0.4]}, loaded_result.samples)
+        self.assertEqual(2, len(store.load_runs(config_hash=self.result.config_hash)))
+
+    def test_load_runs_and_samples_across_configurations(self):
+
+        # Arrange
+        store = ResultsStore(store_dir=self.store_dir)
+        other_result = EvaluationResult(
+            task="regression",
+            config={"task": "regression"},
+            metric="mae",
+            samples={"individual": [0.008], "sector": [0.009], "baseline": [0.0085]},
+            timings={},
+            tests={},
+        )
+        store.append(result=self.result)
+        store.append(result=other_result)
+
+        # Act
+        runs_data = store.load_runs()
+        samples_data = store.load_samples(config_hash=other_result.config_hash)
+
+        # Assert
+        self.assertEqual(["classification", "regression"], list(runs_data["task"]))
+        self.assertEqual({self.result.config_hash, other_result.config_hash}, set(runs_data["config_hash"]))
+        self.assertEqual(["individual", "sector", "baseline"], list(samples_data["approach"]))
+        self.assertEqual([other_result.config_hash] * 3, list(samples_data["config_hash"]))
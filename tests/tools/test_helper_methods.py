@@ -1,12 +1,23 @@
 """Tests for methods in file helper_methods.py."""
 
 import math
+from datetime import timedelta
 from unittest import TestCase
 
+import numpy as np
 import pandas as pd
 
-from src.tools.constants import PriceAttribute
-from src.tools.helper_methods import consecutive_timestamps, extract_changes_from_dataframe
+from src.tools.constants import PriceAttribute, YfinanceInterval, YfinancePeriod
+from src.tools.helper_methods import (
+    consecutive_timestamps,
+    consecutive_windows,
+    contiguous_run_starts,
+    extract_changes_from_dataframe,
+    extract_changes_from_multiindex_dataframe,
+    interval_step,
+    merge_new_bars,
+    period_start,
+)
 
 
 class TestHelperMethods(TestCase):
@@ -148,6 +159,67 @@ class TestHelperMethods(TestCase):
             extract_changes_from_dataframe(attribute=attribute, data=data)
         self.assertEqual("Cannot extract changes for price attributes 'Open' or 'Volume'.", str(e.exception))
 
+    # Tests for method extract_changes_from_multiindex_dataframe()
+
+    def test_extract_changes_from_multiindex_dataframe_multiple_tickers_and_attributes(self):
+
+        # Arrange
+        attributes = [PriceAttribute.CLOSE, PriceAttribute.HIGH]
+        data = pd.DataFrame(
+            data={
+                ("CL=F", "Open"): [89, math.nan, 91],
+                ("CL=F", "High"): [90, 93, 92],
+                ("CL=F", "Close"): [88, 92, 91],
+                ("EUR=X", "Open"): [1.0, 1.1, 1.2],
+                ("EUR=X", "High"): [1.1, 1.2, math.nan],
+                ("EUR=X", "Close"): [1.05, 1.0, 1.2],
+            },
+            index=pd.DatetimeIndex(["2022-11-03", "2022-11-04", "2022-11-07"], name="Date"),
+        )
+
+        # Act
+        changes_data = extract_changes_from_multiindex_dataframe(attributes=attributes, data=data)
+
+        # Assert
+        self.assertEqual(
+            [("CL=F", "Close"), ("CL=F", "High"), ("EUR=X", "Close"), ("EUR=X", "High")], list(changes_data.columns)
+        )
+        for ticker in ["CL=F", "EUR=X"]:
+            for attribute in attributes:
+                expected_changes_series = extract_changes_from_dataframe(attribute=attribute, data=data[ticker])
+                self.assertTrue(expected_changes_series.equals(changes_data[(ticker, attribute.value)].rename(None)))
+
+    def test_extract_changes_from_multiindex_dataframe_selected_tickers(self):
+
+        # Arrange
+        data = pd.DataFrame(
+            data={
+                ("CL=F", "Open"): [89, 88],
+                ("CL=F", "Close"): [88, 92],
+                ("EUR=X", "Open"): [1.0, 1.1],
+                ("EUR=X", "Close"): [1.05, 1.0],
+            },
+            index=pd.DatetimeIndex(["2022-11-03", "2022-11-04"], name="Date"),
+        )
+
+        # Act
+        changes_data = extract_changes_from_multiindex_dataframe(
+            attributes=[PriceAttribute.CLOSE], data=data, tickers=["EUR=X"]
+        )
+
+        # Assert
+        self.assertEqual([("EUR=X", "Close")], list(changes_data.columns))
+
+    def test_extract_changes_from_multiindex_dataframe_attribute_open(self):
+
+        # Arrange
+        data = pd.DataFrame(data={("CL=F", "Open"): [89, 88], ("CL=F", "Close"): [88, 92]})
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            extract_changes_from_multiindex_dataframe(attributes=[PriceAttribute.OPEN], data=data)
+        self.assertEqual("Cannot extract changes for price attributes 'Open' or 'Volume'.", str(e.exception))
+
     # Tests for method consecutive_timestamps()
 
     def test_consecutive_timestamps_empty_timestamps_list(self):
@@ -261,3 +333,297 @@ class TestHelperMethods(TestCase):
 
         # Assert
         self.assertFalse(timestamps_are_consecutive)
+
+    def test_consecutive_timestamps_fifteen_minutes_interval(self):
+
+        # Arrange
+        timestamps = [
+            pd.Timestamp("2022-11-07 10:00"),
+            pd.Timestamp("2022-11-07 10:15"),
+            pd.Timestamp("2022-11-07 10:30"),
+        ]
+
+        # Act
+        timestamps_are_consecutive = consecutive_timestamps(
+            timestamps=timestamps, interval=YfinanceInterval.FIFTEEN_MINUTES
+        )
+
+        # Assert
+        self.assertTrue(timestamps_are_consecutive)
+        self.assertFalse(consecutive_timestamps(timestamps=timestamps))
+
+    # Tests for method contiguous_run_starts()
+
+    def test_contiguous_run_starts(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(
+            [
+                "2022-11-07 10:00",
+                "2022-11-07 11:00",
+                "2022-11-07 12:00",
+                "2022-11-07 14:00",
+                "2022-11-07 15:00",
+                "2022-11-08 09:00",
+            ]
+        )
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=timestamps)
+
+        # Assert
+        self.assertEqual([0, 0, 0, 3, 3, 5], list(run_starts))
+
+    def test_contiguous_run_starts_empty_timestamps(self):
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=pd.DatetimeIndex([]))
+
+        # Assert
+        self.assertEqual(0, len(run_starts))
+
+    def test_contiguous_run_starts_five_minutes_interval(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(
+            ["2022-11-07 10:00", "2022-11-07 10:05", "2022-11-07 10:10", "2022-11-07 10:20", "2022-11-07 10:25"]
+        )
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=timestamps, interval=YfinanceInterval.FIVE_MINUTES)
+
+        # Assert
+        self.assertEqual([0, 0, 0, 3, 3], list(run_starts))
+
+    def test_contiguous_run_starts_session_aware_intraday(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(
+            [
+                "2022-11-03 15:00",  # Thursday
+                "2022-11-04 09:00",  # Friday, next trading date
+                "2022-11-04 10:00",
+                "2022-11-04 12:00",  # Gap within the trading date
+                "2022-11-04 13:00",
+                "2022-11-07 09:00",  # Monday, next trading date after the weekend
+                "2022-11-09 09:00",  # Wednesday, Tuesday is missing
+            ],
+            tz="America/New_York",
+        )
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=timestamps, session_aware=True)
+
+        # Assert
+        self.assertEqual([0, 0, 0, 3, 3, 3, 6], list(run_starts))
+
+    def test_contiguous_run_starts_session_aware_daily(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(["2022-11-03", "2022-11-04", "2022-11-07", "2022-11-08", "2022-11-10"])
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=timestamps, interval="1d", session_aware=True)
+        run_starts_calendar = contiguous_run_starts(timestamps=timestamps, interval="1d")
+
+        # Assert
+        self.assertEqual([0, 0, 0, 0, 4], list(run_starts))
+        self.assertEqual([0, 0, 2, 2, 4], list(run_starts_calendar))
+
+    def test_contiguous_run_starts_session_aware_max_session_gap(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(
+            [
+                "2022-11-03 15:00",  # Thursday
+                "2022-11-04 09:00",  # Friday, overnight gap of 18 hours
+                "2022-11-04 10:00",
+                "2022-11-07 15:00",  # Monday, the morning is missing: gap of 29 hours without the weekend
+                "2022-11-08 09:00",
+            ],
+            tz="America/New_York",
+        )
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=timestamps, session_aware=True)
+        run_starts_short_gap = contiguous_run_starts(
+            timestamps=timestamps, session_aware=True, max_session_gap=timedelta(hours=12)
+        )
+
+        # Assert
+        self.assertEqual([0, 0, 0, 3, 3], list(run_starts))
+        self.assertEqual([0, 1, 1, 3, 4], list(run_starts_short_gap))
+
+    def test_contiguous_run_starts_session_aware_session_timezone(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(
+            [
+                "2022-11-07 17:00",
+                "2022-11-07 18:00",
+                "2022-11-07 21:00",  # Gap within the trading date in New York, across midnight UTC
+                "2022-11-07 22:00",
+            ],
+            tz="America/New_York",
+        ).tz_convert("UTC")
+
+        # Act
+        run_starts_utc = contiguous_run_starts(timestamps=timestamps, session_aware=True)
+        run_starts_exchange = contiguous_run_starts(
+            timestamps=timestamps, session_aware=True, session_timezone="America/New_York"
+        )
+
+        # Assert
+        self.assertEqual([0, 0, 0, 0], list(run_starts_utc))
+        self.assertEqual([0, 0, 2, 2], list(run_starts_exchange))
+
+    def test_contiguous_run_starts_monthly_interval(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(["2022-01-01", "2022-02-01", "2022-03-01", "2022-05-01"])
+
+        # Act
+        run_starts = contiguous_run_starts(timestamps=timestamps, interval=YfinanceInterval.ONE_MONTH)
+
+        # Assert
+        self.assertEqual([0, 0, 0, 3], list(run_starts))
+
+    # Tests for method interval_step()
+
+    def test_interval_step(self):
+
+        # Act / Assert
+        self.assertEqual(timedelta(minutes=15), interval_step(interval=YfinanceInterval.FIFTEEN_MINUTES))
+        self.assertEqual(timedelta(hours=1), interval_step(interval=YfinanceInterval.SIXTY_MINUTES))
+        self.assertEqual(timedelta(weeks=1), interval_step(interval="1wk"))
+        self.assertEqual(pd.DateOffset(months=3), interval_step(interval=YfinanceInterval.THREE_MONTHS))
+
+    def test_interval_step_invalid_interval(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            interval_step(interval="2x")
+        self.assertEqual("Invalid interval '2x'.", str(e.exception))
+
+    # Tests for method consecutive_windows()
+
+    def test_consecutive_windows_window_length_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            consecutive_windows(run_starts=np.array([0, 0, 0]), window_length=0)
+        self.assertEqual("Parameter 'window_length' must be a strictly positive integer (>= 1).", str(e.exception))
+
+    def test_consecutive_windows_matches_consecutive_timestamps(self):
+
+        # Arrange
+        timestamps = pd.DatetimeIndex(
+            [
+                "2022-11-07 10:00",
+                "2022-11-07 11:00",
+                "2022-11-07 12:00",
+                "2022-11-07 14:00",
+                "2022-11-07 15:00",
+                "2022-11-07 16:00",
+                "2022-11-07 17:00",
+                "2022-11-08 09:00",
+            ]
+        )
+        run_starts = contiguous_run_starts(timestamps=timestamps)
+
+        for window_length in range(1, 10):
+
+            # Act
+            windows_are_consecutive = consecutive_windows(run_starts=run_starts, window_length=window_length)
+
+            # Assert
+            expected_windows_are_consecutive = [
+                consecutive_timestamps(timestamps=list(timestamps[i : i + window_length]))
+                for i in range(len(timestamps) - window_length + 1)
+            ]
+            self.assertEqual(expected_windows_are_consecutive, list(windows_are_consecutive))
+
+    # Tests for method period_start()
+
+    def test_period_start_days(self):
+
+        # Act
+        start = period_start(period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS, end=pd.Timestamp("2023-02-01 10:00"))
+
+        # Assert
+        self.assertEqual(pd.Timestamp("2021-02-02 10:00"), start)
+
+    def test_period_start_months(self):
+
+        # Act
+        start = period_start(period="1mo", end=pd.Timestamp("2023-02-01"))
+
+        # Assert
+        self.assertEqual(pd.Timestamp("2023-01-01"), start)
+
+    def test_period_start_max(self):
+
+        # Act
+        start = period_start(period=YfinancePeriod.MAX, end=pd.Timestamp("2023-02-01"))
+
+        # Assert
+        self.assertIsNone(start)
+
+    def test_period_start_invalid_period(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            period_start(period="1h", end=pd.Timestamp("2023-02-01"))
+        self.assertEqual("Invalid period '1h'.", str(e.exception))
+
+    # Tests for method merge_new_bars()
+
+    def test_merge_new_bars_replaces_revised_last_bar_and_appends_new_bars(self):
+
+        # Arrange
+        data = pd.DataFrame(
+            data={"Open": [1.0, 2.0, 3.0], "Close": [1.5, 2.5, 3.1]},
+            index=pd.DatetimeIndex(["2023-02-01 10:00", "2023-02-01 11:00", "2023-02-01 12:00"], tz="UTC"),
+        )
+        new_data = pd.DataFrame(
+            data={"Open": [3.0, 4.0], "Close": [3.5, 4.5]},
+            index=pd.DatetimeIndex(["2023-02-01 12:00", "2023-02-01 13:00"], tz="UTC"),
+        )
+
+        # Act
+        merged_data = merge_new_bars(data=data, new_data=new_data, period="729d")
+
+        # Assert
+        expected_merged_data = pd.DataFrame(
+            data={"Open": [1.0, 2.0, 3.0, 4.0], "Close": [1.5, 2.5, 3.5, 4.5]},
+            index=pd.DatetimeIndex(
+                ["2023-02-01 10:00", "2023-02-01 11:00", "2023-02-01 12:00", "2023-02-01 13:00"], tz="UTC"
+            ),
+        )
+        self.assertTrue(expected_merged_data.equals(merged_data))
+
+    def test_merge_new_bars_drops_bars_older_than_period(self):
+
+        # Arrange
+        data = pd.DataFrame(
+            data={"Open": [1.0, 2.0], "Close": [1.5, 2.5]},
+            index=pd.DatetimeIndex(["2023-01-30", "2023-01-31"]),
+        )
+        new_data = pd.DataFrame(data={"Open": [3.0], "Close": [3.5]}, index=pd.DatetimeIndex(["2023-02-01"]))
+
+        # Act
+        merged_data = merge_new_bars(data=data, new_data=new_data, period="1d")
+
+        # Assert
+        self.assertEqual([pd.Timestamp("2023-01-31"), pd.Timestamp("2023-02-01")], list(merged_data.index))
+
+    def test_merge_new_bars_no_new_data(self):
+
+        # Arrange
+        data = pd.DataFrame(data={"Open": [1.0], "Close": [1.5]}, index=pd.DatetimeIndex(["2023-01-31"]))
+
+        # Act
+        merged_data = merge_new_bars(data=data, new_data=pd.DataFrame(), period="729d")
+
+        # Assert
+        self.assertTrue(data.equals(merged_data))
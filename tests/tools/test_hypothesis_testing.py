@@ -2,7 +2,16 @@
 
 from unittest import TestCase
 
-from src.tools.hypothesis_testing import lilliefors_test, one_sample_t_test, two_sample_t_test
+import numpy as np
+
+from src.tools.hypothesis_testing import (
+    lilliefors_test,
+    one_sample_t_test,
+    one_sample_t_test_batch,
+    permutation_test,
+    two_sample_t_test,
+    two_sample_t_test_batch,
+)
 
 
 class TestHypothesisTesting(TestCase):
@@ -313,3 +322,185 @@ class TestHypothesisTesting(TestCase):
         # Assert
         self.assertTrue(rejected_null_hypothesis)
         self.assertAlmostEqual(0.001418196, p_value)
+
+    # Tests for method one_sample_t_test_batch()
+
+    def test_one_sample_t_test_batch_confidence_level_equals_one(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            one_sample_t_test_batch(samples=[[0.5, 0.51]], population_mean=0.5, confidence_level=1)
+        self.assertEqual("Confidence level for T-test must be between 0.5 and 1 (exclusive).", str(e.exception))
+
+    def test_one_sample_t_test_batch_samples_not_2d(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            one_sample_t_test_batch(samples=[0.5, 0.51], population_mean=0.5)
+        self.assertEqual("Samples passed to one-sample T-test must be a 2-D array of non-empty rows.", str(e.exception))
+
+    def test_one_sample_t_test_batch_matches_one_sample_t_test(self):
+
+        # Arrange
+        samples = [
+            [0.52, 0.52, 0.51, 0.53, 0.52, 0.5, 0.51, 0.525, 0.505, 0.52],
+            [0.51, 0.5, 0.49, 0.51, 0.51, 0.5, 0.49, 0.52, 0.5, 0.5],
+            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+        ]
+
+        # Act
+        rejected_null_hypothesis, p_values = one_sample_t_test_batch(samples=samples, population_mean=0.5)
+
+        # Assert
+        for i, sample in enumerate(samples):
+            self.assertEqual(
+                one_sample_t_test(sample=sample, population_mean=0.5),
+                (rejected_null_hypothesis[i], p_values[i]),
+            )
+
+    def test_one_sample_t_test_batch_population_mean_per_sample(self):
+
+        # Arrange
+        samples = np.array([[0.52, 0.52, 0.51, 0.53], [0.52, 0.52, 0.51, 0.53]])
+
+        # Act
+        rejected_null_hypothesis, p_values = one_sample_t_test_batch(
+            samples=samples, population_mean=np.array([0.5, 0.52])
+        )
+
+        # Assert
+        self.assertEqual([True, False], list(rejected_null_hypothesis))
+        self.assertEqual(one_sample_t_test(sample=list(samples[1]), population_mean=0.52)[1], p_values[1])
+
+    # Tests for method two_sample_t_test_batch()
+
+    def test_two_sample_t_test_batch_different_number_of_rows(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            two_sample_t_test_batch(samples_1=[[0.5, 0.51]], samples_2=[[0.5, 0.51], [0.5, 0.52]])
+        self.assertEqual(
+            "Samples passed to two-sample T-test must be 2-D arrays of non-empty rows, with the same number of rows.",
+            str(e.exception),
+        )
+
+    def test_two_sample_t_test_batch_matches_two_sample_t_test(self):
+
+        # Arrange
+        samples_1 = [
+            [0.51, 0.5, 0.49, 0.51, 0.51, 0.5],
+            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+        ]
+        samples_2 = [
+            [0.51, 0.51, 0.505, 0.52, 0.5, 0.5, 0.51, 0.525, 0.505, 0.52],
+            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+            [0.51, 0.51, 0.51, 0.51, 0.51, 0.51, 0.51, 0.51, 0.51, 0.51],
+            [0.52, 0.52, 0.51, 0.53, 0.52, 0.5, 0.51, 0.525, 0.505, 0.52],
+        ]
+
+        # Act
+        rejected_null_hypothesis, p_values = two_sample_t_test_batch(samples_1=samples_1, samples_2=samples_2)
+
+        # Assert
+        for i, (sample_1, sample_2) in enumerate(zip(samples_1, samples_2)):
+            self.assertEqual(
+                two_sample_t_test(sample_1=sample_1, sample_2=sample_2),
+                (rejected_null_hypothesis[i], p_values[i]),
+            )
+
+    # Tests for method permutation_test()
+
+    def test_permutation_test_confidence_level_equals_one(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            permutation_test(sample_1=[0.5, 0.51], sample_2=[0.5, 0.52], confidence_level=1)
+        self.assertEqual(
+            "Confidence level for permutation test must be between 0.5 and 1 (exclusive).", str(e.exception)
+        )
+
+    def test_permutation_test_sample_is_empty(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            permutation_test(sample_1=[], sample_2=[0.5, 0.52])
+        self.assertEqual("Samples passed to permutation test must not be empty.", str(e.exception))
+
+    def test_permutation_test_paired_different_lengths(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            permutation_test(sample_1=[0.5, 0.51], sample_2=[0.5, 0.52, 0.49], paired=True)
+        self.assertEqual("Samples passed to paired permutation test must have the same length.", str(e.exception))
+
+    def test_permutation_test_nb_permutations_zero(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            permutation_test(sample_1=[0.5, 0.51], sample_2=[0.5, 0.52], nb_permutations=0)
+        self.assertEqual("Parameter 'nb_permutations' must be a strictly positive integer (>= 1).", str(e.exception))
+
+    def test_permutation_test_exact_p_value(self):
+
+        # Arrange
+        sample_1 = [1.0, 2.0]
+        sample_2 = [3.0, 4.0]
+
+        # Act
+        rejected_null_hypothesis, p_value = permutation_test(
+            sample_1=sample_1, sample_2=sample_2, nb_permutations=20000, early_stopping=False, random_state=0
+        )
+
+        # Assert: 2 of the 6 assignments of the pooled observations are as extreme as the observed samples
+        self.assertFalse(rejected_null_hypothesis)
+        self.assertAlmostEqual(1 / 3, p_value, delta=0.02)
+
+    def test_permutation_test_paired_exact_p_value(self):
+
+        # Arrange
+        sample_1 = [1.0, 2.0, 3.0]
+        sample_2 = [0.0, 1.0, 2.0]
+
+        # Act
+        rejected_null_hypothesis, p_value = permutation_test(
+            sample_1=sample_1,
+            sample_2=sample_2,
+            paired=True,
+            nb_permutations=20000,
+            early_stopping=False,
+            random_state=0,
+        )
+
+        # Assert: 2 of the 8 sign flips of the differences are as extreme as the observed samples
+        self.assertFalse(rejected_null_hypothesis)
+        self.assertAlmostEqual(0.25, p_value, delta=0.02)
+
+    def test_permutation_test_rejects_null_hypothesis_with_early_stopping(self):
+
+        # Arrange
+        sample_1 = [0.51, 0.5, 0.49] * 10
+        sample_2 = [0.52, 0.52, 0.51, 0.53] * 10
+
+        # Act
+        rejected_null_hypothesis, p_value = permutation_test(
+            sample_1=sample_1, sample_2=sample_2, nb_permutations=100000, batch_size=1000, random_state=0
+        )
+
+        # Assert: stopped after the first batch, no permutation being as extreme as the observed samples
+        self.assertTrue(rejected_null_hypothesis)
+        self.assertEqual(1 / 1001, p_value)
+
+    def test_permutation_test_random_state_reproducible(self):
+
+        # Arrange
+        sample_1 = [0.51, 0.5, 0.49, 0.51, 0.51, 0.5]
+        sample_2 = [0.51, 0.51, 0.505, 0.52, 0.5, 0.5, 0.51, 0.525, 0.505, 0.52]
+
+        # Act
+        results_1 = permutation_test(sample_1=sample_1, sample_2=sample_2, random_state=42)
+        results_2 = permutation_test(sample_1=sample_1, sample_2=sample_2, random_state=42)
+
+        # Assert
+        self.assertEqual(results_1, results_2)
@@ -0,0 +1,163 @@
+"""Tests for methods in file parquet_cache.py."""
+
+import os
+import pickle
+import tempfile
+from datetime import timedelta
+from unittest import TestCase
+
+from pandas.testing import assert_frame_equal
+
+from src.tools.constants import YfinanceInterval, YfinancePeriod
+from src.tools.parquet_cache import ParquetCache
+
+
+class TestParquetCache(TestCase):
+    """Test class for methods in class ParquetCache."""
+
+    def setUp(self) -> None:
+        self.TEST_DATA_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/test_data"
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.cache_dir = self.temporary_directory.name
+        with open(f"{self.TEST_DATA_DIR}/yf_download_hourly_single_ticker_output.pickle", "rb") as file:
+            self.data = pickle.load(file)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    # Tests for constructor
+
+    def test_constructor_max_age_negative(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            ParquetCache(cache_dir=self.cache_dir, max_age=timedelta(hours=-1))
+        self.assertEqual("Parameter 'max_age' must be a positive duration.", str(e.exception))
+
+    # Tests for methods store() and load()
+
+    def test_load_no_entry(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+
+        # Act
+        data = cache.load(ticker="CL=F", period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS, interval="1h")
+
+        # Assert
+        self.assertIsNone(data)
+
+    def test_store_then_load_returns_same_data(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+
+        # Act
+        cache.store(ticker="CL=F", period="729d", interval=YfinanceInterval.ONE_HOUR, data=self.data)
+        data = cache.load(ticker="CL=F", period=YfinancePeriod.SEVEN_HUNDRED_TWENTY_NINE_DAYS, interval="1h")
+
+        # Assert
+        assert_frame_equal(left=self.data, right=data, check_freq=False)
+
+    def test_store_partitions_dataset_by_year(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+
+        # Act
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+
+        # Assert
+        self.assertIn("year=2023", os.listdir(os.path.join(self.cache_dir, "1h", "CL=F")))
+
+    def test_store_empty_data(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data.iloc[0:0])
+        self.assertEqual("Cannot cache an empty DataFrame.", str(e.exception))
+
+    def test_store_replaces_existing_entry(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+
+        # Act
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data.iloc[:3])
+        data = cache.load(ticker="CL=F", period="729d", interval="1h")
+
+        # Assert
+        assert_frame_equal(left=self.data.iloc[:3], right=data, check_freq=False)
+
+    def test_load_different_period(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+
+        # Act
+        data = cache.load(ticker="CL=F", period="60d", interval="1h")
+
+        # Assert
+        self.assertIsNone(data)
+
+    def test_load_expired_entry(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir, max_age=timedelta(0))
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+
+        # Act
+        data = cache.load(ticker="CL=F", period="729d", interval="1h")
+
+        # Assert
+        self.assertIsNone(data)
+        self.assertIsNotNone(cache.read(ticker="CL=F", interval="1h"))
+
+    # Tests for method invalidate()
+
+    def test_invalidate_single_ticker(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+        cache.store(ticker="GC=F", period="729d", interval="1h", data=self.data)
+
+        # Act
+        cache.invalidate(ticker="CL=F")
+
+        # Assert
+        self.assertIsNone(cache.load(ticker="CL=F", period="729d", interval="1h"))
+        self.assertIsNotNone(cache.load(ticker="GC=F", period="729d", interval="1h"))
+
+    def test_invalidate_interval(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+        cache.store(ticker="CL=F", period="729d", interval="1d", data=self.data)
+
+        # Act
+        cache.invalidate(interval=YfinanceInterval.ONE_HOUR)
+
+        # Assert
+        self.assertIsNone(cache.load(ticker="CL=F", period="729d", interval="1h"))
+        self.assertIsNotNone(cache.load(ticker="CL=F", period="729d", interval="1d"))
+
+    def test_invalidate_all(self):
+
+        # Arrange
+        cache = ParquetCache(cache_dir=self.cache_dir)
+        cache.store(ticker="CL=F", period="729d", interval="1h", data=self.data)
+        cache.store(ticker="GC=F", period="729d", interval="1d", data=self.data)
+
+        # Act
+        cache.invalidate()
+
+        # Assert
+        self.assertIsNone(cache.load(ticker="CL=F", period="729d", interval="1h"))
+        self.assertIsNone(cache.load(ticker="GC=F", period="729d", interval="1d"))
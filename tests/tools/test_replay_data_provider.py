@@ -0,0 +1,159 @@
+"""Tests for methods in file replay_data_provider.py."""
+
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from pandas.testing import assert_frame_equal
+
+from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval
+from src.tools.data_provider import get_data_provider, set_data_provider
+from src.tools.replay_data_provider import ReplayDataProvider
+from src.tools.yfinance_data_provider import YfinanceDataProvider
+
+
+class TestReplayDataProvider(TestCase):
+    """Test class for methods in class ReplayDataProvider."""
+
+    def setUp(self) -> None:
+        self.TEST_DATA_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/test_data"
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.snapshot_dir = self.temporary_directory.name
+        os.makedirs(f"{self.snapshot_dir}/1h")
+        with open(f"{self.TEST_DATA_DIR}/yf_download_hourly_multiple_tickers_output.pickle", "rb") as file:
+            self.data = pickle.load(file)
+        for ticker in ["EUR=X", "CL=F"]:
+            with open(f"{self.snapshot_dir}/1h/{ticker}.pickle", "wb") as file:
+                pickle.dump(self.data[ticker], file)
+
+    def tearDown(self) -> None:
+        set_data_provider(YfinanceDataProvider)
+        self.temporary_directory.cleanup()
+
+    # Tests for constructor
+
+    def test_constructor_snapshot_dir_does_not_exist(self):
+
+        # Arrange
+        snapshot_dir = f"{self.snapshot_dir}/missing"
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            ReplayDataProvider(snapshot_dir=snapshot_dir)
+        self.assertEqual(f"Snapshot directory '{snapshot_dir}' does not exist.", str(e.exception))
+
+    # Tests for method get_data()
+
+    def test_get_data_tickers_empty_list(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            data_provider.get_data(tickers=[], period="729d", interval="1h")
+        self.assertEqual("Parameter 'tickers' cannot be empty.", str(e.exception))
+
+    def test_get_data_missing_snapshot(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            data_provider.get_data(tickers=["GC=F"], period="729d", interval=YfinanceInterval.ONE_HOUR)
+        self.assertEqual("No snapshot for ticker 'GC=F' and interval '1h'.", str(e.exception))
+
+    def test_get_data_single_ticker(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+
+        # Act
+        data = data_provider.get_data(tickers="CL=F", period="729d", interval="1h")
+
+        # Assert
+        assert_frame_equal(left=self.data["CL=F"], right=data)
+
+    def test_get_data_multiple_tickers_group_by_ticker(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+
+        # Act
+        data = data_provider.get_data(
+            tickers=["EUR=X", "CL=F"], period="729d", interval="1h", group_by=YfinanceGroupBy.TICKER
+        )
+
+        # Assert
+        assert_frame_equal(left=self.data, right=data)
+
+    def test_get_data_period_counted_from_last_timestamp(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+
+        # Act
+        data = data_provider.get_data(tickers="CL=F", period="1d", interval="1h")
+
+        # Assert
+        self.assertTrue(data.index[0] >= data.index[-1].normalize())
+        self.assertEqual(self.data.index[-1], data.index[-1])
+
+    # Tests for method get_hourly_changes()
+
+    def test_get_hourly_changes_matches_yfinance_data_provider(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+        attributes = [PriceAttribute.CLOSE, PriceAttribute.HIGH]
+        tickers = ["EUR=X", "CL=F"]
+
+        # Act
+        changes_data = data_provider.get_hourly_changes(attributes=attributes, tickers=tickers)
+
+        # Assert
+        with patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data", return_value=self.data):
+            expected_changes_data = YfinanceDataProvider.get_hourly_changes(attributes=attributes, tickers=tickers)
+        assert_frame_equal(left=expected_changes_data, right=changes_data)
+
+    # Tests for method record_snapshot()
+
+    @patch("yfinance.download")
+    def test_record_snapshot_then_replay(self, mock_download_method):
+
+        # Arrange
+        mock_download_method.return_value = self.data
+        snapshot_dir = f"{self.snapshot_dir}/recorded"
+
+        # Act
+        ReplayDataProvider.record_snapshot(
+            tickers=["EUR=X", "CL=F"], period="729d", interval="1h", snapshot_dir=snapshot_dir
+        )
+        data = ReplayDataProvider(snapshot_dir=snapshot_dir).get_data(
+            tickers=["EUR=X", "CL=F"], period="729d", interval="1h", group_by="ticker"
+        )
+
+        # Assert
+        self.assertEqual({"CL=F.pickle", "EUR=X.pickle"}, set(os.listdir(f"{snapshot_dir}/1h")))
+        assert_frame_equal(left=self.data, right=data)
+
+    # Tests for global data provider selection
+
+    def test_set_data_provider(self):
+
+        # Arrange
+        data_provider = ReplayDataProvider(snapshot_dir=self.snapshot_dir)
+
+        # Act
+        set_data_provider(data_provider)
+
+        # Assert
+        self.assertIs(data_provider, get_data_provider())
+
+    def test_get_data_provider_default(self):
+
+        # Act / Assert
+        self.assertIs(YfinanceDataProvider, get_data_provider())
@@ -3,7 +3,10 @@
 from unittest import TestCase
 from unittest.mock import patch
 
-from src.tools.statistical_evaluation import ClassificationEvaluation
+import numpy as np
+from sklearn import metrics
+
+from src.tools.statistical_evaluation import BatchClassificationEvaluation, ClassificationEvaluation
 
 
 class TestClassificationEvaluation(TestCase):
@@ -117,6 +120,71 @@ class TestClassificationEvaluation(TestCase):
         self.assertEqual(evaluation.recall, 0.2)
         self.assertEqual(evaluation.f1_score, 0.13333333333333333)
 
+    def test_constructor_boolean_predictions_match_classification_report(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        y_true = list(rng.random(50) < 0.4)
+        y_predicted = list(rng.random(50) < 0.7)
+
+        # Act
+        evaluation = ClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Assert
+        classification_report = metrics.classification_report(
+            y_true=y_true, y_pred=y_predicted, output_dict=True, zero_division=0
+        )
+        self.assertEqual(classification_report["accuracy"], evaluation.accuracy)
+        self.assertEqual(classification_report["weighted avg"]["precision"], evaluation.precision)
+        self.assertEqual(classification_report["weighted avg"]["recall"], evaluation.recall)
+        self.assertEqual(classification_report["weighted avg"]["f1-score"], evaluation.f1_score)
+
+    def test_constructor_boolean_predictions_single_class(self):
+
+        # Arrange
+        y_true = [True, True, True]
+        y_predicted = [True, False, True]
+
+        # Act
+        evaluation = ClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Assert
+        self.assertAlmostEqual(2 / 3, evaluation.accuracy)
+        self.assertEqual(1.0, evaluation.precision)
+        self.assertAlmostEqual(2 / 3, evaluation.recall)
+        self.assertAlmostEqual(0.8, evaluation.f1_score)
+
+    @patch("sklearn.metrics.classification_report")
+    def test_classification_report_computed_lazily(self, mock_classification_report_method):
+
+        # Arrange
+        y_true = [True, False, True, False, True]
+        y_predicted = [False, False, False, True, False]
+        mock_classification_report_method.return_value = {"accuracy": 0.2}
+
+        # Act
+        evaluation = ClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Assert
+        mock_classification_report_method.assert_not_called()
+        self.assertEqual({"accuracy": 0.2}, evaluation.classification_report)
+        self.assertEqual({"accuracy": 0.2}, evaluation.classification_report)
+        mock_classification_report_method.assert_called_once()
+
+    def test_constructor_non_boolean_predictions_use_classification_report(self):
+
+        # Arrange
+        y_true = [1, 0, 1, 0, 1]
+        y_predicted = [0, 0, 0, 1, 0]
+
+        # Act
+        evaluation = ClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Assert
+        self.assertEqual(0.2, evaluation.accuracy)
+        self.assertEqual(0.1, evaluation.precision)
+        self.assertEqual(0.2, evaluation.recall)
+
     # Tests for method __str__()
 
     @patch("sklearn.metrics.classification_report")
@@ -139,3 +207,76 @@ class TestClassificationEvaluation(TestCase):
 
         # Assert
         self.assertEqual(str(evaluation), "Accuracy: 0.2\nPrecision: 0.1\nRecall: 0.2\nF1 Score: 0.13333333333333333")
+
+
+class TestBatchClassificationEvaluation(TestCase):
+    """Test class for methods in class BatchClassificationEvaluation."""
+
+    # Tests for constructor
+
+    def test_constructor_not_2d(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError) as e:
+            BatchClassificationEvaluation(y_true=[True, False], y_predicted=[True, True])
+        self.assertEqual(
+            "Parameters 'y_true' and 'y_predicted' must be non-empty 2-D arrays of same shape.", str(e.exception)
+        )
+
+    def test_constructor_different_shapes(self):
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            BatchClassificationEvaluation(y_true=np.ones((2, 3), dtype=bool), y_predicted=np.ones((2, 4), dtype=bool))
+
+    def test_constructor_scores_match_classification_evaluation(self):
+
+        # Arrange
+        rng = np.random.default_rng(0)
+        y_true = rng.random((20, 15)) < 0.5
+        y_predicted = rng.random((20, 15)) < 0.3
+        y_predicted[0] = False
+
+        # Act
+        batch_evaluation = BatchClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Assert
+        self.assertEqual(20, len(batch_evaluation))
+        for i in range(20):
+            evaluation = ClassificationEvaluation(y_true=list(y_true[i]), y_predicted=list(y_predicted[i]))
+            self.assertEqual(evaluation.accuracy, batch_evaluation.accuracy[i])
+            self.assertEqual(evaluation.precision, batch_evaluation.precision[i])
+            self.assertEqual(evaluation.recall, batch_evaluation.recall[i])
+            self.assertEqual(evaluation.f1_score, batch_evaluation.f1_score[i])
+
+    # Tests for method __getitem__()
+
+    def test_getitem(self):
+
+        # Arrange
+        y_true = np.array([[True, False, True, False], [True, True, False, False]])
+        y_predicted = np.array([[True, True, True, False], [False, True, False, True]])
+        batch_evaluation = BatchClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Act
+        evaluation = batch_evaluation[1]
+
+        # Assert
+        self.assertEqual([True, True, False, False], evaluation.y_true)
+        self.assertEqual(0.5, evaluation.accuracy)
+
+    # Tests for method __str__()
+
+    def test_str_overload(self):
+
+        # Arrange
+        y_true = np.array([[True, False], [True, False]])
+        y_predicted = np.array([[True, False], [False, True]])
+
+        # Act
+        batch_evaluation = BatchClassificationEvaluation(y_true=y_true, y_predicted=y_predicted)
+
+        # Assert
+        self.assertEqual(
+            "Mean accuracy: 0.5\nMean precision: 0.5\nMean recall: 0.5\nMean F1 Score: 0.5", str(batch_evaluation)
+        )
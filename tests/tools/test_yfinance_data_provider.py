@@ -2,13 +2,17 @@
 
 import os
 import pickle
+import tempfile
+from datetime import timedelta
 from unittest import TestCase
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
 from src.tools.constants import PriceAttribute, YfinanceGroupBy, YfinanceInterval, YfinancePeriod
+from src.tools.parquet_cache import ParquetCache
 from src.tools.yfinance_data_provider import YfinanceDataProvider
 
 
@@ -17,6 +21,11 @@ class TestYfinanceDataProvider(TestCase):
 
     def setUp(self) -> None:
         self.TEST_DATA_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/test_data"
+        self.temporary_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        YfinanceDataProvider.cache = None
+        self.temporary_directory.cleanup()
 
     def mock_download_side_effect(self, **kwargs):
         self.parameters = kwargs
@@ -40,6 +49,17 @@ class TestYfinanceDataProvider(TestCase):
             self.yf_download_output = pickle.load(file)
         return self.yf_download_output
 
+    def mock_download_hourly_side_effect(self, **kwargs):
+        self.parameters = kwargs
+        tickers = kwargs["tickers"]
+        if isinstance(tickers, list) and len(tickers) > 1:
+            output_pickled_file_name = "yf_download_hourly_multiple_tickers_output.pickle"
+        else:
+            output_pickled_file_name = "yf_download_hourly_single_ticker_output.pickle"
+        with open(f"{self.TEST_DATA_DIR}/{output_pickled_file_name}", "rb") as file:
+            self.yf_download_output = pickle.load(file)
+        return self.yf_download_output
+
     # Tests for method get_data()
 
     @patch("yfinance.download")
@@ -289,6 +309,104 @@ class TestYfinanceDataProvider(TestCase):
         self.assertEqual(expected_parameters, self.parameters)
         self.assertTrue(self.yf_download_output.equals(data))
 
+    @patch("yfinance.download")
+    def test_get_data_with_cache_downloads_then_serves_from_cache(self, mock_download_method):
+
+        # Arrange
+        mock_download_method.side_effect = self.mock_download_hourly_side_effect
+        YfinanceDataProvider.cache = ParquetCache(cache_dir=self.temporary_directory.name)
+        tickers = ["EUR=X", "CL=F"]
+
+        # Act
+        first_data = YfinanceDataProvider.get_data(
+            tickers=tickers, period="729d", interval=YfinanceInterval.ONE_HOUR, group_by=YfinanceGroupBy.TICKER
+        )
+        second_data = YfinanceDataProvider.get_data(
+            tickers=tickers, period="729d", interval=YfinanceInterval.ONE_HOUR, group_by=YfinanceGroupBy.TICKER
+        )
+
+        # Assert
+        self.assertEqual(1, mock_download_method.call_count)
+        expected_parameters = {
+            "tickers": ["EUR=X", "CL=F"],
+            "period": "729d",
+            "interval": "1h",
+            "group_by": "ticker",
+            "ignore_tz": False,
+            "progress": False,
+        }
+        self.assertEqual(expected_parameters, self.parameters)
+        assert_frame_equal(left=first_data, right=second_data, check_freq=False)
+        self.assertEqual({"EUR=X", "CL=F"}, set(second_data.columns.get_level_values(0)))
+
+    @patch("yfinance.download")
+    def test_get_data_with_cache_downloads_only_missing_tickers(self, mock_download_method):
+
+        # Arrange
+        mock_download_method.side_effect = self.mock_download_hourly_side_effect
+        YfinanceDataProvider.cache = ParquetCache(cache_dir=self.temporary_directory.name)
+        YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+
+        # Act
+        data = YfinanceDataProvider.get_data(tickers=["CL=F", "EUR=X"], period="729d", interval="1h")
+
+        # Assert
+        self.assertEqual(2, mock_download_method.call_count)
+        self.assertEqual(["EUR=X"], self.parameters["tickers"])
+        self.assertEqual({"CL=F", "EUR=X"}, set(data.columns.get_level_values(1)))
+        self.assertEqual("Adj Close", data.columns[0][0])
+
+    @patch("yfinance.download")
+    def test_get_data_with_cache_single_ticker(self, mock_download_method):
+
+        # Arrange
+        mock_download_method.side_effect = self.mock_download_hourly_side_effect
+        YfinanceDataProvider.cache = ParquetCache(cache_dir=self.temporary_directory.name)
+
+        # Act
+        YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+        data = YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+
+        # Assert
+        self.assertEqual(1, mock_download_method.call_count)
+        assert_frame_equal(left=self.yf_download_output, right=data, check_freq=False)
+
+    @patch("yfinance.download")
+    def test_get_data_with_stale_cache_downloads_only_new_bars(self, mock_download_method):
+
+        # Arrange
+        mock_download_method.side_effect = self.mock_download_hourly_side_effect
+        YfinanceDataProvider.cache = ParquetCache(cache_dir=self.temporary_directory.name, max_age=timedelta(0))
+        first_data = YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+
+        # Act
+        data = YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+
+        # Assert
+        self.assertEqual(2, mock_download_method.call_count)
+        self.assertNotIn("period", self.parameters)
+        self.assertEqual(first_data.index[-1], self.parameters["start"])
+        assert_frame_equal(left=first_data, right=data, check_freq=False)
+
+    @patch("yfinance.download")
+    def test_get_data_with_stale_cache_and_empty_download_keeps_fetched_at(self, mock_download_method):
+
+        # Arrange
+        mock_download_method.side_effect = self.mock_download_hourly_side_effect
+        YfinanceDataProvider.cache = ParquetCache(cache_dir=self.temporary_directory.name, max_age=timedelta(0))
+        first_data = YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+        fetched_at = YfinanceDataProvider.cache.get_info(ticker="CL=F", interval="1h")["fetched_at"]
+        mock_download_method.side_effect = None
+        mock_download_method.return_value = pd.DataFrame()
+
+        # Act
+        data = YfinanceDataProvider.get_data(tickers="CL=F", period="729d", interval="1h")
+
+        # Assert
+        self.assertEqual(2, mock_download_method.call_count)
+        self.assertEqual(fetched_at, YfinanceDataProvider.cache.get_info(ticker="CL=F", interval="1h")["fetched_at"])
+        assert_frame_equal(left=first_data, right=data, check_freq=False)
+
     # Tests for method get_hourly_changes()
 
     @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
@@ -511,6 +629,22 @@ class TestYfinanceDataProvider(TestCase):
         )
         assert_frame_equal(left=expected_changes_data, right=changes_data)
 
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_get_hourly_changes_float32(self, mock_get_data_method):
+
+        # Arrange
+        mock_get_data_method.side_effect = self.mock_download_side_effect
+        attributes = [PriceAttribute.CLOSE, PriceAttribute.LOW]
+        tickers = ["CL=F", "EUR=X"]
+
+        # Act
+        changes_data = YfinanceDataProvider.get_hourly_changes(attributes=attributes, tickers=tickers, dtype=np.float32)
+
+        # Assert
+        expected_changes_data = YfinanceDataProvider.get_hourly_changes(attributes=attributes, tickers=tickers)
+        self.assertEqual({np.dtype(np.float32)}, set(changes_data.dtypes))
+        assert_frame_equal(left=expected_changes_data.astype(np.float32), right=changes_data)
+
     @patch("yfinance.download")
     def test_get_hourly_changes_tickers_empty_list(self, mock_download_method):
 
@@ -705,3 +839,27 @@ class TestYfinanceDataProvider(TestCase):
         with self.assertRaises(ValueError) as e:
             YfinanceDataProvider.get_hourly_changes(attributes=attributes, tickers=tickers)
         self.assertEqual("Cannot extract changes for price attributes 'Open' or 'Volume'.", str(e.exception))
+
+    # Tests for method get_changes()
+
+    @patch("src.tools.yfinance_data_provider.YfinanceDataProvider.get_data")
+    def test_get_changes_daily_interval(self, mock_get_data_method):
+
+        # Arrange
+        mock_get_data_method.side_effect = self.mock_download_side_effect
+
+        # Act
+        changes_data = YfinanceDataProvider.get_changes(
+            attributes=[PriceAttribute.CLOSE], tickers=["CL=F"], period="5d", interval=YfinanceInterval.ONE_DAY
+        )
+
+        # Assert
+        expected_parameters = {
+            "tickers": ["CL=F"],
+            "period": "5d",
+            "interval": YfinanceInterval.ONE_DAY,
+            "group_by": YfinanceGroupBy.TICKER,
+        }
+        self.assertEqual(expected_parameters, self.parameters)
+        self.assertEqual([("CL=F", "Close")], list(changes_data.columns))
+        self.assertFalse(changes_data.empty)